@@ -0,0 +1,141 @@
+"""
+Admission Control
+Bounds the geometry work a worker process takes on at once. Each request's
+cost is its estimated vertex count, known from the body before any geometry
+is built:
+  * cheap      at most CHEAP_VERTICES; admitted at once and never queued
+               behind expensive requests
+  * expensive  holds its vertex count on a weighted semaphore of
+               CAPACITY_VERTICES (a single request larger than that runs
+               alone), waiting in arrival order for at most QUEUE_TIMEOUT_S
+  * shed       still waiting at the deadline; refused with Overloaded, which
+               the routes answer with 429 and Retry-After
+"""
+
+import collections
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+CAPACITY_VERTICES = int(os.environ.get("ADMISSION_CAPACITY_VERTICES", 200_000))
+CHEAP_VERTICES = int(os.environ.get("ADMISSION_CHEAP_VERTICES", 5_000))
+QUEUE_TIMEOUT_S = float(os.environ.get("ADMISSION_QUEUE_TIMEOUT_S", 2.0))
+
+
+class Overloaded(RuntimeError):
+    """
+    A request shed by admission control; `retry_after` is in seconds.
+    """
+
+    def __init__(self, message, retry_after):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class WeightedSemaphore:
+    """
+    Semaphore over `capacity` units where each holder takes a weight of them.
+    Waiters are served in arrival order, so a heavy waiter at the head is not
+    overtaken indefinitely by lighter ones.
+    """
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.in_use = 0
+        self._waiters = collections.deque()
+        self._cond = threading.Condition()
+
+    def waiting(self):
+        with self._cond:
+            return len(self._waiters)
+
+    def acquire(self, weight, timeout):
+        """
+        Takes `weight` units, waiting at most `timeout` seconds. Returns
+        False if they did not free up in time.
+        """
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            if not self._waiters and self.in_use + weight <= self.capacity:
+                self.in_use += weight
+                return True
+            turn = object()
+            self._waiters.append(turn)
+            try:
+                while self._waiters[0] is not turn or self.in_use + weight > self.capacity:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return False
+                    self._cond.wait(remaining)
+                self.in_use += weight
+                return True
+            finally:
+                # Leaving the queue either way may let the next waiter in
+                self._waiters.remove(turn)
+                self._cond.notify_all()
+
+    def release(self, weight):
+        with self._cond:
+            self.in_use -= weight
+            self._cond.notify_all()
+
+
+class AdmissionController:
+    """
+    Admits requests by estimated vertex count; see the module docstring.
+    """
+
+    def __init__(self, capacity=CAPACITY_VERTICES, cheap=CHEAP_VERTICES, queue_timeout=QUEUE_TIMEOUT_S):
+        self.cheap = cheap
+        self.queue_timeout = queue_timeout
+        self.semaphore = WeightedSemaphore(capacity)
+        self._lock = threading.Lock()
+        self._counts = {"cheap": 0, "admitted": 0, "queued": 0, "shed": 0, "wait_s": 0.0}
+
+    def _count(self, key, value=1):
+        with self._lock:
+            self._counts[key] += value
+
+    @contextmanager
+    def admit(self, vertices):
+        """
+        Context for running one request of `vertices` estimated vertices.
+        Raises Overloaded when it cannot start within the queue timeout.
+        """
+        if vertices <= self.cheap:
+            self._count("cheap")
+            yield
+            return
+
+        weight = min(vertices, self.semaphore.capacity)
+        start = time.monotonic()
+        if not self.semaphore.acquire(weight, self.queue_timeout):
+            self._count("shed")
+            raise Overloaded(
+                f"Server busy with large geometries; retry in {math.ceil(self.queue_timeout)} s",
+                retry_after=math.ceil(self.queue_timeout),
+            )
+        waited = time.monotonic() - start
+        with self._lock:
+            self._counts["admitted"] += 1
+            self._counts["wait_s"] += waited
+            self._counts["queued"] += waited > 0.001
+        try:
+            yield
+        finally:
+            self.semaphore.release(weight)
+
+    def stats(self):
+        """
+        Request counts by outcome, mean queue wait and current load.
+        """
+        with self._lock:
+            counts = dict(self._counts)
+        wait_s = counts.pop("wait_s")
+        counts["mean_wait_ms"] = round(wait_s / counts["admitted"] * 1000, 1) if counts["admitted"] else 0.0
+        counts["vertices_in_flight"] = self.semaphore.in_use
+        counts["capacity_vertices"] = self.semaphore.capacity
+        counts["waiting"] = self.semaphore.waiting()
+        return counts
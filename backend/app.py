@@ -1,46 +1,105 @@
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify
 from flask_cors import CORS
-from shapely.geometry import shape
-from shapely.ops import transform
-import pyproj
+import shapely
 import random
 import os
-from compliance import legal_risk_classifier, smart_recommendation_engine
+from functools import wraps
+from datetime import datetime
+from policy import get_engine, summarize
+from store import get_store
+from export import iter_arrow_ipc, iter_csv, iter_geoparquet
+from heatmap_tiles import MAX_ZOOM, get_heatmap_tiles, parse_row_ranges
+from registry import get_registry
+from boundary_compare import compare
+from areas import areas_m2
+from admission import AdmissionController, Overloaded
+from compression import DecompressRequests, compress_response
+from payloads import PayloadError, estimate_vertices, read_boundary, read_comparison, read_survey
+from singleflight import SingleFlight, request_key
 
 app = Flask(__name__)
 CORS(app)
 
+app.wsgi_app = DecompressRequests(app.wsgi_app)
+app.after_request(compress_response)
+
 
 # ==============================
-# Utility: Area Calculation
+# Analysis Steps
 # ==============================
 
-def calculate_area_in_meters(geojson):
-    try:
-        geom = shape(geojson)
-
-        # Auto-detect correct UTM zone
-        utm_crs = pyproj.database.query_utm_crs_info(
-            datum_name="WGS 84",
-            area_of_interest=pyproj.aoi.AreaOfInterest(
-                west_lon_degree=geom.bounds[0],
-                south_lat_degree=geom.bounds[1],
-                east_lon_degree=geom.bounds[2],
-                north_lat_degree=geom.bounds[3],
-            ),
-        )[0].code
-
-        project = pyproj.Transformer.from_crs(
-            "EPSG:4326",
-            pyproj.CRS.from_user_input(utm_crs),
-            always_xy=True,
-        ).transform
-
-        projected = transform(project, geom)
-        return projected.area
+def estimate_builtup(total_area):
+    """
+    Built-up estimate for a plot of `total_area` m² (simulated).
+    """
+    built_area = total_area * random.uniform(0.4, 0.9)
+    return {
+        "total_area_m2": round(total_area, 2),
+        "built_up_area_m2": round(built_area, 2)
+    }
+
+
+def find_encroachment(boundary, plot_id=None):
+    """
+    Parts of a boundary geometry that overlap neighbouring allotted plots,
+    roads or government land in the registry. `plot_id` is the boundary's
+    own registry id, which is not counted against it.
+    """
+    overlaps, encroachment = get_registry().overlaps(boundary, exclude_id=plot_id)
+    return {
+        "encroachment_detected": bool(overlaps),
+        "encroachment_geojson": encroachment.__geo_interface__,
+        "encroachment_area_m2": round(sum(o["overlap_area_m2"] for o in overlaps), 2),
+        "overlaps": overlaps
+    }
+
+
+def score_plot(total_area, built_area, encroachment, unused_percentage=0, policy_name=None):
+    """
+    Compliance score and recommendation for one plot under a policy.
+    Raises KeyError for an unknown policy.
+    """
+    built_percentage = (built_area / total_area) * 100
+
+    policy = get_engine().get(policy_name)
+    scored = policy.score([built_percentage], [bool(encroachment)], [unused_percentage])
+    return {
+        "compliance_score": int(scored["compliance_score"][0]),
+        "built_percentage": round(built_percentage, 2),
+        "unused_percentage": round(unused_percentage, 2),
+        "severity": str(scored["severity"][0]),
+        "risk_score": int(scored["risk_score"][0]),
+        "recommended_action": str(scored["recommended_action"][0]),
+        "urgency": str(scored["urgency"][0]),
+        "policy": policy.name
+    }
 
-    except Exception as e:
-        return None
+
+# ==============================
+# Admission Control
+# ==============================
+
+admission = AdmissionController()
+
+
+def admitted(view):
+    """
+    Runs a geometry route under admission control, weighted by the vertex
+    count estimated from its body. Bodies over the vertex limit get 413 at
+    once, without queueing; shed requests get 429 with Retry-After.
+    """
+    @wraps(view)
+    def admitted_view(*args, **kwargs):
+        try:
+            vertices = estimate_vertices(request.get_data(), request.mimetype)
+        except PayloadError as e:
+            return jsonify({"error": str(e)}), e.status
+        try:
+            with admission.admit(vertices):
+                return view(*args, **kwargs)
+        except Overloaded as e:
+            return jsonify({"error": str(e)}), 429, {"Retry-After": str(e.retry_after)}
+    return admitted_view
 
 
 # ==============================
@@ -53,47 +112,27 @@ def home():
 
 
 @app.route("/detect-builtup", methods=["POST"])
+@admitted
 def detect_builtup():
     try:
-        data = request.json
-        if not data or "boundary" not in data:
-            return jsonify({"error": "Missing boundary GeoJSON"}), 400
-
-        boundary = data["boundary"]
-        total_area = calculate_area_in_meters(boundary)
-
-        if total_area is None:
-            return jsonify({"error": "Invalid GeoJSON"}), 400
-
-        built_area = total_area * random.uniform(0.4, 0.9)
-
-        return jsonify({
-            "total_area_m2": round(total_area, 2),
-            "built_up_area_m2": round(built_area, 2)
-        })
+        _, boundary = read_boundary(request.get_data(), request.mimetype, request.args)
+        return jsonify(estimate_builtup(float(areas_m2([boundary])[0])))
 
+    except PayloadError as e:
+        return jsonify({"error": str(e)}), e.status
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 
 @app.route("/detect-encroachment", methods=["POST"])
+@admitted
 def detect_encroachment():
     try:
-        data = request.json
-        if not data or "boundary" not in data:
-            return jsonify({"error": "Missing boundary GeoJSON"}), 400
-
-        boundary = shape(data["boundary"])
-
-        # Simulated encroachment
-        encroach = boundary.buffer(0.0002)
-        violation_area = encroach.difference(boundary)
-
-        return jsonify({
-            "encroachment_detected": not violation_area.is_empty,
-            "encroachment_geojson": violation_area.__geo_interface__
-        })
+        data, boundary = read_boundary(request.get_data(), request.mimetype, request.args)
+        return jsonify(find_encroachment(boundary, data.plot_id))
 
+    except PayloadError as e:
+        return jsonify({"error": str(e)}), e.status
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -107,110 +146,242 @@ def compliance_score():
         if not all(field in data for field in required_fields):
             return jsonify({"error": "Missing required fields"}), 400
 
-        total_area = data["total_area_m2"]
-        built_area = data["built_up_area_m2"]
-        encroachment = data["encroachment"]
-        unused_percentage = data.get("unused_percentage", 0)
+        if data["total_area_m2"] == 0:
+            return jsonify({"error": "Total area cannot be zero"}), 400
 
+        return jsonify(score_plot(
+            data["total_area_m2"],
+            data["built_up_area_m2"],
+            data["encroachment"],
+            data.get("unused_percentage", 0),
+            data.get("policy"),
+        ))
+
+    except KeyError as e:
+        return jsonify({"error": e.args[0]}), 400
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@app.route("/analyze", methods=["POST"])
+@admitted
+def analyze():
+    """
+    Built-up estimate, encroachment and compliance score for one boundary in
+    a single call. The boundary is parsed and measured once and shared by
+    every step.
+    """
+    try:
+        data, boundary = read_boundary(request.get_data(), request.mimetype, request.args)
+        total_area = float(areas_m2([boundary])[0])
         if total_area == 0:
             return jsonify({"error": "Total area cannot be zero"}), 400
 
-        built_percentage = (built_area / total_area) * 100
-
-        severity, risk_score = legal_risk_classifier(built_percentage)
-        action, urgency = smart_recommendation_engine(severity, risk_score)
-
-        # --- Enhanced Risk Score (0-100) ---
-        score = 100
-        if encroachment:
-            score -= 40
-        if unused_percentage > 20:
-            score -= 30
-        if 0 < unused_percentage <= 20 or (built_percentage > 70 and built_percentage <= 85):
-            score -= 10  # minor deviation
-
-        score = max(score, 0)
-
-        return jsonify({
-            "compliance_score": score,
-            "built_percentage": round(built_percentage, 2),
-            "unused_percentage": round(unused_percentage, 2),
-            "severity": severity,
-            "risk_score": risk_score,
-            "recommended_action": action,
-            "urgency": urgency
-        })
+        builtup = estimate_builtup(total_area)
+        encroachment = find_encroachment(boundary, data.plot_id)
+        score = score_plot(
+            total_area,
+            builtup["built_up_area_m2"],
+            encroachment["encroachment_detected"],
+            data.unused_percentage,
+            data.policy,
+        )
+        return jsonify({**builtup, **encroachment, **score})
+
+    except PayloadError as e:
+        return jsonify({"error": str(e)}), e.status
+    except KeyError as e:
+        return jsonify({"error": e.args[0]}), 400
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@app.route("/policies", methods=["GET"])
+def list_policies():
+    engine = get_engine()
+    return jsonify({
+        "active": engine.get().name,
+        "policies": [
+            {"name": name, "description": engine.get(name).description}
+            for name in engine.names()
+        ]
+    })
+
 
+@app.route("/policies/what-if", methods=["POST"])
+def policy_what_if():
+    try:
+        data = request.json
+        if not data or "plots" not in data:
+            return jsonify({"error": "Missing plots"}), 400
+
+        engine = get_engine()
+        names = data.get("policies") or engine.names()
+        plots = data["plots"]
+        if "unused_pct" not in plots:
+            return jsonify({"error": "Missing plots.unused_pct"}), 400
+        unused = plots["unused_pct"]
+        n = len(unused) if isinstance(unused, list) else 0
+        built = plots.get("built_pct", [float("nan")] * n)
+        encroached = plots.get("encroached", [0] * n)
+        columns = (built, encroached, unused)
+        if not all(isinstance(c, list) for c in columns) or len({len(c) for c in columns}) != 1:
+            return jsonify({"error": "plots.built_pct, encroached and unused_pct must be arrays of the same length"}), 400
+
+        results = engine.compare(names, built, encroached, unused)
+
+        response = {}
+        for name, result in results.items():
+            response[name] = summarize(result)
+            if data.get("include_scores"):
+                response[name]["compliance_scores"] = result["compliance_score"].tolist()
+        return jsonify(response)
+
+    except KeyError as e:
+        return jsonify({"error": e.args[0]}), 400
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 
+# Concurrent identical comparisons (officers opening the same plot, repeated
+# dashboard posts) share one computation, keyed by the decoded request
+compare_flight = SingleFlight()
+
+
 @app.route("/compare-boundaries", methods=["POST"])
+@admitted
 def compare_boundaries():
     try:
-        data = request.json
+        data, reference, current = read_comparison(request.get_data(), request.mimetype, request.args)
 
-        reference = shape(data["reference"])
-        current = shape(data["current"])
-        tolerance_m2 = data.get("tolerance_m2", 25)
-
-        # Fix invalid geometries (self-intersecting polygons from map drawing)
-        if not reference.is_valid:
-            reference = reference.buffer(0)
-        if not current.is_valid:
-            current = current.buffer(0)
-
-        def project_to_meters(geom):
-            project = pyproj.Transformer.from_crs(
-                "EPSG:4326",
-                "EPSG:32644",  # UTM Zone for Chhattisgarh
-                always_xy=True,
-            ).transform
-            return transform(project, geom)
-
-        encroachment = current.difference(reference)
-        unused = reference.difference(current)
-        overlap = reference.intersection(current)
-
-        # Project for area calculation
-        enc_proj = project_to_meters(encroachment)
-        unused_proj = project_to_meters(unused)
-        overlap_proj = project_to_meters(overlap)
-        ref_proj = project_to_meters(reference)
-
-        enc_area = enc_proj.area
-        unused_area = unused_proj.area
-        total_ref_area = ref_proj.area
-
-        # Tolerance threshold
-        tolerance_applied = False
-        if enc_area < tolerance_m2:
-            enc_area = 0
-            tolerance_applied = True
-        if unused_area < tolerance_m2:
-            unused_area = 0
-            tolerance_applied = True
-
-        # Unused percentage
-        unused_percentage = (unused_area / total_ref_area * 100) if total_ref_area > 0 else 0
-
-        return jsonify({
-            "encroachment_geojson": encroachment.__geo_interface__,
-            "unused_geojson": unused.__geo_interface__,
-            "overlap_geojson": overlap.__geo_interface__,
-            "encroachment_area": round(enc_area, 2),
-            "unused_area": round(unused_area, 2),
-            "overlap_area": round(overlap_proj.area, 2),
-            "total_reference_area": round(total_ref_area, 2),
-            "unused_percentage": round(unused_percentage, 2),
-            "tolerance_m2": tolerance_m2,
-            "tolerance_applied": tolerance_applied
-        })
+        # The encoded body is shared, so duplicates skip JSON encoding as well
+        key = request_key(*shapely.to_wkb([reference, current]), data.tolerance_m2)
+        body = compare_flight.do(key, lambda: jsonify(compare(reference, current, data.tolerance_m2)).get_data())
+        return app.response_class(body, mimetype=app.json.mimetype)
 
+    except PayloadError as e:
+        return jsonify({"error": str(e)}), e.status
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 
+# ==============================
+# Registry Overlap Sweeps
+# ==============================
+
+@app.route("/registry/overlaps", methods=["GET"])
+def registry_overlaps():
+    """
+    Every pair of overlapping registry parcels, optionally within one
+    `industrial_area`.
+    """
+    try:
+        overlaps = get_registry().sweep(request.args.get("industrial_area"))
+        return jsonify({"overlap_count": len(overlaps), "overlaps": overlaps})
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@app.route("/registry/overlaps", methods=["POST"])
+@admitted
+def survey_overlaps():
+    """
+    Overlaps among surveyed boundaries ({"boundaries": [{"id", "geometry"}]},
+    `id` being the plot's registry id, or a WKB / FlatGeobuf batch) and
+    between each boundary and registry parcels other than its own.
+    """
+    try:
+        ids, boundaries = read_survey(request.get_data(), request.mimetype, request.args)
+
+        overlaps = get_registry().sweep_boundaries(ids, boundaries)
+        return jsonify({"overlap_count": len(overlaps), "overlaps": overlaps})
+
+    except PayloadError as e:
+        return jsonify({"error": str(e)}), e.status
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
+# ==============================
+# Inspection Exports
+# ==============================
+
+def export_filters():
+    """
+    District, status and inclusive YYYY-MM-DD date range from the query string.
+    """
+    filters = {key: request.args.get(key) for key in ("district", "status", "start", "end")}
+    for key in ("start", "end"):
+        if filters[key]:
+            datetime.strptime(filters[key], "%Y-%m-%d")
+    return filters
+
+
+def export_response(chunks, mimetype, filename):
+    try:
+        filters = export_filters()
+    except ValueError:
+        return jsonify({"error": "Dates must be YYYY-MM-DD"}), 400
+    return Response(
+        chunks(get_store(), **filters),
+        mimetype=mimetype,
+        headers={"Content-Disposition": f"attachment; filename={filename}"},
+    )
+
+
+@app.route("/export/inspections.csv", methods=["GET"])
+def export_csv():
+    return export_response(iter_csv, "text/csv", "inspection_history.csv")
+
+
+@app.route("/export/inspections.parquet", methods=["GET"])
+def export_geoparquet():
+    return export_response(iter_geoparquet, "application/vnd.apache.parquet", "inspection_history.parquet")
+
+
+@app.route("/export/inspections.arrow", methods=["GET"])
+def export_arrow():
+    return export_response(iter_arrow_ipc, "application/vnd.apache.arrow.file", "inspection_history.arrow")
+
+
+# ==============================
+# Heatmap Tiles
+# ==============================
+
+@app.route("/tiles/heatmap/<int:z>/<int:x>/<int:y>.png", methods=["GET"])
+def heatmap_tile(z, x, y):
+    """
+    One heatmap tile; `rows` ("1-20,57") limits it to those store row ids.
+    """
+    if z > MAX_ZOOM or x >= 2 ** z or y >= 2 ** z:
+        return jsonify({"error": f"No tile {z}/{x}/{y}"}), 404
+    try:
+        rows = parse_row_ranges(request.args["rows"]) if request.args.get("rows") else None
+    except ValueError as e:
+        return jsonify({"error": f"Invalid rows: {e}"}), 400
+    try:
+        tiles = get_heatmap_tiles()
+        png = tiles.render(z, x, y, rows)
+        return Response(png, mimetype="image/png", headers={
+            "Cache-Control": "public, max-age=60",
+            "ETag": f'"{tiles.version}-{z}-{x}-{y}"',
+        })
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
+# ==============================
+# Service Stats
+# ==============================
+
+@app.route("/stats", methods=["GET"])
+def service_stats():
+    """
+    Request coalescing and admission counters of this worker process.
+    """
+    return jsonify({"compare_coalescing": compare_flight.stats(), "admission": admission.stats()})
+
+
 # ==============================
 # Run Server
 # ==============================
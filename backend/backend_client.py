@@ -0,0 +1,237 @@
+"""
+Backend Client
+Shared HTTP client the dashboard uses to call the Flask backend. One pooled
+keep-alive session serves every page and session. Calls have bounded
+timeouts and are retried with jittered backoff (or after the server's
+Retry-After when it sheds load with 429), and a circuit breaker fails fast
+while the backend is down. Large JSON bodies are gzip-compressed, and
+per-endpoint latency is recorded for the dashboard.
+"""
+
+import gzip
+import json
+import random
+import threading
+import time
+from collections import deque
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# (connect, read) seconds
+TIMEOUT = (3.05, 30)
+POOL_SIZE = 16
+
+# Retries after the first attempt; the nth sleeps up to BACKOFF * 2**n (full jitter)
+RETRIES = 2
+BACKOFF = 0.25
+RETRY_STATUS = {429, 502, 503, 504}
+# Longest Retry-After (seconds) honoured before a retry; longer ones are capped
+RETRY_AFTER_MAX_S = 5
+
+# Consecutive failures that open the breaker, and how long it stays open
+BREAKER_FAILURES = 5
+BREAKER_RESET_S = 30
+
+# Bodies at least this large are sent gzip-compressed
+GZIP_MIN_BYTES = 16 * 1024
+
+# Latency samples kept per endpoint
+LATENCY_WINDOW = 200
+
+
+class BackendUnavailable(RuntimeError):
+    pass
+
+
+class BackendError(RuntimeError):
+    """
+    The backend answered, but with an error status or a body that is not
+    JSON; `status` is the HTTP status code.
+    """
+
+    def __init__(self, message, status):
+        super().__init__(message)
+        self.status = status
+
+
+class CircuitBreaker:
+    """
+    Opens after BREAKER_FAILURES consecutive failures. Once BREAKER_RESET_S
+    has passed it lets one trial call through (half-open), which closes it on
+    success or reopens it on failure.
+    """
+
+    def __init__(self, failures=BREAKER_FAILURES, reset_s=BREAKER_RESET_S):
+        self.failures = failures
+        self.reset_s = reset_s
+        self._count = 0
+        self._opened_at = None
+        self._trial = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        if self._opened_at is None:
+            return "closed"
+        if self._trial or time.monotonic() - self._opened_at >= self.reset_s:
+            return "half-open"
+        return "open"
+
+    def allow(self):
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if self._trial or time.monotonic() - self._opened_at < self.reset_s:
+                return False
+            self._trial = True
+            return True
+
+    def success(self):
+        with self._lock:
+            self._count = 0
+            self._opened_at = None
+            self._trial = False
+
+    def failure(self):
+        with self._lock:
+            self._count += 1
+            if self._trial or self._count >= self.failures:
+                self._opened_at = time.monotonic()
+            self._trial = False
+
+
+class BackendClient:
+    """
+    Thread-safe JSON client for one backend base URL.
+    """
+
+    def __init__(self, base_url, timeout=TIMEOUT, retries=RETRIES):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.retries = retries
+        self.breaker = CircuitBreaker()
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE, max_retries=0)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers["Accept-Encoding"] = "gzip"
+        self._latency = {}
+        self._counts = {"requests": 0, "errors": 0, "retries": 0, "rejected": 0, "shed": 0,
+                        "bytes_sent": 0, "bytes_raw": 0}
+        self._lock = threading.Lock()
+
+    def post_json(self, path, payload):
+        """
+        POSTs `payload` as JSON and returns the decoded response body. Raises
+        BackendUnavailable when the backend cannot be reached in time or the
+        breaker is open, and BackendError for an error status or a non-JSON
+        body.
+        """
+        body = json.dumps(payload, separators=(",", ":")).encode()
+        headers = {"Content-Type": "application/json"}
+        raw_size = len(body)
+        if raw_size >= GZIP_MIN_BYTES:
+            body = gzip.compress(body, compresslevel=5)
+            headers["Content-Encoding"] = "gzip"
+        response = self._request("POST", path, data=body, headers=headers, raw_size=raw_size)
+        try:
+            response.raise_for_status()
+            return response.json()
+        except requests.HTTPError:
+            raise BackendError(self._error_message(response), response.status_code) from None
+        except ValueError:
+            raise BackendError(f"Backend sent a non-JSON response to {path}", response.status_code) from None
+
+    @staticmethod
+    def _error_message(response):
+        """
+        The routes' {"error": ...} message, or the text of a plain-text error
+        body (the request middleware answers 400/413/415 in plain text).
+        """
+        try:
+            return str(response.json()["error"])
+        except (ValueError, KeyError, TypeError):
+            return response.text.strip()[:200] or f"HTTP {response.status_code}"
+
+    def _request(self, method, path, raw_size=0, **kwargs):
+        if not self.breaker.allow():
+            self._count("rejected")
+            raise BackendUnavailable(f"Backend circuit open; retrying in up to {self.breaker.reset_s}s")
+
+        sent = len(kwargs.get("data") or b"")
+        retry_after = None
+        for attempt in range(self.retries + 1):
+            if attempt:
+                self._count("retries")
+                time.sleep(retry_after if retry_after is not None else random.uniform(0, BACKOFF * 2 ** attempt))
+                retry_after = None
+            start = time.perf_counter()
+            try:
+                response = self.session.request(method, self.base_url + path, timeout=self.timeout, **kwargs)
+            except requests.RequestException as e:
+                error = type(e).__name__
+                continue
+            finally:
+                self._record(path, time.perf_counter() - start, sent, raw_size)
+            if response.status_code == 429 and attempt == self.retries:
+                # Shed by admission control: backpressure from a live backend, so
+                # it settles the breaker (ending a half-open trial) as a success
+                # and the caller gets the 429
+                self._count("shed")
+                self.breaker.success()
+                return response
+            if response.status_code in RETRY_STATUS:
+                error = f"HTTP {response.status_code}"
+                retry_after = self._retry_after(response)
+                continue
+            self.breaker.success()
+            return response
+
+        self._count("errors")
+        self.breaker.failure()
+        raise BackendUnavailable(f"Backend unavailable: {error}")
+
+    @staticmethod
+    def _retry_after(response):
+        """
+        Seconds from a Retry-After header in delay form, capped at
+        RETRY_AFTER_MAX_S, or None.
+        """
+        try:
+            return min(float(response.headers["Retry-After"]), RETRY_AFTER_MAX_S)
+        except (KeyError, ValueError):
+            return None
+
+    def _count(self, name, n=1):
+        with self._lock:
+            self._counts[name] += n
+
+    def _record(self, path, seconds, sent, raw_size):
+        with self._lock:
+            self._latency.setdefault(path, deque(maxlen=LATENCY_WINDOW)).append(seconds * 1000)
+            self._counts["requests"] += 1
+            self._counts["bytes_sent"] += sent
+            self._counts["bytes_raw"] += raw_size
+
+    def stats(self):
+        """
+        Request counters, breaker state and per-endpoint latency percentiles
+        (ms) over the last LATENCY_WINDOW calls.
+        """
+        import numpy as np
+
+        with self._lock:
+            samples = {path: list(values) for path, values in self._latency.items()}
+            stats = dict(self._counts)
+        stats["breaker"] = self.breaker.state
+        stats["endpoints"] = {
+            path: {
+                "calls": len(values),
+                "p50_ms": round(float(np.percentile(values, 50)), 1),
+                "p95_ms": round(float(np.percentile(values, 95)), 1),
+                "max_ms": round(max(values), 1),
+            }
+            for path, values in samples.items()
+        }
+        return stats
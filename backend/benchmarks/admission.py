@@ -0,0 +1,140 @@
+"""
+Admission Control Benchmark
+A burst of large /compare-boundaries requests (survey-grade plots of many
+thousand vertices) arriving together while officers keep posting small
+drawn plots, served by the Flask app from several threads:
+  * without   app.admission admits everything at once, so every large
+              comparison runs concurrently and small ones queue for the GIL
+              behind them
+  * with      the default AdmissionController: large requests share a
+              weighted budget of CAPACITY_VERTICES in arrival order, wait
+              at most QUEUE_TIMEOUT_S, and are shed with 429 beyond that;
+              small requests skip the queue
+Reported: small-request latency, and how many large requests completed or
+were shed, with the latency of those that completed.
+
+Usage:
+    python benchmarks/admission.py              # print the table
+    python benchmarks/admission.py --markdown
+"""
+
+import argparse
+import math
+import os
+import sys
+import tempfile
+import threading
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+os.environ["INSPECTION_DB"] = os.path.join(tempfile.mkdtemp(), "inspections.db")
+
+import numpy as np  # noqa: E402
+from shapely.affinity import translate  # noqa: E402
+from shapely.geometry import Polygon, mapping  # noqa: E402
+
+import app as backend  # noqa: E402
+from admission import AdmissionController  # noqa: E402
+
+LARGE_VERTICES = 20_000
+LARGE_REQUESTS = 12
+SMALL_VERTICES = 60
+SMALL_CLIENTS = 4
+
+
+def compare_body(vertices, seed):
+    reference = Polygon([
+        (81.595 + 0.00025 * math.cos(2 * math.pi * i / vertices) * (1 + 0.05 * math.sin(7 * i + seed)),
+         21.275 + 0.0002 * math.sin(2 * math.pi * i / vertices))
+        for i in range(vertices)
+    ])
+    return {"reference": mapping(reference), "current": mapping(translate(reference, xoff=0.00005))}
+
+
+def run(controller, large_requests=LARGE_REQUESTS, small_clients=SMALL_CLIENTS):
+    """
+    Fires the large burst alongside small-request clients that post in a
+    loop until the burst is over. Distinct bodies keep coalescing out of it.
+    """
+    backend.admission = controller
+    large_bodies = [compare_body(LARGE_VERTICES, seed) for seed in range(large_requests)]
+    small_body = compare_body(SMALL_VERTICES, 0)
+    large, small = [], []
+    done = threading.Event()
+    ready = threading.Barrier(large_requests + small_clients + 1)
+
+    def post_large(body):
+        client = backend.app.test_client()
+        ready.wait()
+        start = time.perf_counter()
+        status = client.post("/compare-boundaries", json=body).status_code
+        large.append((status, time.perf_counter() - start))
+
+    def post_small():
+        client = backend.app.test_client()
+        ready.wait()
+        while not done.is_set():
+            start = time.perf_counter()
+            if client.post("/compare-boundaries", json=small_body).status_code != 200:
+                raise AssertionError("a small request was not served")
+            small.append(time.perf_counter() - start)
+
+    large_threads = [threading.Thread(target=post_large, args=(body,)) for body in large_bodies]
+    small_threads = [threading.Thread(target=post_small) for _ in range(small_clients)]
+    for t in large_threads + small_threads:
+        t.start()
+    ready.wait()
+    start = time.perf_counter()
+    for t in large_threads:
+        t.join()
+    wall = time.perf_counter() - start
+    done.set()
+    for t in small_threads:
+        t.join()
+
+    served = [seconds for status, seconds in large if status == 200]
+    if len(served) + sum(status == 429 for status, _ in large) != large_requests:
+        raise AssertionError("a large request failed with neither 200 nor 429")
+    return {
+        "small_p50_ms": np.percentile(small, 50) * 1000,
+        "small_p95_ms": np.percentile(small, 95) * 1000,
+        "small_calls": len(small),
+        "large_served": len(served),
+        "large_shed": large_requests - len(served),
+        "large_p95_s": np.percentile(served, 95) if served else float("nan"),
+        "wall_s": wall,
+    }
+
+
+def measure(large_requests=LARGE_REQUESTS, small_clients=SMALL_CLIENTS):
+    unlimited = AdmissionController(capacity=10 ** 12, cheap=0, queue_timeout=0)
+    return [
+        ("without", run(unlimited, large_requests, small_clients)),
+        ("with", run(AdmissionController(), large_requests, small_clients)),
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--markdown", action="store_true")
+    parser.add_argument("--large", type=int, default=LARGE_REQUESTS)
+    parser.add_argument("--small-clients", type=int, default=SMALL_CLIENTS)
+    args = parser.parse_args()
+
+    rows = measure(args.large, args.small_clients)
+    if args.markdown:
+        print("| Admission | Small p50 (ms) | Small p95 (ms) | Small calls | Large served | Large shed (429) "
+              "| Large p95 (s) | Burst (s) |\n|---|---:|---:|---:|---:|---:|---:|---:|")
+        for name, r in rows:
+            print(f"| {name} | {r['small_p50_ms']:,.1f} | {r['small_p95_ms']:,.1f} | {r['small_calls']:,} "
+                  f"| {r['large_served']} | {r['large_shed']} | {r['large_p95_s']:.2f} | {r['wall_s']:.2f} |")
+    else:
+        for name, r in rows:
+            print(f"{name:<8} small p50 {r['small_p50_ms']:>7,.1f} ms  p95 {r['small_p95_ms']:>8,.1f} ms"
+                  f"  ({r['small_calls']:,} calls)   large {r['large_served']} served, {r['large_shed']} shed,"
+                  f" p95 {r['large_p95_s']:.2f} s   burst {r['wall_s']:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""
+Area Mode Benchmark
+Compares the ways the backend has measured plot areas:
+  * UTM lookup      per-geometry pyproj UTM zone query + new transformer
+                    (the old /detect-builtup path)
+  * fixed 32644     new EPSG:32644 transformer per geometry (the old
+                    /compare-boundaries path)
+  * Karney          pyproj.Geod.geometry_area_perimeter per geometry: exact
+                    geodesic polygons on the WGS 84 ellipsoid, the reference
+  * projected       areas.projected_areas: bulk, per-zone UTM projection
+  * geodesic        areas.geodesic_areas: bulk ellipsoidal equal-area
+                    projection
+Speed is measured on batches of 40-vertex plots spread over Chhattisgarh's
+longitudes, which cross UTM zones 43-45. Accuracy is each method's relative
+error against Karney's area, for plots placed along the same span.
+
+Usage:
+    python benchmarks/area_modes.py              # print the tables
+    python benchmarks/area_modes.py --markdown
+"""
+
+import argparse
+import math
+import os
+import sys
+import time
+import warnings
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+import numpy as np  # noqa: E402
+import pyproj  # noqa: E402
+from shapely.geometry import Polygon  # noqa: E402
+from shapely.ops import transform  # noqa: E402
+
+from areas import geodesic_areas, projected_areas  # noqa: E402
+
+BATCHES = [1, 100, 10_000]
+VERTICES = 40
+# Old per-geometry methods are timed on at most this many plots and scaled up
+PER_GEOMETRY_SAMPLE = 50
+LAT = 21.25
+# (label, longitude): zone 43, zone 44 (west edge, central meridian, east edge), zone 45
+PLACES = [("77.9°E (zone 43)", 77.9), ("78.1°E (zone 44 west)", 78.1), ("81.0°E (zone 44 centre)", 81.0),
+          ("83.9°E (zone 44 east)", 83.9), ("84.3°E (zone 45)", 84.3)]
+# (label, half-width in degrees): an allotted plot, a whole industrial area and a district-sized area
+SIZES = [("~2,000 m² plot", 0.00025), ("~1 km² area", 0.005), ("~2,500 km² area", 0.25)]
+ERRORS = ["fixed 32644", "projected", "geodesic"]
+
+
+def plot(lon, lat, half=0.00025, vertices=VERTICES):
+    return Polygon([
+        (lon + half * math.cos(2 * math.pi * i / vertices), lat + 0.8 * half * math.sin(2 * math.pi * i / vertices))
+        for i in range(vertices)
+    ])
+
+
+def utm_lookup_area(geom):
+    utm_crs = pyproj.database.query_utm_crs_info(
+        datum_name="WGS 84",
+        area_of_interest=pyproj.aoi.AreaOfInterest(*geom.bounds),
+    )[0].code
+    project = pyproj.Transformer.from_crs("EPSG:4326", pyproj.CRS.from_user_input(utm_crs), always_xy=True).transform
+    return transform(project, geom).area
+
+
+def fixed_zone_area(geom):
+    project = pyproj.Transformer.from_crs("EPSG:4326", "EPSG:32644", always_xy=True).transform
+    return transform(project, geom).area
+
+
+def karney_area(geom):
+    return abs(pyproj.Geod(ellps="WGS84").geometry_area_perimeter(geom)[0])
+
+
+def per_geometry(fn):
+    return lambda geoms: np.array([fn(g) for g in geoms])
+
+
+METHODS = {
+    "UTM lookup": per_geometry(utm_lookup_area),
+    "fixed 32644": per_geometry(fixed_zone_area),
+    "Karney": per_geometry(karney_area),
+    "projected": projected_areas,
+    "geodesic": geodesic_areas,
+}
+PER_GEOMETRY = {"UTM lookup", "fixed 32644"}
+
+
+def timed_ms(fn, geoms):
+    fn(geoms[:1])
+    start = time.perf_counter()
+    fn(geoms)
+    return (time.perf_counter() - start) * 1000
+
+
+def measure_speed(batches=BATCHES):
+    rng = np.random.default_rng(0)
+    rows = []
+    for n in batches:
+        geoms = np.array([plot(80.2 + 4.2 * rng.random(), 17.8 + 6.3 * rng.random()) for _ in range(n)], dtype=object)
+        row = {}
+        for name, fn in METHODS.items():
+            if name in PER_GEOMETRY and n > PER_GEOMETRY_SAMPLE:
+                row[name] = timed_ms(fn, geoms[:PER_GEOMETRY_SAMPLE]) * n / PER_GEOMETRY_SAMPLE
+            else:
+                row[name] = timed_ms(fn, geoms)
+        rows.append((n, row))
+    return rows
+
+
+def measure_accuracy():
+    rows = []
+    for size_label, half in SIZES:
+        for place, lon in PLACES:
+            geom = plot(lon, LAT, half)
+            exact = karney_area(geom)
+            errors = {name: (METHODS[name]([geom])[0] - exact) / exact * 100 for name in ERRORS}
+            rows.append((size_label, place, exact, errors))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--markdown", action="store_true")
+    args = parser.parse_args()
+
+    # The old methods use the deprecated shapely.ops.transform
+    warnings.simplefilter("ignore", DeprecationWarning)
+    speed = measure_speed()
+    accuracy = measure_accuracy()
+
+    if args.markdown:
+        print("| Plots | " + " | ".join(f"{name} (ms)" for name in METHODS) + " |")
+        print("|---:|" + "---:|" * len(METHODS))
+        for n, row in speed:
+            print(f"| {n:,} | " + " | ".join(f"{row[name]:,.1f}" for name in METHODS) + " |")
+        print("\n| Size | Place | Karney area (m²) | " + " | ".join(f"{name} error" for name in ERRORS) + " |")
+        print("|---|---|---:|" + "---:|" * len(ERRORS))
+        for size_label, place, exact, errors in accuracy:
+            print(f"| {size_label} | {place} | {exact:,.1f} | " + " | ".join(f"{errors[name]:+.3g}%" for name in ERRORS) + " |")
+    else:
+        print(f"{'plots':>8}" + "".join(f"{name:>16}" for name in METHODS))
+        for n, row in speed:
+            print(f"{n:>8,}" + "".join(f"{row[name]:>13,.1f} ms" for name in METHODS))
+        print()
+        for size_label, place, exact, errors in accuracy:
+            print(f"{size_label:<16}{place:<24}{exact:>18,.1f} m²" + "".join(f"  {name} {errors[name]:+.3g}%" for name in ERRORS))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Backend Client Shedding Check
+How the dashboard's BackendClient and its circuit breaker respond to a
+local stub backend that answers each scenario's script of statuses:
+  * shed burst      every call is shed with 429; the breaker must stay
+                    closed and callers get a BackendError(429)
+  * shed trial      the breaker is opened by 503s, and its half-open trial
+                    call is shed with 429; the next call must go through
+                    and close the breaker
+  * outage          every call fails with 503; the breaker must open and
+                    later calls fail fast
+The script fails if any scenario ends in a different breaker state.
+
+Usage:
+    python benchmarks/backend_client.py              # print the table
+    python benchmarks/backend_client.py --markdown
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+import backend_client  # noqa: E402
+from backend_client import BackendClient, BackendError, BackendUnavailable  # noqa: E402
+
+RESET_S = 0.2
+
+
+class ScriptedBackend(BaseHTTPRequestHandler):
+    """
+    Answers each POST with the next status of `script` (200 once it runs
+    out), with Retry-After: 0 on 429s.
+    """
+
+    script = deque()
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        status = self.script.popleft() if self.script else 200
+        body = b'{"ok":true}' if status == 200 else b'{"error":"scripted"}'
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if status == 429:
+            self.send_header("Retry-After", "0")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def call(client):
+    """
+    Outcome of one post_json: "ok", "HTTP <status>", or "unavailable".
+    """
+    try:
+        client.post_json("/compare-boundaries", {})
+        return "ok"
+    except BackendError as e:
+        return f"HTTP {e.status}"
+    except BackendUnavailable:
+        return "unavailable"
+
+
+def scenario(url, statuses, calls, open_first=False):
+    ScriptedBackend.script = deque(statuses)
+    client = BackendClient(url)
+    client.breaker.reset_s = RESET_S
+    if open_first:
+        # Trip the breaker, then wait until it allows one trial call
+        for _ in range(client.breaker.failures):
+            client.breaker.failure()
+        time.sleep(RESET_S)
+    outcomes = [call(client) for _ in range(calls)]
+    return outcomes, client.breaker.state, client.stats()
+
+
+def measure():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ScriptedBackend)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}"
+    retries = backend_client.RETRIES + 1
+    try:
+        checks = [
+            ("shed burst", scenario(url, [429] * retries * 6, 6), "closed"),
+            ("shed trial", scenario(url, [429] * retries, 3, open_first=True), "closed"),
+            ("outage", scenario(url, [503] * retries * 8, 8), "open"),
+        ]
+    finally:
+        server.shutdown()
+    rows = []
+    for name, (outcomes, state, stats), expected in checks:
+        if state != expected:
+            raise AssertionError(f"{name}: breaker is {state}, expected {expected} ({outcomes})")
+        rows.append((name, outcomes, state, stats))
+    if rows[1][1][1:] != ["ok", "ok"]:
+        raise AssertionError(f"shed trial: calls after the trial did not go through ({rows[1][1]})")
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--markdown", action="store_true")
+    args = parser.parse_args()
+
+    rows = measure()
+    if args.markdown:
+        print("| Scenario | Call outcomes | Breaker | Shed | Failed / Rejected |\n|---|---|---|---:|---:|")
+        for name, outcomes, state, stats in rows:
+            print(f"| {name} | {', '.join(outcomes)} | {state} | {stats['shed']} "
+                  f"| {stats['errors']} / {stats['rejected']} |")
+    else:
+        for name, outcomes, state, stats in rows:
+            print(f"{name:<12}{state:<10}shed {stats['shed']}  failed {stats['errors']}  "
+                  f"rejected {stats['rejected']}   {', '.join(outcomes)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""
+Request Body Format Benchmark
+Size on the wire and server-side decode time of the same request in each
+body format the geometry routes accept:
+  * GeoJSON      application/json (payloads.read_survey / read_comparison)
+  * WKB          application/wkb, one GeometryCollection
+  * hex WKB      application/wkb-hex, one "<id> <hex>" line per geometry
+  * FlatGeobuf   application/flatgeobuf (needs pyogrio; skipped without it)
+for POST /registry/overlaps survey batches of 40-vertex plots and for a
+/compare-boundaries body with two large polygons. Every format must decode
+to the same geometries.
+
+Usage:
+    python benchmarks/body_formats.py              # print the table
+    python benchmarks/body_formats.py --markdown
+"""
+
+import argparse
+import io
+import json
+import math
+import os
+import sys
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+import numpy as np  # noqa: E402
+import shapely  # noqa: E402
+from werkzeug.datastructures import MultiDict  # noqa: E402
+
+from payloads import FLATGEOBUF, WKB, WKB_HEX, read_comparison, read_survey  # noqa: E402
+
+SURVEY_BATCHES = [100, 5_000]
+SURVEY_VERTICES = 40
+COMPARE_VERTICES = 10_000
+RUNS = 10
+
+
+def plot(vertices, lon=81.6, lat=21.25, radius=0.0003):
+    return shapely.Polygon([
+        (round(lon + radius * math.cos(2 * math.pi * i / vertices), 7),
+         round(lat + 0.8 * radius * math.sin(2 * math.pi * i / vertices), 7))
+        for i in range(vertices)
+    ])
+
+
+def flatgeobuf(ids, geoms):
+    try:
+        from pyogrio.raw import write
+    except ImportError:
+        return None
+    buf = io.BytesIO()
+    write(buf, shapely.to_wkb(geoms), field_data=[np.array(ids, dtype=object)], fields=["id"],
+          driver="FlatGeobuf", geometry_type="Polygon", crs="EPSG:4326")
+    return buf.getvalue()
+
+
+def bodies(ids, geoms, json_body):
+    """
+    {content type: body} for the same geometries.
+    """
+    formats = {
+        "application/json": json_body,
+        WKB: shapely.to_wkb(shapely.GeometryCollection(list(geoms))),
+        WKB_HEX: "\n".join(f"{i} {h}" for i, h in zip(ids, shapely.to_wkb(geoms, hex=True))).encode(),
+    }
+    fgb = flatgeobuf(ids, geoms)
+    if fgb is not None:
+        formats[FLATGEOBUF[0]] = fgb
+    return formats
+
+
+def survey_case(plots):
+    rng = np.random.default_rng(0)
+    # Zero-padded, so sorting by id restores the batch order
+    ids = [f"S-{i:05d}" for i in range(plots)]
+    geoms = np.array([plot(SURVEY_VERTICES, 81.5 + rng.random(), 21.2 + rng.random()) for _ in ids], dtype=object)
+    json_body = json.dumps({"boundaries": [
+        {"id": i, "geometry": shapely.geometry.mapping(g)} for i, g in zip(ids, geoms)
+    ]}).encode()
+
+    def read(body, content_type):
+        found, decoded = read_survey(body, content_type, MultiDict({"ids": ",".join(ids)}))
+        # FlatGeobuf's spatial index reorders features
+        order = np.argsort(np.array(found, dtype=object))
+        return np.array(found, dtype=object)[order], np.asarray(decoded)[order]
+
+    return f"survey, {plots:,} plots", (ids, geoms), bodies(ids, geoms, json_body), read
+
+
+def compare_case(vertices=COMPARE_VERTICES):
+    ids = ["reference", "current"]
+    geoms = np.array([plot(vertices, radius=0.01), plot(vertices, radius=0.011)], dtype=object)
+    json_body = json.dumps({
+        "reference": shapely.geometry.mapping(geoms[0]),
+        "current": shapely.geometry.mapping(geoms[1]),
+    }).encode()
+
+    def read(body, content_type):
+        _, reference, current = read_comparison(body, content_type, MultiDict())
+        return ids, np.array([reference, current], dtype=object)
+
+    return f"compare, {vertices:,} vertices each", (ids, geoms), bodies(ids, geoms, json_body), read
+
+
+def measure(runs=RUNS):
+    rows = []
+    for name, (ids, geoms), formats, read in [*(survey_case(n) for n in SURVEY_BATCHES), compare_case()]:
+        for content_type, body in formats.items():
+            read(body, content_type)
+            start = time.perf_counter()
+            for _ in range(runs):
+                found, decoded = read(body, content_type)
+            ms = (time.perf_counter() - start) / runs * 1000
+            if list(found) != list(ids) or not shapely.equals_exact(decoded, geoms, tolerance=1e-9).all():
+                raise AssertionError(f"{name}: {content_type} decoded different geometries")
+            rows.append((name, content_type, len(body), ms))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--markdown", action="store_true")
+    parser.add_argument("--runs", type=int, default=RUNS)
+    args = parser.parse_args()
+
+    rows = measure(args.runs)
+    json_rows = {name: (size, ms) for name, content_type, size, ms in rows if content_type == "application/json"}
+    if args.markdown:
+        print("| Body | Content-Type | Size | vs GeoJSON | Decode (ms) | vs GeoJSON |\n|---|---|---:|---:|---:|---:|")
+        for name, content_type, size, ms in rows:
+            json_size, json_ms = json_rows[name]
+            print(f"| {name} | `{content_type}` | {size / 1024:,.0f} KB | {size / json_size:.0%} | {ms:,.2f} | {ms / json_ms:.0%} |")
+    else:
+        for name, content_type, size, ms in rows:
+            json_size, json_ms = json_rows[name]
+            print(f"{name:<30}{content_type:<24}{size / 1024:>9,.0f} KB{size / json_size:>6.0%}{ms:>10,.2f} ms{ms / json_ms:>6.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+Request Coalescing Benchmark
+Bursts of identical /compare-boundaries requests fired at once from several
+threads (officers opening the same plot, repeated dashboard posts), served
+by the Flask app with and without in-flight coalescing:
+  * without   every request runs its own comparison
+  * with      app.compare_flight: one comparison and JSON encoding per
+              burst, shared by all its requests
+for drawn plots of growing vertex counts. Every response must match the
+single-request result.
+
+Usage:
+    python benchmarks/coalescing.py              # print the table
+    python benchmarks/coalescing.py --markdown
+"""
+
+import argparse
+import math
+import os
+import sys
+import tempfile
+import threading
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+os.environ["INSPECTION_DB"] = os.path.join(tempfile.mkdtemp(), "inspections.db")
+
+from shapely.affinity import translate  # noqa: E402
+from shapely.geometry import Polygon, mapping  # noqa: E402
+
+import app as backend  # noqa: E402
+from singleflight import SingleFlight  # noqa: E402
+
+VERTICES = [200, 5_000, 20_000]
+CONCURRENCY = 8
+BURSTS = 3
+
+
+class NoCoalescing:
+    def do(self, key, fn):
+        return fn()
+
+
+def compare_body(vertices):
+    reference = Polygon([
+        (81.595 + 0.00025 * math.cos(2 * math.pi * i / vertices) * (1 + 0.05 * math.sin(7 * i)),
+         21.275 + 0.0002 * math.sin(2 * math.pi * i / vertices))
+        for i in range(vertices)
+    ])
+    return {"reference": mapping(reference), "current": mapping(translate(reference, xoff=0.00005))}
+
+
+def burst(body, concurrency):
+    """
+    Wall time for `concurrency` threads posting `body` at the same moment,
+    and their responses.
+    """
+    responses = [None] * concurrency
+    ready = threading.Barrier(concurrency + 1)
+
+    def post(i):
+        client = backend.app.test_client()
+        ready.wait()
+        responses[i] = client.post("/compare-boundaries", json=body).get_json()
+
+    threads = [threading.Thread(target=post, args=(i,)) for i in range(concurrency)]
+    for t in threads:
+        t.start()
+    ready.wait()
+    start = time.perf_counter()
+    for t in threads:
+        t.join()
+    return time.perf_counter() - start, responses
+
+
+def measure(concurrency=CONCURRENCY, bursts=BURSTS):
+    rows = []
+    for n in VERTICES:
+        body = compare_body(n)
+        expected = backend.app.test_client().post("/compare-boundaries", json=body).get_json()
+        row = {}
+        for name, flight in (("without", NoCoalescing()), ("with", SingleFlight())):
+            backend.compare_flight = flight
+            elapsed = 0.0
+            for _ in range(bursts):
+                seconds, responses = burst(body, concurrency)
+                if any(r != expected for r in responses):
+                    raise AssertionError(f"{n} vertices: a coalesced response differs")
+                elapsed += seconds
+            stats = flight.stats() if isinstance(flight, SingleFlight) else None
+            row[name] = (elapsed / bursts * 1000, stats)
+        rows.append((n, row))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--markdown", action="store_true")
+    parser.add_argument("--concurrency", type=int, default=CONCURRENCY)
+    parser.add_argument("--bursts", type=int, default=BURSTS)
+    args = parser.parse_args()
+
+    rows = measure(args.concurrency, args.bursts)
+    runs = args.concurrency * args.bursts
+    if args.markdown:
+        print("| Plot | Burst, without (ms) | Burst, with (ms) | Speed-up | Comparisons run | CPU avoided (s) |\n"
+              "|---|---:|---:|---:|---:|---:|")
+        for n, row in rows:
+            (old_ms, _), (new_ms, stats) = row["without"], row["with"]
+            print(f"| {n:,} vertices | {old_ms:,.1f} | {new_ms:,.1f} | {old_ms / new_ms:.1f}x "
+                  f"| {stats['executed']} of {runs} | {stats['cpu_seconds_avoided']:.2f} |")
+    else:
+        for n, row in rows:
+            (old_ms, _), (new_ms, stats) = row["without"], row["with"]
+            print(f"{n:>7,} vertices{old_ms:>11,.1f} ms{new_ms:>11,.1f} ms{old_ms / new_ms:>6.1f}x"
+                  f"   ran {stats['executed']} of {runs}, avoided {stats['cpu_seconds_avoided']:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
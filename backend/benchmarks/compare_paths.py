@@ -0,0 +1,128 @@
+"""
+Boundary Comparison Benchmark
+Times boundary_compare.compare against the previous always-overlay
+implementation, for each comparison path:
+  * identical, disjoint, within, contains and general (partial overlap)
+    cases built from a many-vertex drawn plot
+  * a routine sweep mixing them (mostly identical / within / disjoint)
+and checks that both return the same areas (within the old projection's
+scale error).
+
+Usage:
+    python benchmarks/compare_paths.py              # print the table
+    python benchmarks/compare_paths.py --markdown
+"""
+
+import argparse
+import math
+import os
+import sys
+import time
+import warnings
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+import pyproj  # noqa: E402
+from shapely.affinity import scale, translate  # noqa: E402
+from shapely.geometry import Polygon  # noqa: E402
+from shapely.ops import transform  # noqa: E402
+
+from boundary_compare import compare  # noqa: E402
+
+RUNS = 200
+VERTICES = 200
+# Share of each case in a routine sweep
+SWEEP_MIX = {"identical": 0.4, "within": 0.25, "disjoint": 0.15, "contains": 0.1, "general": 0.1}
+
+
+def baseline_compare(reference, current, tolerance_m2=25):
+    """
+    /compare-boundaries before the fast paths: three overlays and four
+    projections with a new transformer per projection.
+    """
+    def project_to_meters(geom):
+        project = pyproj.Transformer.from_crs("EPSG:4326", "EPSG:32644", always_xy=True).transform
+        return transform(project, geom)
+
+    encroachment = current.difference(reference)
+    unused = reference.difference(current)
+    overlap = reference.intersection(current)
+    enc_area = project_to_meters(encroachment).area
+    unused_area = project_to_meters(unused).area
+    total_ref_area = project_to_meters(reference).area
+    overlap_area = project_to_meters(overlap).area
+    enc_area = 0 if enc_area < tolerance_m2 else enc_area
+    unused_area = 0 if unused_area < tolerance_m2 else unused_area
+    return {"encroachment_area": round(enc_area, 2), "unused_area": round(unused_area, 2),
+            "overlap_area": round(overlap_area, 2), "total_reference_area": round(total_ref_area, 2)}
+
+
+def cases(vertices=VERTICES):
+    """
+    (reference, current) per comparison path around a ~2,000 m² plot.
+    """
+    center = (81.595, 21.275)
+    ring = [
+        (center[0] + 0.00025 * math.cos(2 * math.pi * i / vertices) * (1 + 0.05 * math.sin(7 * i)),
+         center[1] + 0.0002 * math.sin(2 * math.pi * i / vertices))
+        for i in range(vertices)
+    ]
+    reference = Polygon(ring)
+    return {
+        # Same boundary redrawn from another starting vertex
+        "identical": (reference, Polygon(ring[17:] + ring[:17])),
+        "disjoint": (reference, translate(reference, xoff=0.001)),
+        "within": (reference, scale(reference, 0.9, 0.9)),
+        "contains": (reference, scale(reference, 1.1, 1.1)),
+        "general": (reference, translate(reference, xoff=0.00005)),
+    }
+
+
+def timed(fn, reference, current, runs):
+    fn(reference, current)
+    start = time.perf_counter()
+    for _ in range(runs):
+        result = fn(reference, current)
+    return (time.perf_counter() - start) / runs * 1000, result
+
+
+def measure(runs=RUNS):
+    rows = []
+    sweep_new = sweep_old = 0.0
+    for name, (reference, current) in cases().items():
+        old_ms, old = timed(baseline_compare, reference, current, runs)
+        new_ms, new = timed(compare, reference, current, runs)
+        if new["comparison_path"] != name:
+            raise AssertionError(f"{name} case took the {new['comparison_path']} path")
+        # Geodesic areas differ from the old zone-44 projection by its scale error (< 0.2%)
+        for key, value in old.items():
+            if abs(new[key] - value) > max(0.05, 0.002 * value):
+                raise AssertionError(f"{name}: {key} {new[key]} != {value}")
+        rows.append((name, old_ms, new_ms))
+        sweep_old += SWEEP_MIX[name] * old_ms
+        sweep_new += SWEEP_MIX[name] * new_ms
+    rows.append(("routine sweep mix", sweep_old, sweep_new))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--markdown", action="store_true")
+    parser.add_argument("--runs", type=int, default=RUNS)
+    args = parser.parse_args()
+
+    # The baseline keeps the old shapely.ops.transform projection
+    warnings.simplefilter("ignore", DeprecationWarning)
+    rows = measure(args.runs)
+    if args.markdown:
+        print("| Case | Before (ms) | After (ms) | Speed-up |\n|---|---:|---:|---:|")
+        for name, old_ms, new_ms in rows:
+            print(f"| {name} | {old_ms:.3f} | {new_ms:.3f} | {old_ms / new_ms:.1f}x |")
+    else:
+        for name, old_ms, new_ms in rows:
+            print(f"{name:<20}{old_ms:9.3f} ms{new_ms:9.3f} ms{old_ms / new_ms:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Response Compression Benchmark
+Bytes on the wire and server time for responses with each Accept-Encoding
+the backend negotiates (none, gzip, zstd), through the Flask test client:
+  * /compare-boundaries responses for drawn plots of growing vertex counts
+    (three GeoJSON geometries per response)
+  * the streamed CSV export of a synthetic inspection store, with the time
+    to the first chunk to show it is encoded on the fly
+Every encoded body must decode to the uncompressed one.
+
+Usage:
+    python benchmarks/compression.py              # print the tables
+    python benchmarks/compression.py --markdown
+"""
+
+import argparse
+import gzip
+import math
+import os
+import sys
+import tempfile
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+os.environ["INSPECTION_DB"] = os.path.join(tempfile.mkdtemp(), "inspections.db")
+
+import zstandard  # noqa: E402
+from shapely.affinity import translate  # noqa: E402
+from shapely.geometry import Polygon, mapping  # noqa: E402
+
+from app import app  # noqa: E402
+from records import PlotRecord  # noqa: E402
+from store import get_store  # noqa: E402
+
+VERTICES = [40, 1_000, 10_000]
+EXPORT_ROWS = 200_000
+ENCODINGS = ["identity", "gzip", "zstd"]
+RUNS = 10
+
+
+def decode(data, encoding):
+    if encoding == "gzip":
+        return gzip.decompress(data)
+    if encoding == "zstd":
+        return zstandard.ZstdDecompressor().decompressobj().decompress(data)
+    return data
+
+
+def compare_body(vertices):
+    reference = Polygon([
+        (81.595 + 0.00025 * math.cos(2 * math.pi * i / vertices) * (1 + 0.05 * math.sin(7 * i)),
+         21.275 + 0.0002 * math.sin(2 * math.pi * i / vertices))
+        for i in range(vertices)
+    ])
+    return {"reference": mapping(reference), "current": mapping(translate(reference, xoff=0.00005))}
+
+
+def measure_compare(client, runs=RUNS):
+    rows = []
+    for n in VERTICES:
+        body = compare_body(n)
+        plain = client.post("/compare-boundaries", json=body).data
+        for encoding in ENCODINGS:
+            headers = {"Accept-Encoding": encoding}
+            client.post("/compare-boundaries", json=body, headers=headers)
+            start = time.perf_counter()
+            for _ in range(runs):
+                response = client.post("/compare-boundaries", json=body, headers=headers)
+            ms = (time.perf_counter() - start) / runs * 1000
+            if decode(response.data, response.headers.get("Content-Encoding")) != plain:
+                raise AssertionError(f"{n} vertices: {encoding} body differs")
+            rows.append((f"compare, {n:,} vertices", encoding, len(response.data), len(plain), ms, None))
+    return rows
+
+
+def measure_export(client):
+    store = get_store()
+    store.append_many([
+        PlotRecord(number=i, encroached_area=1.5 * (i % 900), unused_area=2.0 * (i % 700), unused_pct=(i % 100) * 1.0,
+                   revenue_recovery=350.0 * (i % 900), revenue_loss=50.0 * (i % 700), risk_score=i % 100,
+                   status_code=i % 3, lat=21.2 + (i % 1000) * 1e-4, lon=81.6, district="Raipur")
+        for i in range(EXPORT_ROWS)
+    ])
+    plain = client.get("/export/inspections.csv").data
+    rows = []
+    for encoding in ENCODINGS:
+        start = time.perf_counter()
+        response = client.get("/export/inspections.csv", headers={"Accept-Encoding": encoding}, buffered=False)
+        chunks = iter(response.response)
+        body = [next(chunks)]
+        first_ms = (time.perf_counter() - start) * 1000
+        body.extend(chunks)
+        ms = (time.perf_counter() - start) * 1000
+        data = b"".join(body)
+        if decode(data, response.headers.get("Content-Encoding")) != plain:
+            raise AssertionError(f"CSV export: {encoding} body differs")
+        rows.append((f"CSV export, {EXPORT_ROWS:,} rows", encoding, len(data), len(plain), ms, first_ms))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--markdown", action="store_true")
+    parser.add_argument("--runs", type=int, default=RUNS)
+    args = parser.parse_args()
+
+    client = app.test_client()
+    rows = measure_compare(client, args.runs) + measure_export(client)
+    if args.markdown:
+        print("| Response | Encoding | Bytes | vs identity | Time (ms) | First chunk (ms) |\n|---|---|---:|---:|---:|---:|")
+        for name, encoding, size, plain, ms, first_ms in rows:
+            first = "" if first_ms is None else f"{first_ms:,.1f}"
+            print(f"| {name} | {encoding} | {size:,} | {size / plain:.0%} | {ms:,.2f} | {first} |")
+    else:
+        for name, encoding, size, plain, ms, first_ms in rows:
+            first = "" if first_ms is None else f"  first chunk {first_ms:,.1f} ms"
+            print(f"{name:<28}{encoding:<10}{size:>12,} B{size / plain:>6.0%}{ms:>10,.2f} ms{first}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Dashboard Cold-Start Benchmark
+Measures, each in a fresh interpreter:
+  * cumulative import time (python -X importtime) of the heavy dependencies
+    and of the dashboard's own modules
+  * time for the dashboard script to import and render its first page
+    (streamlit AppTest), minus an empty Streamlit script as the baseline
+
+Usage:
+    python benchmarks/import_time.py              # print the table
+    python benchmarks/import_time.py --check      # exit 1 if over budget
+    python benchmarks/import_time.py --markdown   # table for import_time.md
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DASHBOARD = os.path.join(BACKEND_DIR, "dashboard.py")
+
+MODULES = [
+    "numpy", "pandas", "matplotlib.pyplot", "folium", "streamlit_folium", "shapely",
+    "plotly.graph_objects", "pydeck", "reportlab.platypus", "requests",
+    "premium_features", "reports", "districts", "query_engine",
+]
+
+# Dashboard import + first paint of the landing page, beyond a bare Streamlit script
+FIRST_PAINT_BUDGET_MS = 750
+
+RUNS = 5
+
+FIRST_PAINT = """
+import sys, time
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file(sys.argv[1], default_timeout=120)
+start = time.perf_counter()
+at.run()
+assert not at.exception, at.exception
+print((time.perf_counter() - start) * 1000)
+"""
+
+
+def import_ms(module):
+    """
+    Cumulative import time of `module` in a fresh interpreter, in ms.
+    """
+    out = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BACKEND_DIR, capture_output=True, text=True, check=True,
+    ).stderr
+    top = module.split(".")[0]
+    cumulative = [int(line.split("|")[1]) for line in out.splitlines()
+                  if line.startswith("import time:") and line.split("|")[2].strip() in (module, top)]
+    return max(cumulative) / 1000
+
+
+def first_paint_ms(script):
+    with tempfile.NamedTemporaryFile("w", suffix=".py", delete=False) as runner:
+        runner.write(FIRST_PAINT)
+    try:
+        out = subprocess.run(
+            [sys.executable, runner.name, script],
+            cwd=BACKEND_DIR, capture_output=True, text=True, check=True,
+            env={**os.environ, "INSPECTION_DB": os.path.join(tempfile.gettempdir(), "bench_inspections.db")},
+        ).stdout
+    finally:
+        os.remove(runner.name)
+    return float(out.strip().splitlines()[-1])
+
+
+def measure(runs=RUNS):
+    imports = {m: min(import_ms(m) for _ in range(runs)) for m in MODULES}
+
+    with tempfile.NamedTemporaryFile("w", suffix=".py", delete=False) as empty:
+        empty.write("import streamlit as st\nst.write('')\n")
+    try:
+        baseline = min(first_paint_ms(empty.name) for _ in range(runs))
+    finally:
+        os.remove(empty.name)
+    dashboard = min(first_paint_ms(DASHBOARD) for _ in range(runs))
+    return imports, baseline, dashboard
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--check", action="store_true", help="fail when first paint exceeds the budget")
+    parser.add_argument("--markdown", action="store_true")
+    parser.add_argument("--runs", type=int, default=RUNS)
+    args = parser.parse_args()
+
+    imports, baseline, dashboard = measure(args.runs)
+    own = dashboard - baseline
+
+    if args.markdown:
+        print("| Module | Import (ms) |\n|---|---:|")
+        for module, ms in imports.items():
+            print(f"| `{module}` | {ms:.0f} |")
+        print("\n| First paint | ms |\n|---|---:|")
+        print(f"| Empty Streamlit script | {baseline:.0f} |")
+        print(f"| dashboard.py | {dashboard:.0f} |")
+        print(f"| dashboard.py, own cost | {own:.0f} (budget {FIRST_PAINT_BUDGET_MS}) |")
+    else:
+        for module, ms in imports.items():
+            print(f"{module:<24}{ms:8.0f} ms")
+        print(f"{'first paint (empty)':<24}{baseline:8.0f} ms")
+        print(f"{'first paint (dashboard)':<24}{dashboard:8.0f} ms")
+        print(f"{'dashboard own cost':<24}{own:8.0f} ms  (budget {FIRST_PAINT_BUDGET_MS} ms)")
+
+    if args.check and own > FIRST_PAINT_BUDGET_MS:
+        sys.exit(f"First paint {own:.0f} ms exceeds the {FIRST_PAINT_BUDGET_MS} ms budget")
+
+
+if __name__ == "__main__":
+    main()
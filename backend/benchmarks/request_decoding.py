@@ -0,0 +1,118 @@
+"""
+Request Decoding Benchmark
+Times turning a JSON request body into shapely geometries:
+  * before   json.loads + shapely.geometry.shape per geometry (what the
+             routes did with request.json)
+  * after    payloads.decode + payloads.geometries: typed msgspec decode,
+             one vectorized coordinate parse, shapely.from_ragged_array
+for /compare-boundaries bodies (reference + current polygon) of growing
+vertex counts, and for /registry/overlaps survey batches of 40-vertex plots.
+Both must build the same geometries.
+
+Usage:
+    python benchmarks/request_decoding.py              # print the table
+    python benchmarks/request_decoding.py --markdown
+"""
+
+import argparse
+import json
+import math
+import os
+import sys
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+import shapely  # noqa: E402
+from shapely.geometry import shape  # noqa: E402
+
+from payloads import CompareRequest, SurveyRequest, decode, geometries  # noqa: E402
+
+POLYGON_VERTICES = [40, 1_000, 10_000, 100_000]
+SURVEY_BATCHES = [100, 1_000]
+SURVEY_VERTICES = 40
+RUNS = 20
+
+
+def ring(vertices, lon=81.6, lat=21.25, radius=0.01):
+    points = [
+        [round(lon + radius * math.cos(2 * math.pi * i / vertices), 7),
+         round(lat + 0.8 * radius * math.sin(2 * math.pi * i / vertices), 7)]
+        for i in range(vertices)
+    ]
+    return points + [points[0]]
+
+
+def compare_body(vertices):
+    return json.dumps({
+        "reference": {"type": "Polygon", "coordinates": [ring(vertices)]},
+        "current": {"type": "Polygon", "coordinates": [ring(vertices, radius=0.011)]},
+        "tolerance_m2": 25,
+    }).encode()
+
+
+def survey_body(plots):
+    return json.dumps({"boundaries": [
+        {"id": f"S-{i}", "geometry": {"type": "Polygon", "coordinates": [ring(SURVEY_VERTICES, 81.6 + 0.001 * i, radius=0.0003)]}}
+        for i in range(plots)
+    ]}).encode()
+
+
+def before_compare(body):
+    data = json.loads(body)
+    return [shape(data["reference"]), shape(data["current"])]
+
+
+def after_compare(body):
+    data = decode(body, CompareRequest)
+    return geometries([data.reference, data.current])
+
+
+def before_survey(body):
+    return [shape(b["geometry"]) for b in json.loads(body)["boundaries"]]
+
+
+def after_survey(body):
+    return geometries([b.geometry for b in decode(body, SurveyRequest).boundaries])
+
+
+def timed_ms(fn, body, runs):
+    fn(body)
+    start = time.perf_counter()
+    for _ in range(runs):
+        result = fn(body)
+    return (time.perf_counter() - start) / runs * 1000, result
+
+
+def measure(runs=RUNS):
+    cases = [(f"compare, {n:,} vertices each", compare_body(n), before_compare, after_compare) for n in POLYGON_VERTICES]
+    cases += [(f"survey, {n:,} plots", survey_body(n), before_survey, after_survey) for n in SURVEY_BATCHES]
+    rows = []
+    for name, body, before, after in cases:
+        old_ms, old = timed_ms(before, body, runs)
+        new_ms, new = timed_ms(after, body, runs)
+        if not shapely.equals_exact(list(old), list(new), tolerance=0).all():
+            raise AssertionError(f"{name}: decoded geometries differ")
+        rows.append((name, len(body), old_ms, new_ms))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--markdown", action="store_true")
+    parser.add_argument("--runs", type=int, default=RUNS)
+    args = parser.parse_args()
+
+    rows = measure(args.runs)
+    if args.markdown:
+        print("| Body | Size | Before (ms) | After (ms) | Speed-up |\n|---|---:|---:|---:|---:|")
+        for name, size, old_ms, new_ms in rows:
+            print(f"| {name} | {size / 1024:,.0f} KB | {old_ms:,.3f} | {new_ms:,.3f} | {old_ms / new_ms:.1f}x |")
+    else:
+        for name, size, old_ms, new_ms in rows:
+            print(f"{name:<30}{size / 1024:>9,.0f} KB{old_ms:>11,.3f} ms{new_ms:>11,.3f} ms{old_ms / new_ms:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
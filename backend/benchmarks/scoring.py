@@ -0,0 +1,161 @@
+"""
+Compliance Scoring Benchmark
+Vectorized scoring under the default policy (policy.CompiledPolicy on the
+scoring.py primitives) against the per-plot scalar rules it replaced, which
+are kept below as the reference:
+  * legal_risk_classifier and smart_recommendation_engine (severity, legal
+    risk, action and urgency)
+  * the /compliance-score route's 0-100 score, with a built-up percentage
+  * the dashboard's compute_risk_score, without one
+Plots mix random values with every band edge and NaN built-up
+percentages. Every output of every plot must match the scalar rules
+exactly, or the script fails.
+
+Usage:
+    python benchmarks/scoring.py              # print the table
+    python benchmarks/scoring.py --markdown
+"""
+
+import argparse
+import os
+import sys
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+import numpy as np  # noqa: E402
+
+from policy import PolicyEngine  # noqa: E402
+
+SIZES = [1_000, 100_000, 1_000_000]
+RUNS = 5
+
+
+# ==============================
+# Scalar Reference
+# ==============================
+def legal_risk_classifier(built_percentage):
+    if built_percentage > 85:
+        return "Critical Encroachment", 4
+    elif built_percentage > 70:
+        return "Major Violation", 3
+    elif built_percentage > 40:
+        return "Moderate Deviation", 2
+    elif built_percentage > 20:
+        return "Minor Deviation", 1
+    return "Underutilized / Partial Construction", 2
+
+
+def smart_recommendation_engine(severity, risk_score):
+    if risk_score == 4:
+        return "Immediate Legal Notice & Drone Verification", "Within 7 Days"
+    elif risk_score == 3:
+        return "Issue Show-Cause Notice & Schedule Inspection", "Within 15 Days"
+    elif risk_score == 2:
+        return "Review Allotment Compliance & Conduct Field Visit", "Within 30 Days"
+    return "Continue Monitoring", "Quarterly Review"
+
+
+def route_score(encroachment, unused_percentage, built_percentage):
+    score = 100
+    if encroachment:
+        score -= 40
+    if unused_percentage > 20:
+        score -= 30
+    if 0 < unused_percentage <= 20 or (built_percentage > 70 and built_percentage <= 85):
+        score -= 10
+    return max(score, 0)
+
+
+def compute_risk_score(enc_area, unused_pct):
+    score = 100
+    if enc_area > 0:
+        score -= 40
+    if unused_pct > 20:
+        score -= 30
+    elif unused_pct > 0:
+        score -= 10
+    return max(score, 0)
+
+
+def score_scalar(built, encroached, unused):
+    out = {"severity": [], "risk_score": [], "recommended_action": [], "urgency": [],
+           "compliance_score": [], "dashboard_score": []}
+    for b, e, u in zip(built.tolist(), encroached.tolist(), unused.tolist()):
+        severity, risk = legal_risk_classifier(b)
+        action, urgency = smart_recommendation_engine(severity, risk)
+        out["severity"].append(severity)
+        out["risk_score"].append(risk)
+        out["recommended_action"].append(action)
+        out["urgency"].append(urgency)
+        out["compliance_score"].append(route_score(e > 0, u, b))
+        out["dashboard_score"].append(compute_risk_score(e, u))
+    return out
+
+
+# ==============================
+# Measurement
+# ==============================
+def plots(n, seed=0):
+    """
+    Built-up %, encroached area and unused % for n plots; a third of each
+    column is drawn from the band edges (and NaN for built-up).
+    """
+    rng = np.random.default_rng(seed)
+    built_edges = np.array([0, 20, 40, 70, 85, 100, np.nan, 20.000001, 85.000001])
+    unused_edges = np.array([0, 20, 20.000001, 100])
+    built = np.where(rng.random(n) < 1 / 3, rng.choice(built_edges, n), rng.uniform(0, 100, n))
+    unused = np.where(rng.random(n) < 1 / 3, rng.choice(unused_edges, n), rng.uniform(0, 60, n))
+    encroached = np.where(rng.random(n) < 0.5, 0.0, rng.uniform(0, 500, n))
+    return built, encroached, unused
+
+
+def score_vectorized(policy, built, encroached, unused):
+    result = policy.score(built, encroached, unused)
+    result["dashboard_score"] = policy.compliance(encroached, unused)
+    return result
+
+
+def best_ms(fn, runs):
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000, result
+
+
+def measure(runs=RUNS):
+    policy = PolicyEngine().get("default")
+    rows = []
+    for n in SIZES:
+        built, encroached, unused = plots(n)
+        scalar_ms, expected = best_ms(lambda: score_scalar(built, encroached, unused), 1)
+        vector_ms, result = best_ms(lambda: score_vectorized(policy, built, encroached, unused), runs)
+        for key, values in expected.items():
+            mismatches = int((np.asarray(result[key]).astype(object) != np.array(values, dtype=object)).sum())
+            if mismatches:
+                raise AssertionError(f"{n:,} plots: {mismatches:,} plots differ in {key}")
+        rows.append((n, scalar_ms, vector_ms))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--markdown", action="store_true")
+    parser.add_argument("--runs", type=int, default=RUNS)
+    args = parser.parse_args()
+
+    rows = measure(args.runs)
+    if args.markdown:
+        print("| Plots | Scalar (ms) | Vectorized (ms) | Speed-up | Mismatches |\n|---:|---:|---:|---:|---:|")
+        for n, scalar_ms, vector_ms in rows:
+            print(f"| {n:,} | {scalar_ms:,.1f} | {vector_ms:,.1f} | {scalar_ms / vector_ms:,.0f}x | 0 |")
+    else:
+        for n, scalar_ms, vector_ms in rows:
+            print(f"{n:>10,} plots{scalar_ms:>12,.1f} ms{vector_ms:>10,.1f} ms{scalar_ms / vector_ms:>7,.0f}x   identical")
+
+
+if __name__ == "__main__":
+    main()
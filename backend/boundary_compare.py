@@ -0,0 +1,106 @@
+"""
+Boundary Comparison
+Reference vs current boundary comparison for /compare-boundaries. Cheap
+pre-checks catch the common cases before any overlay operation:
+  * identical   normalized WKB equal; nothing encroached or unused
+  * disjoint    bounding boxes (then prepared intersects) miss; all of the
+                current boundary is encroachment, all of the reference unused
+  * within      current inside the reference; one difference, no encroachment
+  * contains    current covers the reference; one difference, nothing unused
+Everything else takes the general path (two differences, one intersection).
+All areas of a comparison are measured in one areas.areas_m2 call.
+"""
+
+import numpy as np
+import shapely
+
+from areas import areas_m2
+
+PATHS = ("identical", "disjoint", "within", "contains", "general")
+
+EMPTY = shapely.Polygon()
+
+
+def _areas(*geoms):
+    return areas_m2(np.array(geoms, dtype=object)).tolist()
+
+
+def _classify(reference, current):
+    """
+    Comparison path plus (encroachment, unused, overlap) geometries.
+    """
+    # Normalized WKB ignores ring start and orientation
+    if shapely.normalize(reference).wkb == shapely.normalize(current).wkb:
+        return "identical", EMPTY, EMPTY, reference
+
+    rx0, ry0, rx1, ry1 = reference.bounds
+    cx0, cy0, cx1, cy1 = current.bounds
+    if cx0 > rx1 or cx1 < rx0 or cy0 > ry1 or cy1 < ry0:
+        return "disjoint", current, reference, EMPTY
+
+    shapely.prepare(reference)
+    if not reference.intersects(current):
+        return "disjoint", current, reference, EMPTY
+    if reference.contains(current):
+        return "within", EMPTY, reference.difference(current), current
+    shapely.prepare(current)
+    if current.contains(reference):
+        return "contains", current.difference(reference), EMPTY, reference
+
+    return "general", current.difference(reference), reference.difference(current), reference.intersection(current)
+
+
+def compare(reference, current, tolerance_m2=25):
+    """
+    Encroachment, unused and overlap geometries and areas for a reference
+    and current boundary (shapely geometries, lon/lat).
+    """
+    # Fix invalid geometries (self-intersecting polygons from map drawing)
+    if not reference.is_valid:
+        reference = reference.buffer(0)
+    if not current.is_valid:
+        current = current.buffer(0)
+
+    path, encroachment, unused, overlap = _classify(reference, current)
+
+    # Areas follow from the path wherever they are known without measuring the overlay
+    if path == "identical":
+        total_ref_area, = _areas(reference)
+        enc_area, unused_area, overlap_area = 0.0, 0.0, total_ref_area
+    elif path == "disjoint":
+        total_ref_area, enc_area = _areas(reference, current)
+        unused_area, overlap_area = total_ref_area, 0.0
+    elif path == "within":
+        total_ref_area, overlap_area = _areas(reference, current)
+        enc_area, unused_area = 0.0, max(total_ref_area - overlap_area, 0.0)
+    elif path == "contains":
+        total_ref_area, current_area = _areas(reference, current)
+        enc_area, unused_area, overlap_area = max(current_area - total_ref_area, 0.0), 0.0, total_ref_area
+    else:
+        enc_area, unused_area, overlap_area, total_ref_area = _areas(encroachment, unused, overlap, reference)
+
+    # Tolerance threshold
+    tolerance_applied = False
+    if enc_area < tolerance_m2:
+        enc_area = 0
+        tolerance_applied = True
+    if unused_area < tolerance_m2:
+        unused_area = 0
+        tolerance_applied = True
+
+    # Unused percentage
+    unused_percentage = (unused_area / total_ref_area * 100) if total_ref_area > 0 else 0
+
+    return {
+        "encroachment_geojson": encroachment.__geo_interface__,
+        "unused_geojson": unused.__geo_interface__,
+        "overlap_geojson": overlap.__geo_interface__,
+        "encroachment_area": round(enc_area, 2),
+        "unused_area": round(unused_area, 2),
+        "overlap_area": round(overlap_area, 2),
+        "total_reference_area": round(total_ref_area, 2),
+        "unused_percentage": round(unused_percentage, 2),
+        "tolerance_m2": tolerance_m2,
+        "tolerance_applied": tolerance_applied,
+        "comparison_path": path
+    }
@@ -0,0 +1,156 @@
+"""
+Chart Rendering
+Renders the dashboard's bar, pie and histogram charts to PNG/SVG bytes with
+matplotlib's object API (no pyplot global state), so every figure is freed as
+soon as it is saved. Rendered charts are memoized in an LRU keyed on the
+chart's (small, pre-aggregated) data, so a chart is drawn once per dataset
+version and shared by every session that shows the same data.
+"""
+
+import io
+import json
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+
+import numpy as np
+
+# Matplotlib dark theme - Professional Control Room Style
+THEME = {
+    'figure.facecolor': '#1a1f35',
+    'axes.facecolor': '#1a1f35',
+    'axes.edgecolor': '#334155',
+    'axes.labelcolor': '#94a3b8',
+    'text.color': '#f1f5f9',
+    'xtick.color': '#94a3b8',
+    'ytick.color': '#94a3b8',
+    'grid.color': '#0f1420',
+    'grid.alpha': 0.3,
+    'figure.titlesize': 14,
+    'axes.labelsize': 11,
+    'axes.titlesize': 13,
+    'axes.titleweight': 'bold',
+}
+EDGE_COLOR = '#0a0e1a'
+
+FORMATS = {"png", "svg"}
+DPI = 144
+CACHE_SIZE = 64
+
+
+def bin_values(values, bins=10, value_range=(0, 100)):
+    """
+    Histogram counts and bin edges for `values`, dropping NaNs. Charts are
+    drawn from the counts, so rendering cost does not grow with the data.
+    """
+    values = np.asarray(values, dtype=float)
+    counts, edges = np.histogram(values[~np.isnan(values)], bins=bins, range=value_range)
+    return counts.tolist(), edges.tolist()
+
+
+# ==============================
+# Drawing
+# ==============================
+def _despine(ax):
+    ax.spines['top'].set_visible(False)
+    ax.spines['right'].set_visible(False)
+    ax.grid(axis='y', alpha=0.3)
+
+
+def _draw_bar(ax, labels, values, colors, title):
+    ax.bar(labels, values, color=colors, edgecolor=EDGE_COLOR, linewidth=2)
+    ax.set_title(title, fontweight='bold', pad=15)
+    _despine(ax)
+
+
+def _draw_pie(ax, labels, values, colors, title):
+    wedges, texts, autotexts = ax.pie(
+        values,
+        labels=labels,
+        colors=colors,
+        autopct="%1.1f%%",
+        startangle=90,
+        wedgeprops=dict(edgecolor=EDGE_COLOR, linewidth=2)
+    )
+    for text in texts:
+        text.set_color('#94a3b8')
+        text.set_fontsize(10)
+    for autotext in autotexts:
+        autotext.set_color('#f1f5f9')
+        autotext.set_fontweight('bold')
+    ax.set_title(title, fontweight='bold', pad=15)
+
+
+def _draw_histogram(ax, counts, edges, color, title, xlabel, ylabel):
+    ax.bar(edges[:-1], counts, width=np.diff(edges), align="edge", color=color, edgecolor=EDGE_COLOR, linewidth=1.5)
+    ax.set_xlabel(xlabel, fontweight='bold')
+    ax.set_ylabel(ylabel, fontweight='bold')
+    ax.set_title(title, fontweight='bold', pad=15)
+    _despine(ax)
+
+
+CHARTS = {
+    "bar": _draw_bar,
+    "pie": _draw_pie,
+    "histogram": _draw_histogram,
+}
+
+
+def draw(kind, spec, fmt="png", figsize=(6, 4)):
+    """
+    Renders one chart to image bytes. The figure is not registered with
+    pyplot, so it is released as soon as this returns.
+    """
+    import matplotlib
+    from matplotlib.figure import Figure
+
+    if kind not in CHARTS:
+        raise ValueError(f"Unknown chart '{kind}'")
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown chart format '{fmt}'")
+    with matplotlib.rc_context(THEME):
+        fig = Figure(figsize=figsize)
+        try:
+            CHARTS[kind](fig.subplots(), **spec)
+            out = io.BytesIO()
+            fig.savefig(out, format=fmt, dpi=DPI, bbox_inches="tight")
+        finally:
+            fig.clear()
+    return out.getvalue()
+
+
+# ==============================
+# Cache
+# ==============================
+class ChartCache:
+    """
+    LRU of rendered charts. Keys hold the chart's aggregated inputs, so a new
+    dataset version produces new keys and stale charts age out.
+    """
+
+    def __init__(self, size=CACHE_SIZE):
+        self.size = size
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    def render(self, kind, spec, fmt="png", figsize=(6, 4)):
+        key = (kind, json.dumps(spec, sort_keys=True), fmt, tuple(figsize))
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+        image = draw(kind, spec, fmt, figsize)
+        with self._lock:
+            self._cache[key] = image
+            if len(self._cache) > self.size:
+                self._cache.popitem(last=False)
+        return image
+
+
+@lru_cache(maxsize=None)
+def get_chart_cache():
+    return ChartCache()
+
+
+def render_chart(kind, spec, fmt="png", figsize=(6, 4)):
+    return get_chart_cache().render(kind, spec, fmt, figsize)
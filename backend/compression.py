@@ -0,0 +1,138 @@
+"""
+HTTP Compression
+Content-Encoding in both directions:
+  * requests   gzip or zstd bodies are inflated before Flask parses them,
+               refusing bodies that inflate past MAX_INFLATED_BYTES
+  * responses  compressible bodies of at least MIN_RESPONSE_BYTES are sent
+               gzip- or zstd-encoded, whichever the client's Accept-Encoding
+               prefers; streamed responses are encoded chunk by chunk as they
+               are produced
+zstd needs the zstandard package; without it only gzip is offered.
+"""
+
+import gzip
+import io
+import zlib
+
+from flask import Response, request
+
+try:
+    import zstandard
+except ImportError:  # zstd is optional; gzip always works
+    zstandard = None
+
+# Largest request body accepted after decompression
+MAX_INFLATED_BYTES = 64 * 1024 * 1024
+
+# Smaller buffered responses are sent as-is
+MIN_RESPONSE_BYTES = 1024
+# Per-request CPU matters more than the last few percent of size: gzip level
+# 6 took 5x longer than level 1 on a 1 MB comparison for 9% fewer bytes
+GZIP_LEVEL = 1
+ZSTD_LEVEL = 3
+
+# Parquet, Arrow IPC and PNG bodies are compressed already
+COMPRESSIBLE_TYPES = ("application/json", "application/geo+json", "text/csv", "text/plain", "text/html")
+
+
+def _gzip_encoder():
+    return zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)
+
+
+def _zstd_encoder():
+    return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compressobj()
+
+
+def _gzip_inflate(body, limit):
+    with gzip.GzipFile(fileobj=io.BytesIO(body)) as f:
+        return f.read(limit)
+
+
+def _zstd_inflate(body, limit):
+    with zstandard.ZstdDecompressor().stream_reader(io.BytesIO(body)) as f:
+        return f.read(limit)
+
+
+# Server preference order
+ENCODERS = {"gzip": _gzip_encoder}
+DECODERS = {"gzip": _gzip_inflate}
+INFLATE_ERRORS = (OSError, EOFError, zlib.error)
+if zstandard is not None:
+    ENCODERS = {"zstd": _zstd_encoder, **ENCODERS}
+    DECODERS["zstd"] = _zstd_inflate
+    INFLATE_ERRORS += (zstandard.ZstdError,)
+
+
+# ==============================
+# Request Bodies
+# ==============================
+
+class DecompressRequests:
+    """
+    WSGI middleware that inflates `Content-Encoding: gzip` / `zstd` request
+    bodies before Flask parses them. Other encodings get a 415.
+    """
+
+    def __init__(self, wsgi_app):
+        self.wsgi_app = wsgi_app
+
+    def __call__(self, environ, start_response):
+        encoding = environ.get("HTTP_CONTENT_ENCODING", "").strip().lower()
+        if encoding in ("", "identity"):
+            return self.wsgi_app(environ, start_response)
+        if encoding not in DECODERS:
+            return Response(f"Unsupported Content-Encoding '{encoding}'", status=415,
+                            headers={"Accept-Encoding": ", ".join(DECODERS)})(environ, start_response)
+
+        length = int(environ.get("CONTENT_LENGTH") or 0)
+        try:
+            data = DECODERS[encoding](environ["wsgi.input"].read(length), MAX_INFLATED_BYTES + 1)
+        except INFLATE_ERRORS:
+            return Response(f"Invalid {encoding} request body", status=400)(environ, start_response)
+        if len(data) > MAX_INFLATED_BYTES:
+            return Response("Request body too large", status=413)(environ, start_response)
+        environ["wsgi.input"] = io.BytesIO(data)
+        environ["CONTENT_LENGTH"] = str(len(data))
+        del environ["HTTP_CONTENT_ENCODING"]
+        return self.wsgi_app(environ, start_response)
+
+
+# ==============================
+# Responses
+# ==============================
+
+def _encode_stream(chunks, encoder):
+    for chunk in chunks:
+        data = encoder.compress(chunk)
+        if data:
+            yield data
+    yield encoder.flush()
+
+
+def compress_response(response):
+    """
+    Flask after_request hook: encodes the response with the best encoding
+    the client accepts, when it is worth compressing.
+    """
+    if response.mimetype not in COMPRESSIBLE_TYPES:
+        return response
+    response.vary.add("Accept-Encoding")
+    if (request.method == "HEAD" or response.status_code < 200 or response.status_code in (204, 304)
+            or response.direct_passthrough or "Content-Encoding" in response.headers):
+        return response
+
+    encoding = request.accept_encodings.best_match(list(ENCODERS))
+    if encoding is None:
+        return response
+
+    if response.is_streamed:
+        response.response = _encode_stream(response.iter_encoded(), ENCODERS[encoding]())
+        response.headers.pop("Content-Length", None)
+    else:
+        data = response.get_data()
+        if len(data) < MIN_RESPONSE_BYTES:
+            return response
+        encoder = ENCODERS[encoding]()
+        response.set_data(encoder.compress(data) + encoder.flush())
+    response.headers["Content-Encoding"] = encoding
+    return response
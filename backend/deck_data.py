@@ -0,0 +1,106 @@
+"""
+3D Map Layer Data
+Builds the pydeck layers' data once from the plot records as shared columns,
+then gives each layer only the fields it reads, under short keys and with
+quantized numbers. Streamlit ships pydeck layers as JSON (deck.gl binary
+attributes are only available to the Jupyter widget), so the payload is kept
+small by never serializing columns a layer does not use, and by keeping each
+row flat (pydeck pretty-prints the JSON, so every nested array costs lines).
+"""
+
+import numpy as np
+
+from scoring import risk_bands
+
+# Band colors, ordered High, Moderate, Low
+RISK_BAND_COLORS = [[239, 68, 68], [245, 158, 11], [34, 197, 94]]
+
+# Layer -> fields it reads (accessors and tooltip)
+LAYER_FIELDS = {
+    "column": ("x", "y", "e", "b", "id", "risk", "status"),
+    "scatter": ("x", "y", "r", "b", "id", "risk", "enc", "status"),
+    "heatmap": ("x", "y", "e"),
+    "text": ("x", "y", "label"),
+}
+
+POSITION = "[x, y]"
+# Decimal places kept on coordinates (~1 m)
+COORD_DECIMALS = 5
+
+
+def band_color(alpha):
+    """
+    deck.gl accessor expression mapping the row's risk band `b` to its color.
+    """
+    high, moderate, low = ([*rgb, alpha] for rgb in RISK_BAND_COLORS)
+    return f"b == 0 ? {high} : b == 1 ? {moderate} : {low}"
+
+
+# Arcs connect each high-risk plot to its next two high-risk neighbours
+ARC_RISK_BELOW = 60
+ARC_NEIGHBOURS = 2
+
+
+def _column(plots, attr):
+    return np.array([np.nan if getattr(p, attr) is None else getattr(p, attr) for p in plots], dtype=float)
+
+
+class LayerData:
+    """
+    Shared columns for every layer of the 3D map, computed once per dataset.
+    """
+
+    def __init__(self, plots):
+        self.size = len(plots)
+        lat = _column(plots, "lat")
+        lon = _column(plots, "lon")
+        self.risk = _column(plots, "risk_score")
+        self.encroached = np.nan_to_num(_column(plots, "encroached_area"))
+        self.located = ~(np.isnan(lat) | np.isnan(lon))
+        self.center = (float(np.nanmean(lat)), float(np.nanmean(lon))) if self.located.any() else (21.25, 81.63)
+
+        risk = np.nan_to_num(self.risk, nan=50.0)
+        elevation = ((100 - risk) * 30).astype(int).tolist()
+        radius = np.clip(self.encroached * 2, 80, 600).astype(int).tolist()
+        encroached = np.round(self.encroached, 1).tolist()
+
+        ids = [p.plot_id for p in plots]
+        scores = ["?" if p.risk_score is None else p.risk_score for p in plots]
+        self.columns = {
+            "x": np.round(lon, COORD_DECIMALS).tolist(),
+            "y": np.round(lat, COORD_DECIMALS).tolist(),
+            "b": risk_bands(risk).tolist(),
+            "e": elevation,
+            "r": radius,
+            "id": ids,
+            "risk": scores,
+            "enc": encroached,
+            "status": [p.status for p in plots],
+            "label": [f"{i} [{s}]" for i, s in zip(ids, scores)],
+        }
+        self._records = {}
+
+    def records(self, layer):
+        """
+        Row objects for `layer` with only its fields; built once per layer.
+        """
+        if layer not in self._records:
+            if layer == "arc":
+                self._records[layer] = self._arcs()
+            else:
+                rows = np.flatnonzero(self.located)
+                if layer == "heatmap" and (self.encroached[rows] > 0).any():
+                    rows = rows[self.encroached[rows] > 0]
+                fields = LAYER_FIELDS[layer]
+                columns = [self.columns[f] for f in fields]
+                self._records[layer] = [dict(zip(fields, (col[i] for col in columns))) for i in rows.tolist()]
+        return self._records[layer]
+
+    def _arcs(self):
+        risky = np.flatnonzero(self.located & (np.nan_to_num(self.risk, nan=100.0) < ARC_RISK_BELOW)).tolist()
+        x, y = self.columns["x"], self.columns["y"]
+        return [
+            {"sx": x[risky[i]], "sy": y[risky[i]], "tx": x[risky[j]], "ty": y[risky[j]]}
+            for i in range(len(risky))
+            for j in range(i + 1, min(i + 1 + ARC_NEIGHBOURS, len(risky)))
+        ]
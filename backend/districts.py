@@ -0,0 +1,90 @@
+"""
+District Assignment
+Assigns district, tehsil and industrial area to plots by point-in-polygon
+against local boundary polygons. All plot locations are matched in one bulk
+STRtree query per level, and the result is cached on each record.
+"""
+
+import json
+import os
+from functools import lru_cache
+
+import numpy as np
+import shapely
+
+BOUNDARIES_PATH = os.environ.get(
+    "BOUNDARIES_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "boundaries", "chhattisgarh.geojson"),
+)
+
+# Boundary levels, each also a records.PlotRecord attribute
+LEVELS = ("district", "tehsil", "industrial_area")
+UNASSIGNED = "Unassigned"
+
+
+class BoundaryIndex:
+    """
+    One STRtree per boundary level, built once from a GeoJSON FeatureCollection
+    whose features carry `level` and `name` properties.
+    """
+
+    def __init__(self, features):
+        self.names = {}
+        self.trees = {}
+        for level in LEVELS:
+            selected = [f for f in features if f["properties"].get("level") == level]
+            self.names[level] = np.array([f["properties"]["name"] for f in selected] + [UNASSIGNED], dtype=object)
+            self.trees[level] = shapely.STRtree(shapely.from_geojson([json.dumps(f["geometry"]) for f in selected]))
+
+    def district_names(self):
+        return sorted(set(self.names["district"][:-1]))
+
+    def locate(self, lon, lat):
+        """
+        Names per level for every (lon, lat) pair; NaN coordinates and points
+        outside every boundary get UNASSIGNED.
+        """
+        points = shapely.points(np.asarray(lon, dtype=float), np.asarray(lat, dtype=float))
+        result = {}
+        for level, tree in self.trees.items():
+            names = self.names[level]
+            # Index of the matching boundary per point; the last slot is UNASSIGNED
+            hits = np.full(len(points), len(names) - 1)
+            point_idx, tree_idx = tree.query(points, predicate="within")
+            # Where boundaries overlap, the first one in the file wins
+            np.minimum.at(hits, point_idx, tree_idx)
+            result[level] = names[hits]
+        return result
+
+
+def load_boundaries(path=BOUNDARIES_PATH):
+    with open(path, encoding="utf-8") as f:
+        return BoundaryIndex(json.load(f)["features"])
+
+
+@lru_cache(maxsize=None)
+def get_boundaries(path=BOUNDARIES_PATH):
+    return load_boundaries(path)
+
+
+def assign_districts(plots_data, index=None):
+    """
+    Fills district/tehsil/industrial_area on records that don't have a
+    district yet, using their lat/lon. Records keep the assignment, so repeat
+    calls only locate new plots.
+    """
+    pending = [p for p in plots_data if p.district is None]
+    if not pending:
+        return plots_data
+
+    index = index or get_boundaries()
+    lon = np.array([np.nan if p.lon is None else p.lon for p in pending], dtype=float)
+    lat = np.array([np.nan if p.lat is None else p.lat for p in pending], dtype=float)
+    located = index.locate(lon, lat)
+    for level in LEVELS:
+        for plot, name in zip(pending, located[level].tolist()):
+            setattr(plot, level, name)
+    return plots_data
+
+
+DISTRICTS = get_boundaries().district_names()
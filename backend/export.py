@@ -0,0 +1,133 @@
+"""
+Inspection Exports
+GeoParquet, Arrow IPC and CSV writers that stream the inspection store one
+batch at a time. Geometries are written as WKB columns; binary chunks are
+zstd-compressed and every chunk is yielded as soon as it is encoded.
+"""
+
+import csv
+import io
+import json
+from datetime import datetime
+
+from store import COLUMNS, GEOMETRY_COLUMNS, METRIC_COLUMNS, TIMESTAMP_FORMAT
+
+EXPORT_BATCH_ROWS = 50_000
+
+ARROW_TYPES = {"TEXT": "string", "INTEGER": "int64", "REAL": "float64"}
+
+
+class _ChunkSink:
+    """
+    Write-only file object that buffers encoded bytes until the exporter
+    drains them, so output leaves memory after every row group.
+    """
+
+    def __init__(self):
+        self._chunks = []
+        self._position = 0
+        self.closed = False
+
+    def write(self, data):
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._position
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def drain(self):
+        chunk = b"".join(self._chunks)
+        self._chunks = []
+        return chunk
+
+
+def inspection_schema():
+    import pyarrow as pa
+
+    fields = [pa.field("id", pa.int64())]
+    for column, sql_type, _ in METRIC_COLUMNS:
+        if column == "ts":
+            fields.append(pa.field("ts", pa.timestamp("s")))
+        else:
+            fields.append(pa.field(column, getattr(pa, ARROW_TYPES[sql_type])()))
+    fields.extend(pa.field(g, pa.binary()) for g in GEOMETRY_COLUMNS)
+
+    # GeoParquet 1.0 column metadata; omitted CRS means OGC:CRS84 (lon/lat WGS 84)
+    geo = {
+        "version": "1.0.0",
+        "primary_column": "current",
+        "columns": {g: {"encoding": "WKB", "geometry_types": []} for g in GEOMETRY_COLUMNS},
+    }
+    return pa.schema(fields, metadata={"geo": json.dumps(geo)})
+
+
+def _record_batches(store, schema, batch_size, filters):
+    import pyarrow as pa
+
+    for rows in store.iter_batches(COLUMNS, batch_size, **filters):
+        columns = list(zip(*rows))
+        arrays = [pa.array(values, type=field.type) for values, field in zip(columns, schema)]
+        yield pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def iter_geoparquet(store, batch_size=EXPORT_BATCH_ROWS, **filters):
+    """
+    Yields a GeoParquet file as byte chunks, one row group per store batch.
+    """
+    import pyarrow.parquet as pq
+
+    schema = inspection_schema()
+    sink = _ChunkSink()
+    with pq.ParquetWriter(sink, schema, compression="zstd") as writer:
+        for batch in _record_batches(store, schema, batch_size, filters):
+            writer.write_batch(batch, row_group_size=batch_size)
+            yield sink.drain()
+    yield sink.drain()
+
+
+def iter_arrow_ipc(store, batch_size=EXPORT_BATCH_ROWS, **filters):
+    """
+    Yields an Arrow IPC (Feather v2) file as byte chunks, one record batch at a time.
+    """
+    import pyarrow as pa
+
+    schema = inspection_schema()
+    sink = _ChunkSink()
+    options = pa.ipc.IpcWriteOptions(compression="zstd")
+    with pa.ipc.new_file(sink, schema, options=options) as writer:
+        for batch in _record_batches(store, schema, batch_size, filters):
+            writer.write_batch(batch)
+            yield sink.drain()
+    yield sink.drain()
+
+
+def iter_csv(store, batch_size=EXPORT_BATCH_ROWS, **filters):
+    """
+    Yields the inspection history as CSV text chunks (metrics only, dashboard
+    column names), one chunk per store batch.
+    """
+    columns = [c for c, _, _ in METRIC_COLUMNS]
+    ts_index = columns.index("ts")
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    writer.writerow([label for _, _, label in METRIC_COLUMNS])
+    for rows in store.iter_batches(columns, batch_size, **filters):
+        for row in rows:
+            row = list(row)
+            if row[ts_index] is not None:
+                row[ts_index] = datetime.fromtimestamp(row[ts_index]).strftime(TIMESTAMP_FORMAT)
+            writer.writerow(row)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
@@ -0,0 +1,234 @@
+"""
+Compliance Forecasting
+Monthly violation, compliance and revenue-risk series per district, built from
+the inspection store, and forecast with Holt's linear smoothing or a seasonal
+naive model. Every district and metric is fitted at once as rows of one
+matrix; fitted states are cached and rolled forward as new months close.
+"""
+
+import threading
+from datetime import datetime
+from functools import lru_cache
+
+import numpy as np
+
+METRICS = ("Violations", "Compliance %", "Revenue Risk")
+ALL_DISTRICTS = "All Districts"
+
+SEASON = 12
+ALPHAS = np.linspace(0.1, 0.9, 9)
+BETAS = np.array([0.0, 0.05, 0.1, 0.2, 0.3])
+# Closed months rolled forward on the cached parameters before a full refit
+REFIT_EVERY = 6
+
+HOLT, SEASONAL_NAIVE = 0, 1
+
+
+def month_index(month):
+    year, mon = map(int, month.split("-"))
+    return year * 12 + mon - 1
+
+
+def month_label(index):
+    return f"{index // 12:04d}-{index % 12 + 1:02d}"
+
+
+# ==============================
+# Monthly Series
+# ==============================
+class MonthlySeries:
+    """
+    One (districts x months) matrix per metric over a contiguous month range;
+    months without inspections count zero violations and have no compliance %.
+    """
+
+    def __init__(self, groups, months, values):
+        self.groups = list(groups)
+        self.months = list(months)
+        self.values = values
+
+    @classmethod
+    def from_rollups(cls, rows, until=None):
+        """
+        Builds the series from InspectionStore.monthly_rollups rows, keeping
+        months before `until` ("YYYY-MM", default: the current month) so only
+        closed months are fitted. A statewide "All Districts" row is prepended.
+        """
+        until = month_index(until or datetime.now().strftime("%Y-%m"))
+        rows = [r for r in rows if month_index(r[0]) < until]
+        if not rows:
+            return cls([ALL_DISTRICTS], [], {m: np.zeros((1, 0)) for m in METRICS})
+
+        districts = sorted({r[1] for r in rows})
+        first = month_index(rows[0][0])
+        months = [month_label(i) for i in range(first, until)]
+        row_of = {d: i + 1 for i, d in enumerate(districts)}
+
+        shape = (len(districts) + 1, len(months))
+        inspections, violations, revenue = np.zeros(shape), np.zeros(shape), np.zeros(shape)
+        for month, district, count, violated, risk in rows:
+            col = month_index(month) - first
+            inspections[row_of[district], col] = count
+            violations[row_of[district], col] = violated or 0
+            revenue[row_of[district], col] = risk or 0
+        for matrix in (inspections, violations, revenue):
+            matrix[0] = matrix[1:].sum(axis=0)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            compliance = np.where(inspections > 0, (inspections - violations) / inspections * 100, np.nan)
+        values = {"Violations": violations, "Compliance %": compliance, "Revenue Risk": revenue}
+        return cls([ALL_DISTRICTS] + districts, months, values)
+
+    def matrix(self):
+        """
+        All metrics stacked metric-major into one (metrics x districts, months) array.
+        """
+        return np.vstack([self.values[m] for m in METRICS])
+
+
+# ==============================
+# Vectorized Models
+# ==============================
+def _holt_pass(y, alpha, beta, level, trend, score_from=0):
+    """
+    Runs Holt's linear smoothing (error-correction form) over the columns of
+    `y`. Parameters and states broadcast, so a whole grid of (alpha, beta)
+    candidates is evaluated for every row in one pass. Missing observations
+    advance the state without an update.
+    """
+    sse = np.zeros(np.broadcast(alpha, level).shape)
+    for t in range(y.shape[-1]):
+        pred = level + trend
+        obs = y[..., t]
+        seen = ~np.isnan(obs)
+        err = np.where(seen, obs - pred, 0.0)
+        if t >= score_from:
+            sse = sse + err ** 2
+        level = pred + alpha * err
+        trend = trend + alpha * beta * err
+    return level, trend, sse
+
+
+def _seasonal_sse(y, score_from):
+    err = y[:, score_from:] - y[:, score_from - SEASON:y.shape[1] - SEASON]
+    return np.nansum(err ** 2, axis=1)
+
+
+def _initial_state(y):
+    seen = ~np.isnan(y)
+    first = np.where(seen.any(axis=1), seen.argmax(axis=1), 0)
+    level = np.nan_to_num(y[np.arange(len(y)), first])
+    return level, np.zeros(len(y))
+
+
+class FittedState:
+    __slots__ = ("groups", "first_month", "last_month", "alpha", "beta", "level",
+                 "trend", "model", "tail", "since_refit")
+
+
+class Forecaster:
+    """
+    Holds the fitted per-row state for the latest series. `update` refits the
+    smoothing parameters by grid search when districts change or every
+    REFIT_EVERY months, and otherwise only rolls the cached level/trend over
+    the newly closed months. Closed months never change (inspections are
+    timestamped on insert), so rolling forward is exact.
+    """
+
+    def __init__(self):
+        self.state = None
+        self._lock = threading.Lock()
+
+    def fit(self, series):
+        y = series.matrix()
+        alphas, betas = np.meshgrid(ALPHAS, BETAS, indexing="ij")
+        alphas, betas = alphas.reshape(-1, 1), betas.reshape(-1, 1)
+
+        level, trend = _initial_state(y)
+        seasonal = y.shape[1] >= 2 * SEASON
+        score_from = SEASON if seasonal else 1
+        levels, trends, sse = _holt_pass(y, alphas, betas, level, trend, score_from)
+        best = sse.argmin(axis=0)
+        rows = np.arange(len(y))
+
+        state = FittedState()
+        state.groups = list(series.groups)
+        state.first_month = series.months[0]
+        state.last_month = series.months[-1]
+        state.alpha = alphas[best, 0]
+        state.beta = betas[best, 0]
+        state.level = levels[best, rows]
+        state.trend = trends[best, rows]
+        state.model = np.full(len(y), HOLT)
+        if seasonal:
+            state.model[_seasonal_sse(y, score_from) < sse[best, rows]] = SEASONAL_NAIVE
+        state.tail = y[:, -SEASON:]
+        state.since_refit = 0
+        return state
+
+    def update(self, series):
+        if not series.months:
+            return None
+        with self._lock:
+            state = self.state
+            stale = (
+                state is None
+                or state.groups != series.groups
+                or state.first_month != series.months[0]
+                or month_index(series.months[-1]) < month_index(state.last_month)
+            )
+            if stale:
+                self.state = self.fit(series)
+                return self.state
+
+            new = month_index(series.months[-1]) - month_index(state.last_month)
+            if new == 0:
+                return state
+            if state.since_refit + new >= REFIT_EVERY:
+                self.state = self.fit(series)
+                return self.state
+
+            y = series.matrix()[:, -new:]
+            state.level, state.trend, _ = _holt_pass(y, state.alpha, state.beta, state.level, state.trend)
+            state.tail = np.hstack([state.tail, y])[:, -SEASON:]
+            state.last_month = series.months[-1]
+            state.since_refit += new
+            return state
+
+    def forecast(self, horizon=3):
+        """
+        {metric: (districts, horizon) array} for the months after the last
+        closed month, plus those month labels.
+        """
+        state = self.state
+        if state is None:
+            return {}, []
+        steps = np.arange(1, horizon + 1)
+        values = state.level[:, None] + state.trend[:, None] * steps
+        if state.tail.shape[1] == SEASON:
+            seasonal = state.tail[:, (steps - 1) % SEASON]
+            values = np.where((state.model == SEASONAL_NAIVE)[:, None], seasonal, values)
+
+        n = len(state.groups)
+        result = {}
+        for i, metric in enumerate(METRICS):
+            block = values[i * n:(i + 1) * n]
+            result[metric] = np.clip(block, 0, 100) if metric == "Compliance %" else np.maximum(block, 0)
+        start = month_index(state.last_month) + 1
+        return result, [month_label(start + h) for h in range(horizon)]
+
+
+@lru_cache(maxsize=None)
+def get_forecaster():
+    return Forecaster()
+
+
+def district_forecast(store, horizon=3, until=None):
+    """
+    Monthly history and forecasts for every district from the inspection store.
+    """
+    series = MonthlySeries.from_rollups(store.monthly_rollups(), until)
+    forecaster = get_forecaster()
+    forecaster.update(series)
+    predicted, months = forecaster.forecast(horizon) if series.months else ({}, [])
+    return series, predicted, months
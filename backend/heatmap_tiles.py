@@ -0,0 +1,231 @@
+"""
+Heatmap Tiles
+Server-side violation heatmap as 256px Web Mercator PNG tiles. Plot risk
+weights are binned per tile, smoothed with a Gaussian kernel and colorized
+with utils.severity_heatmap, so the browser fetches a handful of tiles
+instead of every plot. Tiles are cached per dataset version, and can be
+scoped to row-id ranges (one dashboard session's plots).
+"""
+
+import math
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+
+import numpy as np
+
+from store import DB_PATH, get_store
+from utils import severity_heatmap
+
+TILE_SIZE = 256
+MAX_ZOOM = 19
+MAX_LATITUDE = 85.05112878
+
+# Kernel reach in screen pixels, like the old HeatmapLayer's radiusPixels
+RADIUS_PIXELS = 40
+SIGMA = RADIUS_PIXELS / 3
+# Cells below this share of the ramp stay transparent
+THRESHOLD = 0.05
+OPACITY = 0.7
+
+SYNC_BATCH_ROWS = 200_000
+CACHE_SIZE = 512
+# Scopes longer than this don't fit a tile URL; callers draw the heatmap
+# client-side instead
+MAX_SCOPE_RANGES = 64
+SCOPE_CACHE_SIZE = 32
+
+
+def mercator(lon, lat):
+    """
+    Normalized Web Mercator coordinates in [0, 1) for lon/lat arrays.
+    """
+    lon = np.asarray(lon, dtype=float)
+    lat = np.clip(np.asarray(lat, dtype=float), -MAX_LATITUDE, MAX_LATITUDE)
+    x = (lon + 180.0) / 360.0
+    y = (1.0 - np.log(np.tan(np.radians(lat)) + 1.0 / np.cos(np.radians(lat))) / math.pi) / 2.0
+    return x, y
+
+
+def row_ranges(row_ids):
+    """
+    Tile scope for a set of store row ids: "first-last" ranges of
+    consecutive ids joined by commas ("1-20,57,90-99"), or None when the ids
+    need more than MAX_SCOPE_RANGES ranges.
+    """
+    ranges = []
+    for row_id in sorted(set(row_ids)):
+        if ranges and row_id == ranges[-1][1] + 1:
+            ranges[-1][1] = row_id
+        else:
+            ranges.append([row_id, row_id])
+    if len(ranges) > MAX_SCOPE_RANGES:
+        return None
+    return ",".join(str(a) if a == b else f"{a}-{b}" for a, b in ranges)
+
+
+def parse_row_ranges(spec):
+    """
+    ((first, last), ...) row-id ranges of a row_ranges() scope. Raises
+    ValueError for a malformed scope.
+    """
+    ranges = []
+    for part in spec.split(","):
+        first, _, last = part.partition("-")
+        first, last = int(first), int(last or first)
+        if first > last:
+            raise ValueError(f"Empty row range '{part}'")
+        ranges.append((first, last))
+    if len(ranges) > MAX_SCOPE_RANGES:
+        raise ValueError(f"At most {MAX_SCOPE_RANGES} row ranges per tile")
+    return tuple(sorted(ranges))
+
+
+def _kernel_peak():
+    """
+    Peak of the smoothed grid for a single unit-weight point.
+    """
+    import cv2
+
+    size = 2 * RADIUS_PIXELS + 1
+    grid = np.zeros((size, size), dtype=np.float32)
+    grid[RADIUS_PIXELS, RADIUS_PIXELS] = 1.0
+    return float(cv2.GaussianBlur(grid, (size, size), SIGMA).max())
+
+
+class HeatmapTiles:
+    """
+    Mirrors plot locations and weights from the inspection store (append-only,
+    synced incrementally by row id) and renders tiles on demand. Weights are
+    100 - risk score over plots with encroachment, falling back to every plot
+    when none are encroached; both within the tile's row scope, if any.
+    """
+
+    def __init__(self, store):
+        self.store = store
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self._peak = _kernel_peak()
+        self._reset()
+
+    def _reset(self):
+        self.version = 0
+        self._ids = np.empty(0, dtype=np.int64)
+        self._x = np.empty(0)
+        self._y = np.empty(0)
+        self._weight = np.empty(0)
+        self._encroached = np.empty(0, dtype=bool)
+        # Heat points and per-zoom scales of each row scope (None: every plot)
+        self._layers = OrderedDict()
+
+    def sync(self):
+        latest = self.store.last_id()
+        if latest == self.version:
+            return self.version
+        if latest < self.version:
+            # The store file was replaced; mirror it from scratch
+            self._reset()
+        row_ids, xs, ys, weights, encroached = [self._ids], [self._x], [self._y], [self._weight], [self._encroached]
+        columns = ["id", "lat", "lon", "risk_score", "encroached_area"]
+        for rows in self.store.iter_batches(columns, SYNC_BATCH_ROWS, after_id=self.version):
+            ids, lat, lon, risk, enc = (np.array(c, dtype=float) for c in zip(*rows))
+            located = ~(np.isnan(lat) | np.isnan(lon))
+            x, y = mercator(lon[located], lat[located])
+            row_ids.append(ids[located].astype(np.int64))
+            xs.append(x)
+            ys.append(y)
+            weights.append(np.clip(100 - np.nan_to_num(risk[located], nan=100.0), 0, 100))
+            encroached.append(np.nan_to_num(enc[located]) > 0)
+            self.version = int(ids[-1])
+        self._ids, self._x, self._y = np.concatenate(row_ids), np.concatenate(xs), np.concatenate(ys)
+        self._weight, self._encroached = np.concatenate(weights), np.concatenate(encroached)
+        self._layers.clear()
+        self._cache.clear()
+        return self.version
+
+    def _layer(self, rows):
+        """
+        (points, scales) of row scope `rows`. Points are the (x, y, weight)
+        of the plots on the heatmap, sorted by x so each tile selects its
+        column with a binary search; scales fill in per zoom.
+        """
+        if rows in self._layers:
+            self._layers.move_to_end(rows)
+            return self._layers[rows]
+        scope = np.ones(len(self._x), dtype=bool)
+        if rows is not None:
+            # Ids are mirrored in ascending order, so each range is one slice
+            scope[:] = False
+            for first, last in rows:
+                scope[np.searchsorted(self._ids, first):np.searchsorted(self._ids, last, side="right")] = True
+        encroached = scope & self._encroached
+        mask = encroached if encroached.any() else scope
+        order = np.argsort(self._x[mask], kind="stable")
+        layer = ((self._x[mask][order], self._y[mask][order], self._weight[mask][order]), {})
+        self._layers[rows] = layer
+        if len(self._layers) > SCOPE_CACHE_SIZE:
+            self._layers.popitem(last=False)
+        return layer
+
+    def _scale(self, layer, z):
+        """
+        Smoothed density that maps to the top of the color ramp at zoom `z`:
+        the heaviest kernel-sized cell anywhere on the map, spread over the
+        cell. Every tile at a zoom shares it, so tiles join seamlessly.
+        """
+        (px, py, weight), scales = layer
+        if z not in scales:
+            cells = TILE_SIZE * 2 ** z / RADIUS_PIXELS
+            keys = np.floor(px * cells).astype(np.int64) * (int(cells) + 1) + np.floor(py * cells).astype(np.int64)
+            _, inverse = np.unique(keys, return_inverse=True)
+            heaviest = np.bincount(inverse, weights=weight).max() if len(keys) else 0.0
+            # Never brighter than one max-weight plot standing alone
+            scales[z] = max(heaviest / RADIUS_PIXELS ** 2, 100 * self._peak)
+        return scales[z]
+
+    def render(self, z, x, y, rows=None):
+        """
+        PNG bytes of tile z/x/y for the current dataset version, drawn from
+        every plot or only those in `rows` (parse_row_ranges() ranges).
+        """
+        with self._lock:
+            version = self.sync()
+            key = (version, rows, z, x, y)
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+            tile = self._render(self._layer(rows), z, x, y)
+            self._cache[key] = tile
+            if len(self._cache) > CACHE_SIZE:
+                self._cache.popitem(last=False)
+            return tile
+
+    def _render(self, layer, z, x, y):
+        import cv2
+
+        px, py, weight = layer[0]
+        scale = TILE_SIZE * 2 ** z
+        pad = RADIUS_PIXELS
+        size = TILE_SIZE + 2 * pad
+
+        # Points within the tile plus the kernel's reach on every side
+        lo, hi = np.searchsorted(px, [(x * TILE_SIZE - pad) / scale, ((x + 1) * TILE_SIZE + pad) / scale])
+        col = np.floor(px[lo:hi] * scale - x * TILE_SIZE + pad).astype(np.int64)
+        row = np.floor(py[lo:hi] * scale - y * TILE_SIZE + pad).astype(np.int64)
+        inside = (row >= 0) & (row < size) & (col >= 0) & (col < size)
+
+        grid = np.zeros((size, size), dtype=np.float32)
+        np.add.at(grid, (row[inside], col[inside]), weight[lo:hi][inside])
+        if grid.any():
+            grid = cv2.GaussianBlur(grid, (2 * pad + 1, 2 * pad + 1), SIGMA)
+        level = np.clip(grid[pad:-pad, pad:-pad] / self._scale(layer, z), 0, 1)
+
+        heatmap, _ = severity_heatmap((level * 255).astype(np.uint8), None)
+        alpha = np.where(level >= THRESHOLD, np.sqrt(level) * OPACITY * 255, 0).astype(np.uint8)
+        ok, png = cv2.imencode(".png", np.dstack([heatmap, alpha]))
+        return png.tobytes()
+
+
+@lru_cache(maxsize=None)
+def get_heatmap_tiles(path=DB_PATH):
+    return HeatmapTiles(get_store(path))
@@ -0,0 +1,358 @@
+"""
+Request Payloads
+Typed decoding of API request bodies. msgspec validates the JSON and the
+request shape in one pass and keeps each geometry's coordinates as raw JSON
+text. The coordinates of every geometry in a request are then checked and
+parsed in one vectorized pass over their bytes and built with
+shapely.from_ragged_array, without nested Python lists per vertex.
+Geometry routes also take WKB (raw or hex) and FlatGeobuf bodies, chosen by
+Content-Type and decoded in bulk with shapely.from_wkb.
+Requests with more than MAX_VERTICES positions are refused (413) before any
+coordinate is parsed.
+"""
+
+import binascii
+import os
+
+import msgspec
+import numpy as np
+import shapely
+
+MAX_VERTICES = int(os.environ.get("MAX_REQUEST_VERTICES", 250_000))
+
+_WHITESPACE = b" \t\r\n"
+_COORDINATE_BYTES = b"0123456789.-+eE,[]"
+_OPEN, _CLOSE, _COMMA = ord("["), ord("]"), ord(",")
+_FLOATS = msgspec.json.Decoder(list[float])
+
+
+class PayloadError(ValueError):
+    """
+    A request body that cannot be decoded; `status` is the HTTP status to
+    answer with.
+    """
+
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.status = status
+
+
+# ==============================
+# Request Types
+# ==============================
+
+class Polygon(msgspec.Struct, tag=True, tag_field="type"):
+    coordinates: msgspec.Raw
+
+
+class MultiPolygon(msgspec.Struct, tag=True, tag_field="type"):
+    coordinates: msgspec.Raw
+
+
+Geometry = Polygon | MultiPolygon
+
+# Nesting depth of each geometry's coordinates, and its shapely type
+_LAYOUTS = {
+    Polygon: (3, shapely.GeometryType.POLYGON),
+    MultiPolygon: (4, shapely.GeometryType.MULTIPOLYGON),
+}
+
+
+class BoundaryParams(msgspec.Struct):
+    plot_id: str | None = None
+    unused_percentage: float = 0
+    policy: str | None = None
+
+
+class BoundaryRequest(BoundaryParams, kw_only=True):
+    boundary: Geometry
+
+
+class CompareParams(msgspec.Struct):
+    tolerance_m2: int | float = 25
+
+
+class CompareRequest(CompareParams, kw_only=True):
+    reference: Geometry
+    current: Geometry
+
+
+class SurveyBoundary(msgspec.Struct):
+    id: str
+    geometry: Geometry
+
+
+class SurveyRequest(msgspec.Struct):
+    boundaries: list[SurveyBoundary]
+
+
+_decoders = {}
+
+
+def decode(body, request_type):
+    """
+    `body` (JSON bytes) decoded into a `request_type` struct.
+    """
+    decoder = _decoders.get(request_type)
+    if decoder is None:
+        decoder = _decoders[request_type] = msgspec.json.Decoder(request_type)
+    try:
+        return decoder.decode(body)
+    except msgspec.ValidationError as e:
+        raise PayloadError(str(e)) from None
+    except msgspec.DecodeError as e:
+        raise PayloadError(f"Invalid JSON: {e}") from None
+
+
+# ==============================
+# Coordinates
+# ==============================
+
+def vertex_count(geoms):
+    """
+    Upper bound on the positions in `geoms` (it also counts the brackets
+    opening rings and polygons), from the raw coordinate text alone.
+    """
+    return sum(bytes(g.coordinates).count(b"[") for g in geoms)
+
+
+def _parse_coordinates(text, depth, kind):
+    """
+    Coordinates and ragged offsets (innermost level first) of `depth`-deep
+    nested JSON coordinate arrays, as shapely.from_ragged_array takes them.
+    """
+    malformed = PayloadError(f"{kind} coordinates must be nested arrays of [lon, lat] positions")
+    text = text.translate(None, _WHITESPACE)
+    if text.translate(None, _COORDINATE_BYTES) or b"[]" in text:
+        raise malformed
+
+    # The text is valid JSON, so brackets balance. Structure is read from the
+    # brackets and commas alone; numbers fill the gaps between them and may
+    # only sit at the innermost level.
+    chars = np.frombuffer(text, dtype=np.uint8)
+    marks = np.flatnonzero((chars == _OPEN) | (chars == _CLOSE) | (chars == _COMMA))
+    kinds = chars[marks]
+    opens, closes, commas = kinds == _OPEN, kinds == _CLOSE, kinds == _COMMA
+    level = np.cumsum(opens.astype(np.int32) - closes)
+    if not (level[:-1][np.diff(marks) > 1] == depth).all():
+        raise malformed
+
+    # Every position holds the same number of values: lon, lat and an optional (dropped) elevation
+    starts = {d: np.flatnonzero(opens & (level == d)) for d in range(2, depth + 1)}
+    inner_commas = np.cumsum(commas & (level == depth))
+    ends = np.flatnonzero(closes & (level == depth - 1))
+    per_position = inner_commas[ends] - inner_commas[starts[depth]]
+    dims = int(per_position[0]) + 1
+    if dims not in (2, 3) or (per_position != dims - 1).any():
+        raise malformed
+
+    values = np.fromiter(_FLOATS.decode(b"[" + text.translate(None, b"[]") + b"]"), dtype=float, count=len(ends) * dims)
+    if not np.isfinite(values).all():
+        raise malformed
+    coords = np.ascontiguousarray(values.reshape(-1, dims)[:, :2])
+    if (np.abs(coords[:, 0]) > 180).any() or (np.abs(coords[:, 1]) > 90).any():
+        raise PayloadError(f"{kind} coordinates must be lon/lat in degrees")
+
+    offsets = tuple(
+        np.append(np.searchsorted(starts[d + 1], starts[d]), len(starts[d + 1]))
+        for d in range(depth - 1, 1, -1)
+    )
+
+    # Rings need three distinct positions; from_ragged_array closes open rings
+    closed = (coords[offsets[0][:-1]] == coords[offsets[0][1:] - 1]).all(axis=1)
+    if (np.diff(offsets[0]) + ~closed < 4).any():
+        raise PayloadError(f"{kind} rings need at least three distinct positions")
+    return coords, offsets
+
+
+def geometries(geoms):
+    """
+    Shapely geometries for decoded Polygon / MultiPolygon structs, in order.
+    Each geometry type is parsed and built in one bulk call.
+    """
+    count = vertex_count(geoms)
+    if count > MAX_VERTICES:
+        raise PayloadError(f"Geometry too large: {count:,} vertices (limit {MAX_VERTICES:,})", status=413)
+
+    result = np.empty(len(geoms), dtype=object)
+    for kind, (depth, geometry_type) in _LAYOUTS.items():
+        rows = [i for i, g in enumerate(geoms) if type(g) is kind]
+        if not rows:
+            continue
+        # All geometries of this type as one array, one level deeper
+        text = b"[" + b",".join(bytes(geoms[i].coordinates) for i in rows) + b"]"
+        coords, offsets = _parse_coordinates(text, depth + 1, kind.__name__)
+        result[rows] = shapely.from_ragged_array(geometry_type, coords, offsets)
+    return result
+
+
+# ==============================
+# Binary Bodies
+# ==============================
+
+WKB = "application/wkb"
+WKB_HEX = "application/wkb-hex"
+FLATGEOBUF = ("application/flatgeobuf", "application/vnd.flatgeobuf")
+BINARY_TYPES = (WKB, WKB_HEX, *FLATGEOBUF)
+
+# Smallest encoding of one 2D position, to bound the vertex count from the body size
+_POSITION_BYTES = {WKB: 16, WKB_HEX: 32}
+_BOUNDARY_TYPES = (shapely.GeometryType.POLYGON, shapely.GeometryType.MULTIPOLYGON)
+
+
+def _from_wkb(wkb):
+    try:
+        return shapely.from_wkb(wkb)
+    except (shapely.errors.ShapelyError, ValueError, TypeError) as e:
+        raise PayloadError(f"Invalid WKB: {e}") from None
+
+
+def _read_wkb_hex(body):
+    """
+    One hex WKB geometry per line, each optionally preceded by its id and
+    whitespace. Lines are unhexlified here; GEOS's own hex reader is several
+    times slower.
+    """
+    lines = [line.split() for line in body.splitlines() if line.strip()]
+    if all(len(line) == 1 for line in lines):
+        ids, hexes = None, [line[0] for line in lines]
+    elif all(len(line) == 2 for line in lines):
+        ids, hexes = [line[0].decode() for line in lines], [line[1] for line in lines]
+    else:
+        raise PayloadError("Hex WKB lines must all be '<hex>' or all be '<id> <hex>'")
+    try:
+        wkb = [binascii.unhexlify(h) for h in hexes]
+    except binascii.Error as e:
+        raise PayloadError(f"Invalid hex WKB: {e}") from None
+    return ids, _from_wkb(wkb)
+
+
+def _read_flatgeobuf(body):
+    """
+    Features of a FlatGeobuf file in EPSG:4326, with their `id` attribute
+    when the file has one.
+    """
+    if body[:3] != b"fgb":
+        raise PayloadError("Invalid FlatGeobuf body")
+    try:
+        from pyogrio.raw import read
+    except ImportError:  # FlatGeobuf bodies are optional; JSON and WKB always work
+        raise PayloadError("FlatGeobuf bodies need pyogrio on the server; post WKB or GeoJSON", status=415) from None
+    try:
+        meta, _, wkb, fields = read(body, force_2d=True)
+    except (RuntimeError, ValueError) as e:
+        raise PayloadError(f"Invalid FlatGeobuf body: {e}") from None
+    if meta["crs"] not in (None, "EPSG:4326", "OGC:CRS84"):
+        raise PayloadError(f"FlatGeobuf bodies must be in EPSG:4326, not {meta['crs']}")
+    names = list(meta["fields"])
+    ids = [str(i) for i in fields[names.index("id")]] if "id" in names else None
+    return ids, _from_wkb(wkb)
+
+
+def read_binary(body, content_type):
+    """
+    (ids or None, shapely geometries) from a WKB, hex WKB or FlatGeobuf body.
+    A raw WKB GeometryCollection holds one geometry per member. The vertex
+    limit is checked against the body size before anything is decoded.
+    """
+    estimate_vertices(body, content_type)
+    if content_type == WKB:
+        ids, geoms = None, _from_wkb([body])
+        if shapely.get_type_id(geoms[0]) == shapely.GeometryType.GEOMETRYCOLLECTION:
+            geoms = shapely.get_parts(geoms)
+    elif content_type == WKB_HEX:
+        ids, geoms = _read_wkb_hex(body)
+    else:
+        ids, geoms = _read_flatgeobuf(body)
+
+    if not np.isin(shapely.get_type_id(geoms), _BOUNDARY_TYPES).all() or shapely.is_empty(geoms).any():
+        raise PayloadError("Boundaries must be non-empty Polygon or MultiPolygon geometries")
+    geoms = shapely.force_2d(geoms)
+    bounds = shapely.bounds(geoms)
+    if (np.abs(bounds[:, [0, 2]]) > 180).any() or (np.abs(bounds[:, [1, 3]]) > 90).any():
+        raise PayloadError("Coordinates must be lon/lat in degrees")
+    return ids, geoms
+
+
+def _params(args, params_type):
+    try:
+        return msgspec.convert(args.to_dict(), params_type, strict=False)
+    except msgspec.ValidationError as e:
+        raise PayloadError(str(e)) from None
+
+
+# ==============================
+# Route Readers
+# ==============================
+# Each takes the raw body, its mimetype and the query string. JSON bodies
+# carry their own parameters; binary bodies (BINARY_TYPES) take them from
+# the query string. Any other content type is read as JSON.
+
+def estimate_vertices(body, content_type):
+    """
+    Upper bound on the positions in a request body, from its bytes alone:
+    one per "[" of a JSON body, or its size over the smallest encoding of a
+    position for binary bodies. Used to weigh a request before decoding it.
+    Raises PayloadError (413) when even the bound is over MAX_VERTICES.
+    """
+    if content_type not in BINARY_TYPES:
+        count = body.count(b"[")
+    else:
+        count = len(body) // _POSITION_BYTES.get(content_type, 16)
+    if count > MAX_VERTICES:
+        raise PayloadError(f"Geometry too large: up to {count:,} vertices (limit {MAX_VERTICES:,})", status=413)
+    return count
+
+
+def read_boundary(body, content_type, args):
+    """
+    (BoundaryParams, boundary) for /detect-builtup, /detect-encroachment and
+    /analyze.
+    """
+    if content_type not in BINARY_TYPES:
+        data = decode(body, BoundaryRequest)
+        boundary, = geometries([data.boundary])
+        return data, boundary
+    params = _params(args, BoundaryParams)
+    _, geoms = read_binary(body, content_type)
+    if len(geoms) != 1:
+        raise PayloadError(f"Expected one boundary geometry, got {len(geoms)}")
+    return params, geoms[0]
+
+
+def read_comparison(body, content_type, args):
+    """
+    (CompareParams, reference, current) for /compare-boundaries. Binary
+    bodies hold the reference then the current boundary, or two geometries
+    with ids `reference` and `current`.
+    """
+    if content_type not in BINARY_TYPES:
+        data = decode(body, CompareRequest)
+        reference, current = geometries([data.reference, data.current])
+        return data, reference, current
+    params = _params(args, CompareParams)
+    ids, geoms = read_binary(body, content_type)
+    if ids is not None:
+        by_id = dict(zip(ids, geoms))
+        if "reference" not in by_id or "current" not in by_id:
+            raise PayloadError("Expected geometries with ids 'reference' and 'current'")
+        return params, by_id["reference"], by_id["current"]
+    if len(geoms) != 2:
+        raise PayloadError(f"Expected reference and current geometries, got {len(geoms)}")
+    return params, geoms[0], geoms[1]
+
+
+def read_survey(body, content_type, args):
+    """
+    (ids, boundaries) for POST /registry/overlaps. Binary bodies without ids
+    of their own take them from a comma-separated `ids` query parameter.
+    """
+    if content_type not in BINARY_TYPES:
+        data = decode(body, SurveyRequest)
+        return [b.id for b in data.boundaries], geometries([b.geometry for b in data.boundaries])
+    ids, geoms = read_binary(body, content_type)
+    if ids is None:
+        ids = args["ids"].split(",") if args.get("ids") else []
+    if len(ids) != len(geoms):
+        raise PayloadError(f"Got {len(geoms)} boundaries but {len(ids)} ids")
+    return ids, geoms
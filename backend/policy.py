@@ -0,0 +1,270 @@
+"""
+Compliance Policy Engine
+Loads severity bands, recommendations and score deductions from JSON/YAML
+policy files, compiles each policy once into vectorized evaluators, and
+hot-reloads a policy when its file changes on disk.
+"""
+
+import json
+import os
+import threading
+import time
+from functools import lru_cache
+
+import numpy as np
+
+from scoring import classify_severity, recommend
+
+try:
+    import yaml
+except ImportError:  # YAML policies are optional; JSON always works
+    yaml = None
+
+
+POLICY_DIR = os.environ.get("POLICY_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "policies"))
+ACTIVE_POLICY = os.environ.get("ACTIVE_POLICY", "default")
+
+FIELDS = ("encroached", "built_pct", "unused_pct")
+OPERATORS = {
+    "gt": np.greater,
+    "ge": np.greater_equal,
+    "lt": np.less,
+    "le": np.less_equal,
+    "eq": np.equal,
+}
+
+
+# ==============================
+# Shared Inputs
+# ==============================
+class PolicyInputs:
+    """
+    Plot columns plus a memo of comparison masks, so policies evaluated
+    side by side share every identical condition.
+    """
+
+    def __init__(self, built_pct, encroached, unused_pct):
+        unused = np.asarray(unused_pct, dtype=float)
+        self.columns = {
+            "built_pct": np.broadcast_to(np.asarray(built_pct, dtype=float), unused.shape),
+            "encroached": np.asarray(encroached) > 0,
+            "unused_pct": unused,
+        }
+        self._masks = {}
+
+    def __len__(self):
+        return self.columns["unused_pct"].size
+
+    def mask(self, field, op, value):
+        key = (field, op, value)
+        if key not in self._masks:
+            self._masks[key] = OPERATORS[op](self.columns[field], value)
+        return self._masks[key]
+
+
+# ==============================
+# Compilation
+# ==============================
+def _compile_clause(clause):
+    """
+    A clause maps fields to {operator: value}; every comparison must hold.
+    """
+    atoms = []
+    for field, tests in clause.items():
+        if field not in FIELDS:
+            raise ValueError(f"Unknown policy field '{field}'")
+        for op, value in tests.items():
+            if op not in OPERATORS:
+                raise ValueError(f"Unknown policy operator '{op}'")
+            atoms.append((field, op, value))
+    return tuple(atoms)
+
+
+def _clause_mask(inputs, atoms):
+    mask = np.ones(len(inputs), dtype=bool)
+    for atom in atoms:
+        mask &= inputs.mask(*atom)
+    return mask
+
+
+class CompiledPolicy:
+    """
+    A policy spec turned into lookup tables for the scoring primitives and
+    precompiled deduction masks.
+    """
+
+    def __init__(self, spec, source=None):
+        self.spec = spec
+        self.name = spec["name"]
+        self.description = spec.get("description", "")
+        self.source = source
+
+        bands = sorted(spec["severity_bands"], key=lambda b: b["above"])
+        default_band = spec["default_band"]
+        self.edges = np.array([b["above"] for b in bands], dtype=float)
+        self.labels = np.array([default_band["label"]] + [b["label"] for b in bands], dtype=object)
+        self.band_risk = np.array([default_band["risk"]] + [b["risk"] for b in bands], dtype=np.int8)
+
+        recs = spec.get("recommendations", [])
+        fallback = spec["default_recommendation"]
+        size = int(max([*self.band_risk, *(r["risk"] for r in recs)])) + 1
+        self.actions = np.full(size, fallback["action"], dtype=object)
+        self.urgencies = np.full(size, fallback["urgency"], dtype=object)
+        for rec in recs:
+            self.actions[rec["risk"]] = rec["action"]
+            self.urgencies[rec["risk"]] = rec["urgency"]
+
+        score = spec["score"]
+        self.base = int(score.get("base", 100))
+        self.floor = int(score.get("floor", 0))
+        self.deductions = []
+        for rule in score.get("deductions", []):
+            when = _compile_clause(rule.get("when", {}))
+            any_of = tuple(_compile_clause(c) for c in rule.get("any", []))
+            self.deductions.append((rule.get("name", ""), int(rule["points"]), when, any_of))
+
+    def classify(self, inputs):
+        return classify_severity(inputs.columns["built_pct"], self.edges, self.band_risk)
+
+    def recommend(self, risk):
+        return recommend(risk, self.actions, self.urgencies)
+
+    def compliance_scores(self, inputs):
+        score = np.full(len(inputs), self.base, dtype=np.int16)
+        for _, points, when, any_of in self.deductions:
+            mask = _clause_mask(inputs, when)
+            if any_of:
+                hit = np.zeros(len(inputs), dtype=bool)
+                for atoms in any_of:
+                    hit |= _clause_mask(inputs, atoms)
+                mask &= hit
+            score -= mask * np.int16(points)
+        return np.maximum(score, self.floor)
+
+    def evaluate(self, inputs):
+        """
+        Severity, risk, recommendation and 0-100 compliance score per plot,
+        as aligned arrays.
+        """
+        codes, risk = self.classify(inputs)
+        actions, urgencies = self.recommend(risk)
+        return {
+            "severity_code": codes,
+            "severity": self.labels[codes],
+            "risk_score": risk,
+            "recommended_action": actions,
+            "urgency": urgencies,
+            "compliance_score": self.compliance_scores(inputs),
+        }
+
+    def score(self, built_pct, encroached, unused_pct):
+        return self.evaluate(PolicyInputs(built_pct, encroached, unused_pct))
+
+    def compliance(self, encroached, unused_pct, built_pct=np.nan):
+        """
+        0-100 scores only; without a built-up percentage the built-up rules never fire.
+        """
+        return self.compliance_scores(PolicyInputs(built_pct, encroached, unused_pct))
+
+
+def load_policy_file(path):
+    with open(path, encoding="utf-8") as f:
+        if path.endswith((".yaml", ".yml")):
+            if yaml is None:
+                raise RuntimeError("PyYAML is required for YAML policy files")
+            spec = yaml.safe_load(f)
+        else:
+            spec = json.load(f)
+    spec.setdefault("name", os.path.splitext(os.path.basename(path))[0])
+    return CompiledPolicy(spec, source=path)
+
+
+# ==============================
+# Engine (hot reload)
+# ==============================
+class PolicyEngine:
+    """
+    Keeps every policy in a directory compiled. Files are re-stat'ed at most
+    every `check_interval` seconds; changed files are recompiled in place,
+    so a policy edit takes effect without a restart.
+    """
+
+    EXTENSIONS = (".json", ".yaml", ".yml")
+
+    def __init__(self, directory=POLICY_DIR, check_interval=2.0):
+        self.directory = directory
+        self.check_interval = check_interval
+        self._policies = {}
+        self._mtimes = {}
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+        self.refresh(force=True)
+
+    def refresh(self, force=False):
+        now = time.monotonic()
+        if not force and now - self._checked_at < self.check_interval:
+            return
+        with self._lock:
+            self._checked_at = now
+            seen = set()
+            for fname in sorted(os.listdir(self.directory)):
+                if not fname.endswith(self.EXTENSIONS):
+                    continue
+                if fname.endswith((".yaml", ".yml")) and yaml is None:
+                    continue
+                path = os.path.join(self.directory, fname)
+                seen.add(path)
+                mtime = os.stat(path).st_mtime_ns
+                if self._mtimes.get(path) == mtime:
+                    continue
+                try:
+                    policy = load_policy_file(path)
+                except Exception as e:
+                    # Keep serving the last good version of a broken edit
+                    print(f"Policy {path} not reloaded: {e}")
+                    self._mtimes[path] = mtime
+                    continue
+                self._policies = {n: p for n, p in self._policies.items() if p.source != path}
+                self._policies[policy.name] = policy
+                self._mtimes[path] = mtime
+            for path in set(self._mtimes) - seen:
+                del self._mtimes[path]
+                self._policies = {n: p for n, p in self._policies.items() if p.source != path}
+
+    def names(self):
+        self.refresh()
+        return sorted(self._policies)
+
+    def get(self, name=None):
+        self.refresh()
+        name = name or ACTIVE_POLICY
+        if name not in self._policies:
+            raise KeyError(f"Unknown policy '{name}'")
+        return self._policies[name]
+
+    def compare(self, names, built_pct, encroached, unused_pct):
+        """
+        Evaluates several policies over the same plots in one pass; shared
+        conditions are computed once.
+        """
+        inputs = PolicyInputs(built_pct, encroached, unused_pct)
+        return {name: self.get(name).evaluate(inputs) for name in names}
+
+
+def summarize(result):
+    """
+    Per-policy what-if summary: plots per severity and score statistics.
+    """
+    labels, counts = np.unique(result["severity"].astype(str), return_counts=True)
+    scores = result["compliance_score"]
+    return {
+        "plots": int(scores.size),
+        "mean_score": round(float(scores.mean()), 2) if scores.size else 0.0,
+        "below_50": int((scores < 50).sum()),
+        "severity_counts": {str(l): int(c) for l, c in zip(labels, counts)},
+    }
+
+
+@lru_cache(maxsize=None)
+def get_engine():
+    return PolicyEngine()
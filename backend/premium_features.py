@@ -4,12 +4,10 @@ Premium Features Module — National-Level Hackathon Enhancements
 """
 
 import streamlit as st
-import pandas as pd
-import numpy as np
-import pydeck as pdk
-import plotly.graph_objects as go
-import random
-from datetime import datetime, timedelta
+from datetime import datetime
+
+# pandas, numpy, pydeck, plotly and the data modules are imported inside the
+# renderers that use them, so the theme and header helpers stay cheap to import.
 
 
 # ==============================
@@ -255,6 +253,8 @@ def render_premium_header(title, subtitle="", live=True):
 # Plotly Risk Gauge
 # ==============================
 def render_plotly_gauge(score, title="Compliance Risk Score"):
+    import plotly.graph_objects as go
+
     fig = go.Figure(go.Indicator(
         mode="gauge+number+delta",
         value=score,
@@ -289,60 +289,65 @@ def render_plotly_gauge(score, title="Compliance Risk Score"):
 # ==============================
 # 3D Map with PyDeck (Full Satellite + Multi-Layer)
 # ==============================
-def render_3d_map(plots_data):
+def render_3d_map(plots_data, heatmap_tiles_url=None, layer_data=None):
+    """
+    `heatmap_tiles_url` ({z}/{x}/{y} template): draw the violation heatmap
+    from server-rendered raster tiles instead of shipping every plot to the
+    browser for a client-side HeatmapLayer. `layer_data`: a prebuilt
+    deck_data.LayerData for `plots_data`.
+    """
+    import numpy as np
+    import pydeck as pdk
+    from deck_data import POSITION, LayerData, band_color
+    from scoring import risk_band_counts
+
     if len(plots_data) == 0:
         st.info("No plot data available. Generate demo data first.")
         return
 
-    df = pd.DataFrame(plots_data)
-    if "Lat" not in df.columns or "Lon" not in df.columns:
+    data = layer_data or LayerData(plots_data)
+    if not data.located.any():
         st.warning("Plot data missing coordinates.")
         return
 
-    # Compute visualization columns
-    df["elevation"] = df.get("Risk Score", pd.Series([50]*len(df))).apply(lambda x: (100 - x) * 30)
-    df["scatter_radius"] = df.get("Encroached Area", pd.Series([0]*len(df))).apply(lambda x: max(80, min(x * 2, 600)))
-    df["color_r"] = df.get("Risk Score", pd.Series([50]*len(df))).apply(lambda x: 239 if x < 50 else (245 if x < 80 else 34))
-    df["color_g"] = df.get("Risk Score", pd.Series([50]*len(df))).apply(lambda x: 68 if x < 50 else (158 if x < 80 else 197))
-    df["color_b"] = df.get("Risk Score", pd.Series([50]*len(df))).apply(lambda x: 68 if x < 50 else (11 if x < 80 else 94))
-    df["label"] = df.apply(lambda r: f"{r.get('Plot ID','')} [{r.get('Risk Score','?')}]", axis=1)
-
     # Satellite tile provider (open — no API key needed)
     SATELLITE_STYLE = "https://server.arcgisonline.com/ArcGIS/rest/services/World_Imagery/MapServer/tile/{z}/{y}/{x}"
 
     # --- LAYERS ---
+    # Each layer gets only the fields it reads (see deck_data.LAYER_FIELDS)
     # 3D Column Layer
     column_layer = pdk.Layer(
-        "ColumnLayer", data=df,
-        get_position=["Lon", "Lat"], get_elevation="elevation",
+        "ColumnLayer", data=data.records("column"),
+        get_position=POSITION, get_elevation="e",
         elevation_scale=1, radius=200,
-        get_fill_color=["color_r", "color_g", "color_b", 200],
+        get_fill_color=band_color(200),
         pickable=True, auto_highlight=True,
     )
 
     # Scatter Plot Layer (sized by encroachment)
     scatter_layer = pdk.Layer(
-        "ScatterplotLayer", data=df,
-        get_position=["Lon", "Lat"],
-        get_radius="scatter_radius",
-        get_fill_color=["color_r", "color_g", "color_b", 180],
+        "ScatterplotLayer", data=data.records("scatter"),
+        get_position=POSITION,
+        get_radius="r",
+        get_fill_color=band_color(180),
         pickable=True, stroked=True,
         get_line_color=[255, 255, 255, 100],
         line_width_min_pixels=1,
     )
 
-    # Heatmap Layer (only encroached/risky plots)
-    heat_data = df[df["Encroached Area"] > 0] if "Encroached Area" in df.columns and len(df[df["Encroached Area"] > 0]) > 0 else df
-    heatmap_layer = pdk.Layer(
-        "HeatmapLayer", data=heat_data,
-        get_position=["Lon", "Lat"], get_weight="elevation",
-        radiusPixels=60, intensity=1, threshold=0.3, opacity=0.6,
-    )
+    # Heatmap Layer (only encroached/risky plots); replaced by raster tiles when served
+    heatmap_layers = []
+    if heatmap_tiles_url is None:
+        heatmap_layers.append(pdk.Layer(
+            "HeatmapLayer", data=data.records("heatmap"),
+            get_position=POSITION, get_weight="e",
+            radiusPixels=60, intensity=1, threshold=0.3, opacity=0.6,
+        ))
 
     # Text Label Layer
     text_layer = pdk.Layer(
-        "TextLayer", data=df,
-        get_position=["Lon", "Lat"],
+        "TextLayer", data=data.records("text"),
+        get_position=POSITION,
         get_text="label", get_size=14,
         get_color=[255, 255, 255, 220],
         get_angle=0, get_text_anchor="'middle'",
@@ -351,43 +356,32 @@ def render_3d_map(plots_data):
     )
 
     # Arc Layer — connect high-risk plots to each other
-    risky = df[df.get("Risk Score", pd.Series([100]*len(df))) < 60]
-    arc_data = []
-    risky_list = risky.to_dict("records")
-    for i in range(len(risky_list)):
-        for j in range(i + 1, min(i + 3, len(risky_list))):
-            arc_data.append({
-                "sourceLat": risky_list[i]["Lat"],
-                "sourceLon": risky_list[i]["Lon"],
-                "targetLat": risky_list[j]["Lat"],
-                "targetLon": risky_list[j]["Lon"],
-            })
-    arc_df = pd.DataFrame(arc_data) if arc_data else pd.DataFrame(columns=["sourceLat","sourceLon","targetLat","targetLon"])
-
     arc_layer = pdk.Layer(
-        "ArcLayer", data=arc_df,
-        get_source_position=["sourceLon", "sourceLat"],
-        get_target_position=["targetLon", "targetLat"],
+        "ArcLayer", data=data.records("arc"),
+        get_source_position="[sx, sy]",
+        get_target_position="[tx, ty]",
         get_source_color=[239, 68, 68, 160],
         get_target_color=[245, 158, 11, 160],
         get_width=2,
     )
 
     # --- VIEW STATES ---
+    center_lat, center_lon = data.center
     view_3d = pdk.ViewState(
-        latitude=df["Lat"].mean(), longitude=df["Lon"].mean(),
+        latitude=center_lat, longitude=center_lon,
         zoom=12, pitch=60, bearing=-30,
     )
     view_top = pdk.ViewState(
-        latitude=df["Lat"].mean(), longitude=df["Lon"].mean(),
+        latitude=center_lat, longitude=center_lon,
         zoom=12, pitch=0, bearing=0,
     )
 
-    # --- TABS ---
-    tab1, tab2, tab3, tab4, tab5 = st.tabs([
+    # --- VIEWS ---
+    # One deck is shipped per run (tabs would serialize all five)
+    view = st.radio("Map view", [
         "🛰 3D Satellite View", "🏗 3D Risk Columns", "🔥 Violation Heatmap",
         "📍 Scatter Plot", "🌐 Combined Intelligence"
-    ])
+    ], horizontal=True, key="map_3d_view", label_visibility="collapsed")
 
     # Custom MapLibre style with ESRI satellite raster tiles (same as Folium map)
     # Encoded as data URI to bypass pydeck's mapbox provider requirement for dict styles
@@ -412,61 +406,72 @@ def render_3d_map(plots_data):
         }],
     }
     SATELLITE_STYLE = "data:application/json;base64," + base64.b64encode(json.dumps(_style_dict).encode()).decode()
+    HEATMAP_STYLE = SATELLITE_STYLE
+    if heatmap_tiles_url is not None:
+        _style_dict["sources"]["violation-heatmap"] = {
+            "type": "raster",
+            "tiles": [heatmap_tiles_url],
+            "tileSize": 256,
+        }
+        _style_dict["layers"].append({
+            "id": "violation-heatmap-layer",
+            "type": "raster",
+            "source": "violation-heatmap",
+        })
+        HEATMAP_STYLE = "data:application/json;base64," + base64.b64encode(json.dumps(_style_dict).encode()).decode()
 
-    with tab1:
+    if view == "🛰 3D Satellite View":
         st.pydeck_chart(pdk.Deck(
             layers=[scatter_layer, text_layer, arc_layer],
             initial_view_state=view_3d,
             map_style=SATELLITE_STYLE,
-            tooltip={"text": "{Plot ID}\nRisk: {Risk Score}\nEncroachment: {Encroached Area} m²\nStatus: {Status}"},
+            tooltip={"text": "{id}\nRisk: {risk}\nEncroachment: {enc} m²\nStatus: {status}"},
         ))
         st.caption("🛰 Real satellite imagery with risk-colored markers and arc connections between high-risk plots")
 
-    with tab2:
+    elif view == "🏗 3D Risk Columns":
         st.pydeck_chart(pdk.Deck(
             layers=[column_layer, text_layer],
             initial_view_state=view_3d,
             map_style=SATELLITE_STYLE,
-            tooltip={"text": "{Plot ID}\nRisk Score: {Risk Score}\nStatus: {Status}"},
+            tooltip={"text": "{id}\nRisk Score: {risk}\nStatus: {status}"},
         ))
         st.caption("📊 Column height = Inverse risk score (taller = higher violation risk)")
 
-    with tab3:
+    elif view == "🔥 Violation Heatmap":
         st.pydeck_chart(pdk.Deck(
-            layers=[heatmap_layer],
+            layers=heatmap_layers,
             initial_view_state=pdk.ViewState(
-                latitude=df["Lat"].mean(), longitude=df["Lon"].mean(),
+                latitude=center_lat, longitude=center_lon,
                 zoom=11, pitch=30,
             ),
-            map_style=SATELLITE_STYLE,
+            map_style=HEATMAP_STYLE,
         ))
         st.caption("🔥 Heatmap showing concentration of high-risk / encroached plots")
 
-    with tab4:
+    elif view == "📍 Scatter Plot":
         st.pydeck_chart(pdk.Deck(
             layers=[scatter_layer, text_layer],
             initial_view_state=view_top,
             map_style=SATELLITE_STYLE,
-            tooltip={"text": "{Plot ID}\nRisk: {Risk Score}\nEncroachment: {Encroached Area} m²"},
+            tooltip={"text": "{id}\nRisk: {risk}\nEncroachment: {enc} m²"},
         ))
         st.caption("📍 Scatter plot — marker size = encroachment area, color = risk level")
 
-    with tab5:
+    else:
         st.pydeck_chart(pdk.Deck(
-            layers=[column_layer, scatter_layer, heatmap_layer, arc_layer, text_layer],
+            layers=[column_layer, scatter_layer, *heatmap_layers, arc_layer, text_layer],
             initial_view_state=view_3d,
-            map_style=SATELLITE_STYLE,
-            tooltip={"text": "{Plot ID}\nRisk: {Risk Score}"},
+            map_style=HEATMAP_STYLE,
+            tooltip={"text": "{id}\nRisk: {risk}"},
         ))
         st.caption("🌐 Full intelligence overlay — columns + scatter + heatmap + risk arcs")
 
     # --- STYLED SUMMARY STATS ---
     st.markdown("---")
 
-    high_risk = len(df[df.get("Risk Score", pd.Series([100]*len(df))) < 50])
-    moderate = len(df[(df.get("Risk Score", pd.Series([100]*len(df))) >= 50) & (df.get("Risk Score", pd.Series([100]*len(df))) < 80)])
-    low_risk = len(df[df.get("Risk Score", pd.Series([100]*len(df))) >= 80])
-    total_enc = df["Encroached Area"].sum() if "Encroached Area" in df.columns else 0
+    high_risk, moderate, low_risk = risk_band_counts(np.nan_to_num(data.risk, nan=100.0))
+    total_enc = data.encroached.sum()
 
     st.markdown(f"""
     <div style="display: grid; grid-template-columns: repeat(4, 1fr); gap: 16px; margin: 8px 0;">
@@ -556,34 +561,26 @@ def render_3d_map(plots_data):
 # ==============================
 # District-Wise Analytics
 # ==============================
-DISTRICTS = ["Raipur", "Bilaspur", "Durg", "Korba", "Rajnandgaon", "Jagdalpur", "Raigarh", "Ambikapur"]
-
-def assign_districts(plots_data):
-    for plot in plots_data:
-        if "District" not in plot:
-            plot["District"] = random.choice(DISTRICTS)
-    return plots_data
-
-
-def render_district_analytics(plots_data):
-    if len(plots_data) == 0:
+def render_district_analytics(snapshot):
+    """
+    Renders the per-district rollups (see rollups.InspectionRollups.snapshot).
+    """
+    import pandas as pd
+    import plotly.graph_objects as go
+
+    by_district = snapshot["by_district"]
+    if not by_district:
         st.info("No data available.")
         return
 
-    plots_data = assign_districts(plots_data)
-    df = pd.DataFrame(plots_data)
-
     # District summary
-    district_summary = df.groupby("District").agg(
-        Plots=("Plot ID", "count"),
-        Avg_Risk=("Risk Score", "mean") if "Risk Score" in df.columns else ("Plot ID", "count"),
-        Total_Encroachment=("Encroached Area", "sum"),
-        Revenue_Risk=("Revenue Recovery", "sum"),
-    ).reset_index()
-
-    if "Risk Score" in df.columns:
-        district_summary["Avg_Risk"] = df.groupby("District")["Risk Score"].mean().values
-        district_summary["Avg_Risk"] = district_summary["Avg_Risk"].round(1)
+    district_summary = pd.DataFrame({
+        "District": list(by_district),
+        "Plots": [d["plots"] for d in by_district.values()],
+        "Avg_Risk": [d["avg_risk"] for d in by_district.values()],
+        "Total_Encroachment": [d["encroached_area"] for d in by_district.values()],
+        "Revenue_Risk": [d["revenue_recovery"] for d in by_district.values()],
+    })
 
     # Plotly bar chart
     fig = go.Figure()
@@ -619,84 +616,73 @@ def render_district_analytics(plots_data):
 # ==============================
 # Predictive Analytics
 # ==============================
-def render_predictive_analytics(plots_data):
-    if len(plots_data) < 3:
-        st.info("Need at least 3 plots to generate predictions. Add more data.")
+def render_predictive_analytics(series, predicted, forecast_months):
+    """
+    Renders monthly history and forecasts from forecasting.district_forecast.
+    """
+    import numpy as np
+    import pandas as pd
+    import plotly.graph_objects as go
+
+    if len(series.months) < 2:
+        st.info("Forecasts need at least 2 closed months of stored inspections. "
+                "Predictions appear once more inspection history is recorded.")
         return
 
-    df = pd.DataFrame(plots_data)
-
-    # Simulate historical trend (last 12 months)
-    months = pd.date_range(end=datetime.now(), periods=12, freq="M")
-    np.random.seed(42)
-    base_violations = max(3, len(df[df.get("Encroached Area", pd.Series([0]*len(df))) > 0]))
-
-    historical = []
-    for i, m in enumerate(months):
-        v = max(0, base_violations + np.random.randint(-2, 4) + i // 3)
-        compliance = max(40, 95 - v * 3 + np.random.randint(-5, 5))
-        revenue_risk = v * random.uniform(20000, 80000)
-        historical.append({
-            "Month": m.strftime("%b %Y"),
-            "Violations": v,
-            "Compliance %": compliance,
-            "Revenue Risk": round(revenue_risk, 0),
-        })
-
-    hist_df = pd.DataFrame(historical)
-
-    # Extrapolate 3 months
-    last_v = hist_df["Violations"].iloc[-3:].mean()
-    last_c = hist_df["Compliance %"].iloc[-3:].mean()
-    trend_v = (hist_df["Violations"].iloc[-1] - hist_df["Violations"].iloc[-4]) / 3
-
-    future_months = pd.date_range(start=datetime.now() + timedelta(days=30), periods=3, freq="M")
-    for i, m in enumerate(future_months):
-        pred_v = max(0, int(last_v + trend_v * (i + 1)))
-        pred_c = max(30, last_c - trend_v * 2 * (i + 1))
-        historical.append({
-            "Month": m.strftime("%b %Y"),
-            "Violations": pred_v,
-            "Compliance %": round(pred_c, 1),
-            "Revenue Risk": round(pred_v * 50000, 0),
-        })
-
+    district = st.selectbox("District", series.groups, key="forecast_district")
+    row = series.groups.index(district)
+
+    # History followed by the forecast; the forecast line starts at the last actual month
+    history = [(m, series.values["Violations"][row, i], series.values["Compliance %"][row, i])
+               for i, m in enumerate(series.months)]
+    future = list(zip(forecast_months, predicted["Violations"][row], predicted["Compliance %"][row]))
+    historical = [
+        {"Month": datetime.strptime(m, "%Y-%m").strftime("%b %Y"),
+         "Violations": int(round(v)),
+         "Compliance %": None if np.isnan(c) else round(float(c), 1)}
+        for m, v, c in history + future
+    ]
     full_df = pd.DataFrame(historical)
+    n_hist = len(history)
+
+    last_v = full_df["Violations"].iloc[n_hist - 1]
+    next_v = full_df["Violations"].iloc[n_hist]
+    trend_v = (full_df["Violations"].iloc[-1] - last_v) / len(future)
 
     # Plotly dual-axis chart
     fig = go.Figure()
     fig.add_trace(go.Scatter(
-        x=full_df["Month"][:12], y=full_df["Violations"][:12],
+        x=full_df["Month"][:n_hist], y=full_df["Violations"][:n_hist],
         name="Actual Violations", mode="lines+markers",
         line=dict(color="#ef4444", width=3),
         marker=dict(size=8),
     ))
     fig.add_trace(go.Scatter(
-        x=full_df["Month"][11:], y=full_df["Violations"][11:],
+        x=full_df["Month"][n_hist - 1:], y=full_df["Violations"][n_hist - 1:],
         name="Predicted Violations", mode="lines+markers",
         line=dict(color="#ef4444", width=3, dash="dash"),
         marker=dict(size=8, symbol="diamond"),
     ))
     fig.add_trace(go.Scatter(
-        x=full_df["Month"][:12], y=full_df["Compliance %"][:12],
+        x=full_df["Month"][:n_hist], y=full_df["Compliance %"][:n_hist],
         name="Actual Compliance %", mode="lines+markers",
         line=dict(color="#22c55e", width=3), yaxis="y2",
     ))
     fig.add_trace(go.Scatter(
-        x=full_df["Month"][11:], y=full_df["Compliance %"][11:],
+        x=full_df["Month"][n_hist - 1:], y=full_df["Compliance %"][n_hist - 1:],
         name="Predicted Compliance %", mode="lines+markers",
         line=dict(color="#22c55e", width=3, dash="dash"), yaxis="y2",
         marker=dict(symbol="diamond"),
     ))
 
     # Add prediction zone shade
-    fig.add_vrect(x0=full_df["Month"].iloc[11], x1=full_df["Month"].iloc[-1],
+    fig.add_vrect(x0=full_df["Month"].iloc[n_hist - 1], x1=full_df["Month"].iloc[-1],
                   fillcolor="rgba(139,92,246,0.1)", line_width=0,
                   annotation_text="Forecast Zone", annotation_position="top left",
                   annotation_font_color="#a78bfa")
 
     fig.update_layout(
-        title="📈 12-Month Trend + 3-Month Forecast",
+        title=f"📈 {n_hist}-Month Trend + {len(future)}-Month Forecast — {district}",
         paper_bgcolor="rgba(0,0,0,0)", plot_bgcolor="rgba(0,0,0,0)",
         font={"color": "white"}, height=420,
         yaxis=dict(title="Violations", gridcolor="rgba(255,255,255,0.1)"),
@@ -712,83 +698,107 @@ def render_predictive_analytics(plots_data):
     <div class="glass-card">
         <h4 style="color: #a78bfa; margin: 0 0 10px 0;">🔮 Prediction Summary</h4>
         <p style="color: #ccc;">Violation trend: <b style="color: {'#ef4444' if trend_v > 0 else '#22c55e'}">{pred_trend}</b></p>
-        <p style="color: #ccc;">Projected violations (next quarter): <b>{int(last_v + trend_v * 2)}</b></p>
-        <p style="color: #ccc;">Projected compliance: <b>{round(last_c - trend_v * 4, 1)}%</b></p>
+        <p style="color: #ccc;">Projected violations (next month): <b>{next_v}</b></p>
+        <p style="color: #ccc;">Projected compliance: <b>{full_df["Compliance %"].iloc[n_hist]}%</b></p>
     </div>
     """, unsafe_allow_html=True)
 
+    # Next-month outlook for every district, most predicted violations first
+    st.markdown(f"#### District Outlook — {datetime.strptime(forecast_months[0], '%Y-%m').strftime('%b %Y')}")
+    outlook = pd.DataFrame({
+        "District": series.groups[1:],
+        "Predicted Violations": predicted["Violations"][1:, 0].round().astype(int),
+        "Predicted Compliance %": predicted["Compliance %"][1:, 0].round(1),
+        "Predicted Revenue Risk (₹)": predicted["Revenue Risk"][1:, 0].round(0),
+    }).sort_values("Predicted Violations", ascending=False)
+    st.dataframe(outlook, use_container_width=True, hide_index=True)
+
 
 # ==============================
 # Natural Language Data Query
 # ==============================
-def render_data_query(plots_data):
-    if len(plots_data) == 0:
+def render_data_query(engine):
+    """
+    Saved and ad-hoc structured queries over the inspection store (see query_engine).
+    """
+    import pandas as pd
+    from districts import DISTRICTS
+    from query_engine import FIELDS, MAX_LIMIT, SAVED_QUERIES, QueryError, compile_query
+
+    if engine.sync() == 0:
         st.info("No data to query. Generate demo data first.")
         return
 
-    df = pd.DataFrame(plots_data)
-
     st.markdown("""
     <div class="glass-card">
         <h4 style="color: #60a5fa; margin: 0;">💬 Ask questions about your compliance data</h4>
     </div>
     """, unsafe_allow_html=True)
 
-    query = st.selectbox("Select a query:", [
-        "-- Select --",
-        "Which plot has the highest encroachment?",
-        "What is the total revenue at risk?",
-        "How many plots are compliant?",
-        "Which district has the most violations?",
-        "What is the average risk score?",
-        "Show me all critical plots (Risk Score < 50)",
-        "What is the highest single penalty amount?",
-    ])
-
-    if query != "-- Select --":
-        st.markdown("---")
-        if query == "Which plot has the highest encroachment?":
-            idx = df["Encroached Area"].idxmax()
-            plot = df.loc[idx]
-            st.success(f"🏗 **{plot['Plot ID']}** has the highest encroachment at **{plot['Encroached Area']:.2f} m²** "
-                       f"with a penalty of **₹{plot['Revenue Recovery']:,.2f}**")
-
-        elif query == "What is the total revenue at risk?":
-            total = df["Revenue Recovery"].sum() + df["Revenue Loss"].sum()
-            st.success(f"💰 Total revenue at risk: **₹{total:,.2f}** "
-                       f"(Recovery: ₹{df['Revenue Recovery'].sum():,.2f} + Loss: ₹{df['Revenue Loss'].sum():,.2f})")
-
-        elif query == "How many plots are compliant?":
-            comp = len(df[(df["Encroached Area"] == 0) & (df["Unused Area"] == 0)])
-            st.success(f"✅ **{comp}** out of **{len(df)}** plots are fully compliant ({comp/len(df)*100:.1f}%)")
-
-        elif query == "Which district has the most violations?":
-            plots_data = assign_districts(plots_data)
-            df2 = pd.DataFrame(plots_data)
-            viol = df2[df2["Encroached Area"] > 0].groupby("District").size()
-            if len(viol) > 0:
-                worst = viol.idxmax()
-                st.success(f"📍 **{worst}** has the most violations with **{viol[worst]}** encroached plots")
-            else:
-                st.success("✅ No violations found across any district!")
-
-        elif query == "What is the average risk score?":
-            if "Risk Score" in df.columns:
-                avg = df["Risk Score"].mean()
-                st.success(f"📊 Average risk score: **{avg:.1f}/100** — "
-                           f"{'Healthy' if avg >= 80 else 'Moderate concern' if avg >= 50 else 'Critical'}")
-
-        elif query == "Show me all critical plots (Risk Score < 50)":
-            if "Risk Score" in df.columns:
-                critical = df[df["Risk Score"] < 50]
-                if len(critical) > 0:
-                    st.warning(f"🚨 Found **{len(critical)}** critical plots:")
-                    st.dataframe(critical[["Plot ID", "Risk Score", "Encroached Area", "Status"]], hide_index=True)
-                else:
-                    st.success("✅ No critical plots found!")
-
-        elif query == "What is the highest single penalty amount?":
-            idx = df["Revenue Recovery"].idxmax()
-            plot = df.loc[idx]
-            st.success(f"💸 Highest penalty: **₹{plot['Revenue Recovery']:,.2f}** on plot **{plot['Plot ID']}** "
-                       f"(Encroachment: {plot['Encroached Area']:.2f} m²)")
+    mode = st.radio("Query type", ["Saved questions", "Build a query"], horizontal=True, key="query_mode")
+
+    if mode == "Saved questions":
+        name = st.selectbox("Select a query:", ["-- Select --"] + list(SAVED_QUERIES), key="saved_query")
+        if name == "-- Select --":
+            return
+        query = SAVED_QUERIES[name]
+    else:
+        dimensions = [f for f in FIELDS if f in ("district", "status", "month", "plot_id")]
+        measures = [f for f in FIELDS if f not in ("plot_id", "district", "status", "month")]
+
+        q1, q2, q3 = st.columns(3)
+        group_by = q1.multiselect("Group by", dimensions, default=["district"], key="q_group")
+        func = q2.selectbox("Aggregate", ["count", "sum", "avg", "min", "max"], key="q_func")
+        measure = q3.selectbox("Of", measures, index=measures.index("encroached_area"), key="q_measure",
+                               disabled=func == "count")
+
+        f1, f2, f3 = st.columns(3)
+        districts = f1.multiselect("District", DISTRICTS, key="q_district")
+        statuses = f2.multiselect("Status", ["Compliant", "Encroachment", "Underutilized"], key="q_status")
+        max_risk = f3.slider("Risk score below", 0, 101, 101, key="q_risk")
+
+        filters = []
+        if districts:
+            filters.append(["district", "in", districts])
+        if statuses:
+            filters.append(["status", "in", statuses])
+        if max_risk <= 100:
+            filters.append(["risk_score", "lt", max_risk])
+
+        alias = "plots" if func == "count" else f"{func}_{measure}"
+        query = {
+            "filters": filters,
+            "group_by": group_by,
+            "aggregates": [[func, "*" if func == "count" else measure, alias]],
+            "order_by": [[alias, "desc"]],
+        }
+
+        top_k = st.number_input("Top-k (0 = all)", min_value=0, max_value=MAX_LIMIT, value=10, key="q_topk")
+        if top_k:
+            query["limit"] = int(top_k)
+
+    p1, p2 = st.columns([1, 3])
+    page_size = p1.selectbox("Rows per page", [25, 50, 100, 500], index=1, key="q_page_size")
+    page = p2.number_input("Page", min_value=1, value=1, key="q_page") - 1
+
+    try:
+        result = engine.run(query, page=page, page_size=page_size)
+    except QueryError as e:
+        st.error(f"Invalid query: {e}")
+        return
+
+    st.markdown("---")
+    if result["total"] == 0:
+        st.success("✅ No matching plots.")
+    elif not result["rows"]:
+        st.info(f"Only {result['total']:,} rows match; choose an earlier page.")
+    else:
+        first = page * page_size + 1
+        last = first + len(result["rows"]) - 1
+        st.caption(f"Rows {first:,}–{last:,} of {result['total']:,} · dataset version {result['version']:,}")
+        st.dataframe(pd.DataFrame(result["rows"], columns=result["columns"]),
+                     use_container_width=True, hide_index=True)
+
+    with st.expander("SQL"):
+        sql, params, limit = compile_query(query)
+        st.code(f"{sql}\n-- params: {params}" + (f"\n-- top-k: {limit}" if limit else ""), language="sql")
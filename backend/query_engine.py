@@ -0,0 +1,296 @@
+"""
+Inspection Query Engine
+Compiles a small structured query language (filters, group-by, aggregates,
+ordering, top-k) into parameterized DuckDB SQL over a columnar mirror of the
+inspection store. Results are paginated and memoized per dataset version.
+"""
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+
+from export import ARROW_TYPES
+from store import DB_PATH, METRIC_COLUMNS, day_bounds, get_store
+
+# Queryable fields: store columns plus derived expressions
+FIELDS = {column: column for column, _, _ in METRIC_COLUMNS}
+FIELDS.update({
+    "month": "month",
+    "revenue_at_risk": "(COALESCE(revenue_recovery, 0) + COALESCE(revenue_loss, 0))",
+})
+AGGREGATES = {"count", "sum", "avg", "min", "max"}
+OPERATORS = {"eq": "=", "ne": "!=", "lt": "<", "le": "<=", "gt": ">", "ge": ">="}
+DUCKDB_TYPES = {"TEXT": "VARCHAR", "INTEGER": "BIGINT", "REAL": "DOUBLE"}
+
+MAX_LIMIT = 100_000
+SYNC_BATCH_ROWS = 200_000
+CACHE_SIZE = 256
+
+# The Data Query page's canned questions, expressed as structured queries
+SAVED_QUERIES = {
+    "Which plot has the highest encroachment?": {
+        "select": ["plot_id", "district", "encroached_area", "revenue_recovery"],
+        "order_by": [["encroached_area", "desc"]],
+        "limit": 1,
+    },
+    "What is the total revenue at risk?": {
+        "aggregates": [["sum", "revenue_recovery", "recovery"], ["sum", "revenue_loss", "loss"],
+                       ["sum", "revenue_at_risk", "total_at_risk"]],
+    },
+    "How many plots are compliant?": {
+        "group_by": ["status"],
+        "aggregates": [["count", "*", "plots"]],
+        "order_by": [["plots", "desc"]],
+    },
+    "Which district has the most violations?": {
+        "filters": [["encroached_area", "gt", 0]],
+        "group_by": ["district"],
+        "aggregates": [["count", "*", "violations"], ["sum", "encroached_area", "encroached_area"]],
+        "order_by": [["violations", "desc"]],
+        "limit": 5,
+    },
+    "What is the average risk score?": {
+        "aggregates": [["avg", "risk_score", "avg_risk"], ["min", "risk_score", "min_risk"]],
+    },
+    "Show me all critical plots (Risk Score < 50)": {
+        "select": ["plot_id", "district", "risk_score", "encroached_area", "status"],
+        "filters": [["risk_score", "lt", 50]],
+        "order_by": [["risk_score", "asc"]],
+    },
+    "What is the highest single penalty amount?": {
+        "select": ["plot_id", "revenue_recovery", "encroached_area"],
+        "order_by": [["revenue_recovery", "desc"]],
+        "limit": 1,
+    },
+    "Monthly violations by district": {
+        "filters": [["status", "ne", "Compliant"]],
+        "group_by": ["month", "district"],
+        "aggregates": [["count", "*", "violations"], ["sum", "revenue_at_risk", "revenue_at_risk"]],
+        "order_by": [["month", "desc"], ["violations", "desc"]],
+    },
+}
+
+
+class QueryError(ValueError):
+    pass
+
+
+# ==============================
+# Compilation
+# ==============================
+def _field(name):
+    if name not in FIELDS:
+        raise QueryError(f"Unknown field '{name}'")
+    return FIELDS[name]
+
+
+def _alias(name):
+    if not str(name).isidentifier():
+        raise QueryError(f"Invalid column alias '{name}'")
+    return name
+
+
+def _filter_value(field, value):
+    # Date strings on the timestamp column compare as epoch seconds
+    if field == "ts" and isinstance(value, str):
+        return day_bounds(start=value)[0]
+    return value
+
+
+def _compile(query):
+    """
+    Structured query -> (unordered sql, ORDER BY clause, params, limit):
+
+        filters     [[field, op, value], ...]  op: eq ne lt le gt ge in
+        select      [field, ...]               plain rows when no aggregates
+        group_by    [field, ...]
+        aggregates  [[func, field | "*", alias], ...]
+        order_by    [[output column, "asc" | "desc"], ...]  then id or the group keys
+        limit       top-k cap on the result
+    """
+    params = []
+    where = []
+    for field, op, value in query.get("filters", []):
+        column = _field(field)
+        if op == "in":
+            values = [_filter_value(field, v) for v in value]
+            if not values:
+                raise QueryError("'in' filter needs at least one value")
+            where.append(f"{column} IN ({', '.join('?' * len(values))})")
+            params.extend(values)
+        elif op in OPERATORS:
+            where.append(f"{column} {OPERATORS[op]} ?")
+            params.append(_filter_value(field, value))
+        else:
+            raise QueryError(f"Unknown operator '{op}'")
+
+    group_by = query.get("group_by", [])
+    aggregates = query.get("aggregates", [])
+    outputs = []
+    if group_by or aggregates:
+        for field in group_by:
+            outputs.append((field, f"{_field(field)} AS {field}"))
+        for func, field, alias in aggregates:
+            if func not in AGGREGATES:
+                raise QueryError(f"Unknown aggregate '{func}'")
+            target = "*" if (func == "count" and field == "*") else _field(field)
+            outputs.append((_alias(alias), f"{func}({target}) AS {alias}"))
+    else:
+        for field in query.get("select") or [c for c, _, _ in METRIC_COLUMNS]:
+            outputs.append((field, f"{_field(field)} AS {field}"))
+
+    names = [name for name, _ in outputs]
+    if len(set(names)) != len(names):
+        raise QueryError("Output column names must be unique")
+
+    sql = f"SELECT {', '.join(expr for _, expr in outputs)} FROM inspections"
+    if where:
+        sql += " WHERE " + " AND ".join(where)
+    if group_by:
+        sql += " GROUP BY " + ", ".join(_field(f) for f in group_by)
+
+    base = sql
+    order = []
+    for name, direction in query.get("order_by", []):
+        if name not in names:
+            raise QueryError(f"Cannot order by '{name}'; it is not an output column")
+        if direction not in ("asc", "desc"):
+            raise QueryError(f"Unknown sort direction '{direction}'")
+        order.append(f"{name} {direction.upper()} NULLS LAST")
+    # A final tiebreaker makes the order total, so LIMIT/OFFSET pages neither
+    # overlap nor skip rows where the requested ordering has ties
+    if group_by:
+        order.extend(f"{field} ASC NULLS LAST" for field in group_by)
+    elif not aggregates:
+        order.append("id ASC")
+    order_by = " ORDER BY " + ", ".join(order) if order else ""
+
+    limit = query.get("limit")
+    if limit is not None:
+        limit = int(limit)
+        if not 0 < limit <= MAX_LIMIT:
+            raise QueryError(f"limit must be between 1 and {MAX_LIMIT}")
+    return base, order_by, params, limit
+
+
+def compile_query(query):
+    """
+    Returns (sql, params, limit) for a structured query; the top-k limit (or
+    None) is returned separately so callers can page within it.
+    """
+    base, order_by, params, limit = _compile(query)
+    return base + order_by, params, limit
+
+
+# ==============================
+# Engine
+# ==============================
+def local_months(ts):
+    """
+    "YYYY-MM" in local time for each epoch-seconds value (None for None),
+    matching the store's 'localtime' monthly rollups. UTC offsets are whole
+    quarter hours, so each distinct quarter hour is converted only once.
+    """
+    months = {}
+    labels = []
+    for t in ts:
+        if t is None:
+            labels.append(None)
+            continue
+        quarter = int(t // 900)
+        if quarter not in months:
+            months[quarter] = time.strftime("%Y-%m", time.localtime(quarter * 900))
+        labels.append(months[quarter])
+    return labels
+
+
+class QueryEngine:
+    """
+    Keeps an in-memory DuckDB copy of the store's metric columns. The store is
+    append-only, so each sync loads only rows after the last mirrored id, and
+    the newest id is the dataset version used in memo keys.
+    """
+
+    def __init__(self, store):
+        import duckdb
+
+        self.store = store
+        self.version = 0
+        self._conn = duckdb.connect()
+        cols = ", ".join(f"{c} {DUCKDB_TYPES[t]}" for c, t, _ in METRIC_COLUMNS)
+        # month is derived once on load rather than per query
+        self._conn.execute(f"CREATE TABLE inspections (id BIGINT, {cols}, month VARCHAR)")
+        self._cache = OrderedDict()
+        # Reentrant so run() can sync under the same lock; pages that call
+        # sync() directly are serialized with queries and other syncs
+        self._lock = threading.RLock()
+
+    def sync(self):
+        import pyarrow as pa
+
+        with self._lock:
+            latest = self.store.last_id()
+            if latest == self.version:
+                return self.version
+            conn = self._conn.cursor()
+            if latest < self.version:
+                # The store file was replaced; mirror it from scratch
+                conn.execute("DELETE FROM inspections")
+                self.version = 0
+            columns = ["id"] + [c for c, _, _ in METRIC_COLUMNS]
+            types = [pa.int64()] + [getattr(pa, ARROW_TYPES[t])() for _, t, _ in METRIC_COLUMNS]
+            ts = columns.index("ts")
+            for rows in self.store.iter_batches(columns, SYNC_BATCH_ROWS, after_id=self.version):
+                values = list(zip(*rows))
+                arrays = [pa.array(v, type=t) for v, t in zip(values, types)]
+                arrays.append(pa.array(local_months(values[ts]), type=pa.string()))
+                conn.register("incoming", pa.table(arrays, names=columns + ["month"]))
+                conn.execute("INSERT INTO inspections SELECT * FROM incoming")
+                conn.unregister("incoming")
+                self.version = rows[-1][0]
+            self._cache.clear()
+            return self.version
+
+    def run(self, query, page=0, page_size=50):
+        """
+        One page of results as {"columns", "rows", "total", "page",
+        "page_size", "version"}; identical calls on an unchanged store are
+        served from the memo.
+        """
+        page, page_size = int(page), int(page_size)
+        if page < 0 or page_size < 1:
+            raise QueryError("page must be >= 0 and page_size >= 1")
+        base, order_by, params, limit = _compile(query)
+        offset = page * page_size
+        with self._lock:
+            version = self.sync()
+            key = (json.dumps(query, sort_keys=True), version, page, page_size)
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+
+            conn = self._conn.cursor()
+            total = conn.execute(f"SELECT COUNT(*) FROM ({base})", params).fetchone()[0]
+            if limit is not None:
+                total = min(total, limit)
+            size = max(0, min(page_size, total - offset))
+            cursor = conn.execute(f"{base}{order_by} LIMIT {size} OFFSET {offset}", params)
+            result = {
+                "columns": [d[0] for d in cursor.description],
+                "rows": cursor.fetchall(),
+                "total": total,
+                "page": page,
+                "page_size": page_size,
+                "version": version,
+            }
+            self._cache[key] = result
+            if len(self._cache) > CACHE_SIZE:
+                self._cache.popitem(last=False)
+            return result
+
+
+@lru_cache(maxsize=None)
+def get_query_engine(path=DB_PATH):
+    return QueryEngine(get_store(path))
@@ -0,0 +1,67 @@
+"""
+Plot Records
+Compact in-memory form of the session's inspections. Each record is a
+__slots__ dataclass whose attributes are named after the store's columns.
+The timestamp is stored as epoch seconds and the status as a code into
+scoring.STATUS_LABELS. Geometry lives only in the inspection store,
+referenced by row id. Display labels and formatting are produced when a
+page renders (records_frame, PlotRecord.plot_id / .status).
+"""
+
+import time
+from dataclasses import dataclass
+from datetime import datetime
+
+from scoring import STATUS_LABELS
+from store import METRIC_COLUMNS
+
+# Display labels for the other assigned boundary levels (see districts.LEVELS)
+LEVEL_LABELS = {"tehsil": "Tehsil", "industrial_area": "Industrial Area"}
+
+
+@dataclass(slots=True, eq=False)
+class PlotRecord:
+    number: int
+    encroached_area: float
+    unused_area: float
+    unused_pct: float
+    revenue_recovery: float
+    revenue_loss: float
+    risk_score: int | None
+    status_code: int
+    lat: float | None = None
+    lon: float | None = None
+    # Epoch seconds; defaults to now
+    ts: int = 0
+    district: str | None = None
+    tehsil: str | None = None
+    industrial_area: str | None = None
+    # Inspection store row holding the plot's geometries, once persisted
+    row_id: int | None = None
+    has_reference: bool = False
+
+    def __post_init__(self):
+        if not self.ts:
+            self.ts = int(time.time())
+
+    @property
+    def plot_id(self):
+        return f"P-{self.number}"
+
+    @property
+    def status(self):
+        return STATUS_LABELS[self.status_code]
+
+
+def records_frame(records):
+    """
+    DataFrame of `records` under the dashboard's display labels, built
+    column by column; timestamps become local datetimes.
+    """
+    import pandas as pd
+
+    columns = {label: [getattr(r, column) for r in records] for column, _, label in METRIC_COLUMNS}
+    columns["Timestamp"] = pd.to_datetime([datetime.fromtimestamp(ts) for ts in columns["Timestamp"]])
+    for attr, label in LEVEL_LABELS.items():
+        columns[label] = [getattr(r, attr) for r in records]
+    return pd.DataFrame(columns)
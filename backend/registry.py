@@ -0,0 +1,152 @@
+"""
+Parcel Registry
+CSIDC allotted plots, roads and government land, indexed in one STRtree.
+Overlap checks use bulk tree queries against prepared geometries. One
+boundary checks against the registry in O(log n + k). A sweep over n
+boundaries finds every overlapping pair in O(n log n + k) instead of
+comparing all pairs.
+"""
+
+import json
+import os
+from functools import lru_cache
+
+import numpy as np
+import shapely
+
+from areas import areas_m2
+
+REGISTRY_PATH = os.environ.get(
+    "REGISTRY_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "boundaries", "csidc_registry.geojson"),
+)
+
+KINDS = ("plot", "road", "government")
+
+# Overlaps smaller than this (m²) are digitizing slivers, not encroachment
+MIN_OVERLAP_M2 = 1.0
+
+
+def _overlap_pairs(left, right, tree, same_set=False):
+    """
+    (left index, right index) pairs whose interiors overlap, from one bulk
+    query of `left` against `tree` (built over `right`). Pairs that only
+    share an edge or corner are dropped; with `same_set`, each pair is kept
+    once and self-pairs are skipped.
+    """
+    li, ri = tree.query(left, predicate="intersects")
+    if same_set:
+        keep = li < ri
+        li, ri = li[keep], ri[keep]
+    interior = ~shapely.touches(left[li], right[ri])
+    return li[interior], ri[interior]
+
+
+class ParcelRegistry:
+    """
+    Registry parcels from a GeoJSON FeatureCollection whose features carry
+    `id`, `kind` and `name` properties (plus optional `industrial_area` and
+    `district`).
+    """
+
+    def __init__(self, features):
+        for f in features:
+            if f["properties"].get("kind") not in KINDS:
+                raise ValueError(f"Unknown parcel kind {f['properties'].get('kind')!r}")
+        self.features = features
+        self.ids = np.array([f["properties"]["id"] for f in features], dtype=object)
+        self.kinds = np.array([f["properties"]["kind"] for f in features], dtype=object)
+        self.names = np.array([f["properties"]["name"] for f in features], dtype=object)
+        self.industrial_areas = np.array([f["properties"].get("industrial_area") for f in features], dtype=object)
+        self.geometries = shapely.make_valid(shapely.from_geojson([json.dumps(f["geometry"]) for f in features]))
+        shapely.prepare(self.geometries)
+        self.tree = shapely.STRtree(self.geometries)
+        self._by_name = {name: i for i, name in enumerate(self.names)}
+
+    def __len__(self):
+        return len(self.ids)
+
+    def plot_names(self):
+        return [name for name, kind in zip(self.names, self.kinds) if kind == "plot"]
+
+    def geojson(self, name):
+        """
+        Boundary GeoJSON of the parcel with display `name`.
+        """
+        return self.features[self._by_name[name]]["geometry"]
+
+    def _describe(self, i):
+        return {"id": self.ids[i], "kind": self.kinds[i], "name": self.names[i]}
+
+    def overlaps(self, boundary, exclude_id=None, min_area_m2=MIN_OVERLAP_M2):
+        """
+        Registry parcels whose interior `boundary` overlaps, skipping the
+        boundary's own allotment (`exclude_id`). Returns (overlap list, union
+        of overlap geometries).
+        """
+        boundary = shapely.make_valid(boundary)
+        shapely.prepare(boundary)
+        _, hits = _overlap_pairs(np.array([boundary]), self.geometries, self.tree)
+        if exclude_id is not None:
+            hits = hits[self.ids[hits] != exclude_id]
+        shared = shapely.intersection(self.geometries[hits], boundary)
+        areas = areas_m2(shared)
+        keep = areas >= min_area_m2
+        overlaps = [
+            {**self._describe(i), "overlap_area_m2": round(float(area), 2)}
+            for i, area in zip(hits[keep].tolist(), areas[keep].tolist())
+        ]
+        return overlaps, shapely.union_all(shared[keep])
+
+    def sweep(self, industrial_area=None, min_area_m2=MIN_OVERLAP_M2):
+        """
+        Every pair of registry parcels (optionally within one industrial
+        area) that overlap, largest overlap first.
+        """
+        rows = np.arange(len(self.ids)) if industrial_area is None else np.flatnonzero(self.industrial_areas == industrial_area)
+        geoms = self.geometries[rows]
+        tree = self.tree if industrial_area is None else shapely.STRtree(geoms)
+        li, ri = _overlap_pairs(geoms, geoms, tree, same_set=True)
+        return self._pairs(rows[li], rows[ri], self.geometries, self.geometries, min_area_m2,
+                           self._describe, self._describe)
+
+    def sweep_boundaries(self, ids, boundaries, min_area_m2=MIN_OVERLAP_M2):
+        """
+        Overlaps among surveyed `boundaries` (with their registry `ids`) and
+        between each boundary and registry parcels other than its own.
+        """
+        ids = np.asarray(ids, dtype=object)
+        geoms = shapely.make_valid(np.asarray(boundaries, dtype=object))
+        shapely.prepare(geoms)
+
+        def surveyed(i):
+            return {"id": ids[i], "kind": "survey", "name": ids[i]}
+
+        bi, ri = _overlap_pairs(geoms, self.geometries, self.tree)
+        own = self.ids[ri] == ids[bi]
+        against_registry = self._pairs(bi[~own], ri[~own], geoms, self.geometries, min_area_m2,
+                                       surveyed, self._describe)
+        li, rj = _overlap_pairs(geoms, geoms, shapely.STRtree(geoms), same_set=True)
+        among_boundaries = self._pairs(li, rj, geoms, geoms, min_area_m2, surveyed, surveyed)
+        return sorted(against_registry + among_boundaries, key=lambda p: -p["overlap_area_m2"])
+
+    @staticmethod
+    def _pairs(li, ri, left, right, min_area_m2, describe_left, describe_right):
+        shared = shapely.intersection(left[li], right[ri])
+        areas = areas_m2(shared)
+        keep = np.flatnonzero(areas >= min_area_m2)
+        pairs = [
+            {"a": describe_left(li[k]), "b": describe_right(ri[k]), "overlap_area_m2": round(float(areas[k]), 2)}
+            for k in keep.tolist()
+        ]
+        return sorted(pairs, key=lambda p: -p["overlap_area_m2"])
+
+
+def load_registry(path=REGISTRY_PATH):
+    with open(path, encoding="utf-8") as f:
+        return ParcelRegistry(json.load(f)["features"])
+
+
+@lru_cache(maxsize=None)
+def get_registry(path=REGISTRY_PATH):
+    return load_registry(path)
@@ -0,0 +1,239 @@
+"""
+Compliance Report Generation
+Single-plot PDF reports plus a batch generator that renders notices in a
+process pool, writes each one straight to disk and bundles the result as a
+merged PDF or a zip.
+"""
+
+import math
+import multiprocessing
+import os
+import zipfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from functools import lru_cache
+
+from reportlab.graphics.shapes import Drawing, Polygon, Rect, String
+from reportlab.lib import colors
+from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.lib.units import inch
+from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+
+
+THUMBNAIL_SIZE = (3.2 * inch, 2.2 * inch)
+# Jobs handed to the pool ahead of the oldest unfinished one, per worker
+JOBS_IN_FLIGHT_PER_WORKER = 4
+
+TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0,0), (-1,0), colors.grey),
+    ('GRID', (0,0), (-1,-1), 1, colors.black)
+])
+
+
+# ==============================
+# Shared Templates
+# ==============================
+@lru_cache(maxsize=None)
+def report_styles():
+    """
+    Built once per process and reused by every report it renders.
+    """
+    return getSampleStyleSheet()
+
+
+def _rings(geom):
+    if geom is None or geom.is_empty:
+        return []
+    polygons = getattr(geom, "geoms", [geom])
+    return [list(p.exterior.coords) for p in polygons if p.geom_type == "Polygon"]
+
+
+def boundary_thumbnail(reference=None, current=None, size=THUMBNAIL_SIZE):
+    """
+    Vector map thumbnail of the reference (blue) and current (orange) boundaries,
+    scaled to a common frame. Geometries are shapely objects.
+    """
+    width, height = size
+    drawing = Drawing(width, height)
+    drawing.add(Rect(0, 0, width, height, fillColor=colors.HexColor("#0f1420"), strokeColor=None))
+
+    layers = [(r, colors.HexColor("#3b82f6")) for r in _rings(reference)]
+    layers += [(r, colors.HexColor("#f97316")) for r in _rings(current)]
+    if not layers:
+        drawing.add(String(width / 2, height / 2, "No boundary on record", textAnchor="middle", fillColor=colors.white))
+        return drawing
+
+    xs = [x for ring, _ in layers for x, _ in ring]
+    ys = [y for ring, _ in layers for _, y in ring]
+    # Shrink longitude by cos(latitude) so plots keep their on-ground proportions
+    kx = math.cos(math.radians((min(ys) + max(ys)) / 2))
+    span_x = max((max(xs) - min(xs)) * kx, 1e-9)
+    span_y = max(max(ys) - min(ys), 1e-9)
+    pad = 12
+    scale = min((width - 2 * pad) / span_x, (height - 2 * pad) / span_y)
+    off_x = (width - span_x * scale) / 2
+    off_y = (height - span_y * scale) / 2
+
+    for ring, color in layers:
+        points = []
+        for x, y in ring:
+            points += [off_x + (x - min(xs)) * kx * scale, off_y + (y - min(ys)) * scale]
+        drawing.add(Polygon(points, strokeColor=color, strokeWidth=2, fillColor=None))
+    return drawing
+
+
+def report_elements(report_data, thumbnail=None):
+    styles = report_styles()
+    elements = []
+
+    elements.append(Paragraph("<b>CSIDC Industrial Compliance Report</b>", styles["Title"]))
+    elements.append(Spacer(1, 0.5 * inch))
+
+    if thumbnail is not None:
+        elements.append(thumbnail)
+        elements.append(Spacer(1, 0.3 * inch))
+
+    table_data = [["Metric", "Value"]]
+    for key, value in report_data.items():
+        table_data.append([key, str(value)])
+
+    table = Table(table_data)
+    table.setStyle(TABLE_STYLE)
+
+    elements.append(table)
+    return elements
+
+
+def generate_pdf(report_data, output, reference=None, current=None):
+    """
+    Writes one report to `output` (a path or a binary file object).
+    """
+    thumbnail = boundary_thumbnail(reference, current) if (reference is not None or current is not None) else None
+    doc = SimpleDocTemplate(output)
+    doc.build(report_elements(report_data, thumbnail))
+    return output
+
+
+# ==============================
+# Batch Generation
+# ==============================
+def _render_job(job):
+    """
+    Worker entry point: job is (path, report_data, reference_wkb, current_wkb).
+    """
+    from shapely import from_wkb
+
+    path, report_data, reference_wkb, current_wkb = job
+    reference = from_wkb(reference_wkb) if reference_wkb else None
+    current = from_wkb(current_wkb) if current_wkb else None
+    generate_pdf(report_data, path, reference, current)
+    return path
+
+
+def render_reports(jobs, out_dir, workers=None):
+    """
+    Renders (filename, report_data, reference_wkb, current_wkb) jobs in
+    parallel; each PDF is written directly into `out_dir`. `jobs` is consumed
+    lazily, with at most JOBS_IN_FLIGHT_PER_WORKER jobs per worker held at a
+    time. Returns the paths in job order.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    workers = workers or os.cpu_count() or 1
+    paths = []
+    pending = deque()
+    # Workers start on the first submit, so no jobs means no processes. They
+    # are spawned rather than forked: the dashboard server is multi-threaded,
+    # and a forked worker could inherit a lock held by another thread
+    spawn = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=spawn, initializer=report_styles) as pool:
+        for name, data, ref, cur in jobs:
+            if len(pending) >= workers * JOBS_IN_FLIGHT_PER_WORKER:
+                paths.append(pending.popleft().result())
+            pending.append(pool.submit(_render_job, (os.path.join(out_dir, name), data, ref, cur)))
+        paths.extend(future.result() for future in pending)
+    return paths
+
+
+def bundle_reports(paths, output, fmt="zip"):
+    """
+    Combines rendered reports into one merged PDF or a zip, written to `output`.
+    """
+    if fmt == "pdf":
+        try:
+            from pypdf import PdfWriter
+        except ImportError:  # merged-PDF output is optional; zip output always works
+            raise RuntimeError("pypdf is required for merged PDF output; use fmt='zip'")
+        writer = PdfWriter()
+        for path in paths:
+            writer.append(path)
+        with open(output, "wb") as f:
+            writer.write(f)
+    else:
+        # PDFs are already compressed; store them as-is
+        with zipfile.ZipFile(output, "w", compression=zipfile.ZIP_STORED) as bundle:
+            for path in paths:
+                bundle.write(path, arcname=os.path.basename(path))
+    return output
+
+
+def violation_jobs(store, **filters):
+    """
+    Report jobs for every non-compliant inspection in the store, generated
+    batch by batch as the store is read.
+    """
+    columns = ["id", "plot_id", "ts", "district", "status", "encroached_area", "unused_area",
+               "unused_pct", "revenue_recovery", "revenue_loss", "risk_score",
+               "reference_wkb", "current_wkb"]
+    for rows in store.iter_batches(columns, **filters):
+        for (row_id, plot_id, ts, district, status, enc, unused, unused_pct,
+             recovery, loss, risk, ref_wkb, cur_wkb) in rows:
+            if status in (None, "Compliant"):
+                continue
+            report_data = {
+                "Plot ID": plot_id,
+                "Inspected": datetime.fromtimestamp(ts).strftime("%Y-%m-%d") if ts else "—",
+                "District": district or "—",
+                "Encroached Area (m²)": round(enc or 0, 2),
+                "Unused Area (m²)": round(unused or 0, 2),
+                "Unused %": unused_pct,
+                "Risk Score": risk,
+                "Revenue Recovery (₹)": round(recovery or 0, 2),
+                "Revenue Loss (₹)": round(loss or 0, 2),
+                "Status": status,
+            }
+            yield f"notice_{row_id}_{plot_id}.pdf", report_data, ref_wkb, cur_wkb
+
+
+def generate_violation_notices(store, output, fmt="zip", workers=None, work_dir=None, **filters):
+    """
+    Renders notices for every violating plot matching the store filters and
+    bundles them into `output`. Returns the number of notices.
+    """
+    import tempfile
+
+    with tempfile.TemporaryDirectory(dir=work_dir) as tmp:
+        paths = render_reports(violation_jobs(store, **filters), tmp, workers)
+        if paths:
+            bundle_reports(paths, output, fmt)
+    return len(paths)
+
+
+if __name__ == "__main__":
+    import argparse
+    from store import get_store
+
+    parser = argparse.ArgumentParser(description="Generate compliance notices for violating plots")
+    parser.add_argument("output")
+    parser.add_argument("--format", choices=["zip", "pdf"], default="zip")
+    parser.add_argument("--district")
+    parser.add_argument("--start", help="YYYY-MM-DD")
+    parser.add_argument("--end", help="YYYY-MM-DD")
+    parser.add_argument("--workers", type=int)
+    args = parser.parse_args()
+
+    count = generate_violation_notices(
+        get_store(), args.output, fmt=args.format, workers=args.workers,
+        district=args.district, start=args.start, end=args.end,
+    )
+    print(f"{count} notices written to {args.output}")
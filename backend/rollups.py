@@ -0,0 +1,148 @@
+"""
+Incremental Inspection Rollups
+Running per-district and per-status counters, sums and means that are
+updated in O(1) as inspections are appended or removed, so dashboard pages
+read summaries without re-scanning the inspection history.
+"""
+
+import heapq
+import itertools
+from collections import defaultdict
+
+from scoring import RISK_BAND_EDGES
+
+
+def _risk_band(score):
+    # Scalar twin of scoring.risk_bands: 0 = High, 1 = Moderate, 2 = Low
+    return sum(score >= edge for edge in RISK_BAND_EDGES)
+
+
+class Totals:
+    """
+    Additive aggregates for one group of inspections.
+    """
+
+    __slots__ = ("plots", "encroached", "unused", "underutilized_only", "violations",
+                 "encroached_area", "unused_area", "revenue_recovery", "revenue_loss",
+                 "risk_sum", "risk_count", "risk_bands")
+
+    def __init__(self):
+        self.plots = 0
+        self.encroached = 0
+        self.unused = 0
+        self.underutilized_only = 0
+        self.violations = 0
+        self.encroached_area = 0.0
+        self.unused_area = 0.0
+        self.revenue_recovery = 0.0
+        self.revenue_loss = 0.0
+        self.risk_sum = 0.0
+        self.risk_count = 0
+        self.risk_bands = [0, 0, 0]
+
+    def apply(self, record, sign):
+        enc = record.encroached_area or 0
+        unused = record.unused_area or 0
+        self.plots += sign
+        self.encroached += sign * (enc > 0)
+        self.unused += sign * (unused > 0)
+        self.underutilized_only += sign * (unused > 0 and enc == 0)
+        self.violations += sign * (enc > 0 or unused > 0)
+        self.encroached_area += sign * enc
+        self.unused_area += sign * unused
+        self.revenue_recovery += sign * (record.revenue_recovery or 0)
+        self.revenue_loss += sign * (record.revenue_loss or 0)
+        risk = record.risk_score
+        if risk is not None:
+            self.risk_sum += sign * risk
+            self.risk_count += sign
+            self.risk_bands[_risk_band(risk)] += sign
+
+    def as_dict(self):
+        compliant = self.plots - self.violations
+        return {
+            "plots": self.plots,
+            "encroached": self.encroached,
+            "unused": self.unused,
+            "underutilized_only": self.underutilized_only,
+            "violations": self.violations,
+            "compliant": compliant,
+            "compliance_rate": round(compliant / self.plots * 100, 2) if self.plots else 0,
+            "encroached_area": self.encroached_area,
+            "unused_area": self.unused_area,
+            "revenue_recovery": self.revenue_recovery,
+            "revenue_loss": self.revenue_loss,
+            "revenue_at_risk": self.revenue_recovery + self.revenue_loss,
+            "avg_risk": round(self.risk_sum / self.risk_count, 1) if self.risk_count else None,
+            # ordered High, Moderate, Low like scoring.risk_band_counts
+            "risk_bands": list(self.risk_bands),
+        }
+
+
+class InspectionRollups:
+    """
+    Totals overall, per district and per status, plus the highest-risk
+    (lowest score) plot tracked with a lazily pruned heap. Records are
+    removed by passing back the same object that was added.
+    """
+
+    def __init__(self, records=()):
+        self.total = Totals()
+        self.by_district = defaultdict(Totals)
+        self.by_status = defaultdict(Totals)
+        self.version = 0
+        self._seq = itertools.count()
+        self._live = {}
+        self._removed = set()
+        self._heap = []
+        self._snapshot = None
+        self.extend(records)
+
+    def _apply(self, record, sign):
+        self.total.apply(record, sign)
+        for groups, key in ((self.by_district, record.district or "Unassigned"),
+                            (self.by_status, record.status)):
+            groups[key].apply(record, sign)
+            if groups[key].plots == 0:
+                del groups[key]
+        self.version += 1
+        self._snapshot = None
+
+    def add(self, record):
+        seq = next(self._seq)
+        self._live[id(record)] = seq
+        if record.risk_score is not None:
+            heapq.heappush(self._heap, (record.risk_score, seq, record.plot_id))
+        self._apply(record, +1)
+
+    def extend(self, records):
+        for record in records:
+            self.add(record)
+
+    def remove(self, record):
+        seq = self._live.pop(id(record))
+        if record.risk_score is not None:
+            self._removed.add(seq)
+        self._apply(record, -1)
+
+    def highest_risk(self):
+        while self._heap and self._heap[0][1] in self._removed:
+            self._removed.discard(heapq.heappop(self._heap)[1])
+        if not self._heap:
+            return None
+        score, _, plot_id = self._heap[0]
+        return plot_id, score
+
+    def snapshot(self):
+        """
+        Plain-dict view of every rollup; cached until the next add/remove.
+        """
+        if self._snapshot is None:
+            self._snapshot = {
+                "version": self.version,
+                "total": self.total.as_dict(),
+                "by_district": {k: v.as_dict() for k, v in sorted(self.by_district.items())},
+                "by_status": {k: v.as_dict() for k, v in sorted(self.by_status.items())},
+                "highest_risk": self.highest_risk(),
+            }
+        return self._snapshot
@@ -0,0 +1,81 @@
+"""
+Vectorized Compliance Scoring
+Array primitives for legal severity, recommendations, plot status and risk
+bands, evaluated over whole columns in a single pass. Severity and
+recommendation tables are passed in by the policy engine (policy.py), which
+owns the rules.
+"""
+
+import numpy as np
+
+
+# ==============================
+# Lookup Tables
+# ==============================
+STATUS_LABELS = np.array(["Compliant", "Encroachment", "Underutilized"], dtype=object)
+
+# Risk bands used by the dashboards: 0 = High (<50), 1 = Moderate (50-79), 2 = Low (80+)
+RISK_BAND_EDGES = [50, 80]
+RISK_BAND_LABELS = ["High Risk (<50)", "Moderate (50-79)", "Low Risk (80+)"]
+
+
+# ==============================
+# Legal Severity & Recommendations
+# ==============================
+# The bands, risks and recommendations come from a policy (see policy.py).
+
+def classify_severity(built_percentage, edges, band_risk):
+    """
+    Returns (severity_codes, risk_scores) for an array of built-up
+    percentages. Code 0 is the default band (at or below edges[0]); code i
+    is above edges[i - 1]. band_risk holds the risk score of each code.
+    """
+    built = np.asarray(built_percentage, dtype=float)
+    codes = np.digitize(built, edges, right=True).astype(np.int8)
+    # NaN fails every band comparison and lands in the default band
+    codes[np.isnan(built)] = 0
+    return codes, band_risk[codes]
+
+
+def recommend(risk_scores, actions, urgencies):
+    """
+    Returns (actions, urgencies) for an array of legal risk scores, from
+    tables indexed by risk score.
+    """
+    risk = np.clip(np.asarray(risk_scores), 0, len(actions) - 1)
+    return actions.take(risk), urgencies.take(risk)
+
+
+# ==============================
+# Plot Status & Risk Bands
+# ==============================
+def status_codes(encroached_area, unused_percentage):
+    """
+    Status code per plot (index into STATUS_LABELS): Encroachment, then
+    Underutilized (> 20% unused), else Compliant.
+    """
+    enc = np.asarray(encroached_area, dtype=float)
+    unused = np.asarray(unused_percentage, dtype=float)
+    return np.select([enc > 0, unused > 20], [1, 2], default=0)
+
+
+def plot_status(encroached_area, unused_percentage):
+    """
+    Status label per plot (see status_codes).
+    """
+    return STATUS_LABELS[status_codes(encroached_area, unused_percentage)]
+
+
+def risk_bands(scores):
+    """
+    Band index per compliance score: 0 = High, 1 = Moderate, 2 = Low risk.
+    """
+    return np.digitize(np.asarray(scores, dtype=float), RISK_BAND_EDGES)
+
+
+def risk_band_counts(scores):
+    """
+    Plot counts per risk band, ordered High, Moderate, Low.
+    """
+    return np.bincount(risk_bands(scores), minlength=len(RISK_BAND_LABELS))
+
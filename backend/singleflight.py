@@ -0,0 +1,95 @@
+"""
+Request Coalescing
+In-flight deduplication of identical work: the first caller with a key runs
+the computation, and callers arriving with the same key while it runs wait
+on the same future and share its result (or exception). Nothing is cached
+after the computation finishes. Coalescing is per process, so it covers
+concurrent requests handled by the threads of one worker.
+"""
+
+import hashlib
+import threading
+import time
+from concurrent.futures import Future
+
+
+def request_key(*parts):
+    """
+    Canonical hash of a request's decoded parts (bytes, or values compared
+    by their repr). Parts are length-prefixed so no two sequences collide by
+    concatenation.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        data = part if isinstance(part, bytes) else repr(part).encode()
+        digest.update(len(data).to_bytes(8, "little"))
+        digest.update(data)
+    return digest.hexdigest()
+
+
+class _Call:
+    __slots__ = ("future", "followers")
+
+    def __init__(self):
+        self.future = Future()
+        self.followers = 0
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls with the same key into one execution.
+    """
+
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+        self._counts = {"calls": 0, "executed": 0, "coalesced": 0, "failed": 0, "cpu_seconds_avoided": 0.0}
+
+    def do(self, key, fn):
+        """
+        fn() for the first caller with `key`; concurrent callers with the
+        same key get that call's result.
+        """
+        with self._lock:
+            self._counts["calls"] += 1
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self._counts["executed"] += 1
+            else:
+                call.followers += 1
+                self._counts["coalesced"] += 1
+        if not leader:
+            return call.future.result()
+
+        start = time.thread_time()
+        try:
+            result = fn()
+        except BaseException as e:
+            self._finish(key, call, start, failed=True)
+            call.future.set_exception(e)
+            raise
+        self._finish(key, call, start)
+        call.future.set_result(result)
+        return result
+
+    def _finish(self, key, call, start, failed=False):
+        # Removed before the result is published, so later callers start afresh
+        with self._lock:
+            del self._calls[key]
+            if failed:
+                self._counts["failed"] += 1
+            else:
+                self._counts["cpu_seconds_avoided"] += (time.thread_time() - start) * call.followers
+
+    def stats(self):
+        """
+        Call counts and the CPU time followers were spared (the leader's
+        thread CPU time for each follower it served).
+        """
+        with self._lock:
+            counts = dict(self._counts, in_flight=len(self._calls))
+        counts["cpu_seconds_avoided"] = round(counts["cpu_seconds_avoided"], 3)
+        counts["coalesced_pct"] = round(counts["coalesced"] / counts["calls"] * 100, 1) if counts["calls"] else 0.0
+        return counts
@@ -0,0 +1,189 @@
+"""
+Inspection Store
+SQLite-backed log of every plot inspection, shared by the dashboard (writer)
+and the Flask API (exports). Geometries are stored as WKB blobs.
+"""
+
+import os
+import sqlite3
+from contextlib import closing
+from datetime import datetime
+from functools import lru_cache
+
+DB_PATH = os.environ.get("INSPECTION_DB", os.path.join(os.path.dirname(os.path.abspath(__file__)), "inspections.db"))
+
+GEOMETRY_COLUMNS = ["reference", "current", "encroachment", "unused"]
+
+# (store column, SQL type, display label); records.PlotRecord has an attribute per column
+METRIC_COLUMNS = [
+    ("plot_id", "TEXT", "Plot ID"),
+    ("ts", "INTEGER", "Timestamp"),
+    ("district", "TEXT", "District"),
+    ("status", "TEXT", "Status"),
+    ("encroached_area", "REAL", "Encroached Area"),
+    ("unused_area", "REAL", "Unused Area"),
+    ("unused_pct", "REAL", "Unused %"),
+    ("revenue_recovery", "REAL", "Revenue Recovery"),
+    ("revenue_loss", "REAL", "Revenue Loss"),
+    ("risk_score", "INTEGER", "Risk Score"),
+    ("lat", "REAL", "Lat"),
+    ("lon", "REAL", "Lon"),
+]
+
+COLUMNS = ["id"] + [c for c, _, _ in METRIC_COLUMNS] + [f"{g}_wkb" for g in GEOMETRY_COLUMNS]
+
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def day_bounds(start=None, end=None):
+    """
+    Epoch range for inclusive YYYY-MM-DD dates; either side may be open.
+    """
+    lo = int(datetime.strptime(start, "%Y-%m-%d").timestamp()) if start else None
+    hi = int(datetime.strptime(end, "%Y-%m-%d").timestamp()) + 86400 if end else None
+    return lo, hi
+
+
+def where_clause(district=None, status=None, start=None, end=None, after_id=None):
+    """
+    SQL filter and parameters for the export filters (district, status, date
+    range); `after_id` selects rows appended after a known id.
+    """
+    clauses, params = [], []
+    if after_id is not None:
+        clauses.append("id > ?")
+        params.append(after_id)
+    if district:
+        clauses.append("district = ?")
+        params.append(district)
+    if status:
+        clauses.append("status = ?")
+        params.append(status)
+    lo, hi = day_bounds(start, end)
+    if lo is not None:
+        clauses.append("ts >= ?")
+        params.append(lo)
+    if hi is not None:
+        clauses.append("ts < ?")
+        params.append(hi)
+    return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+
+def to_wkb(geojson):
+    if not geojson:
+        return None
+    from shapely.geometry import shape
+    return shape(geojson).wkb
+
+
+class InspectionStore:
+    """
+    Thin wrapper around one SQLite file. Connections are opened per call so
+    the store can be shared across Streamlit script threads and Flask workers.
+    """
+
+    def __init__(self, path=DB_PATH):
+        self.path = path
+        with closing(self._connect()) as conn, conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            cols = ", ".join(f"{c} {t}" for c, t, _ in METRIC_COLUMNS)
+            geoms = ", ".join(f"{g}_wkb BLOB" for g in GEOMETRY_COLUMNS)
+            conn.execute(f"CREATE TABLE IF NOT EXISTS inspections (id INTEGER PRIMARY KEY AUTOINCREMENT, {cols}, {geoms})")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_inspections_ts ON inspections (ts)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_inspections_district ON inspections (district)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_inspections_status ON inspections (status)")
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=30)
+
+    def _row(self, record, geometries=None):
+        geometries = geometries or {}
+        row = [getattr(record, column) for column, _, _ in METRIC_COLUMNS]
+        row.extend(to_wkb(geometries.get(g)) for g in GEOMETRY_COLUMNS)
+        return row
+
+    def append(self, record, geometries=None):
+        """
+        Persists one records.PlotRecord. `geometries` maps reference/current/
+        encroachment/unused to GeoJSON dicts; returns the new row id.
+        """
+        return self.append_many([record], [geometries])[0]
+
+    def append_many(self, records, geometries=None):
+        geometries = geometries or [None] * len(records)
+        names = COLUMNS[1:]
+        sql = f"INSERT INTO inspections ({', '.join(names)}) VALUES ({', '.join('?' * len(names))})"
+        ids = []
+        with closing(self._connect()) as conn, conn:
+            for record, geoms in zip(records, geometries):
+                ids.append(conn.execute(sql, self._row(record, geoms)).lastrowid)
+        return ids
+
+    def count(self, **filters):
+        where, params = where_clause(**filters)
+        with closing(self._connect()) as conn:
+            return conn.execute(f"SELECT COUNT(*) FROM inspections{where}", params).fetchone()[0]
+
+    def last_id(self):
+        """
+        Id of the newest row; rows are only ever appended, so this doubles as
+        a dataset version.
+        """
+        with closing(self._connect()) as conn:
+            return conn.execute("SELECT COALESCE(MAX(id), 0) FROM inspections").fetchone()[0]
+
+    def geometries(self, ids, column="reference"):
+        """
+        {row id: WKB} of one geometry column for the given rows, skipping
+        rows without that geometry.
+        """
+        if column not in GEOMETRY_COLUMNS:
+            raise ValueError(f"Unknown geometry column '{column}'")
+        ids = list(ids)
+        found = {}
+        with closing(self._connect()) as conn:
+            # Stay under SQLite's bound-parameter limit
+            for i in range(0, len(ids), 900):
+                chunk = ids[i:i + 900]
+                sql = f"SELECT id, {column}_wkb FROM inspections WHERE id IN ({', '.join('?' * len(chunk))}) AND {column}_wkb IS NOT NULL"
+                found.update(conn.execute(sql, chunk).fetchall())
+        return found
+
+    def monthly_rollups(self):
+        """
+        (month "YYYY-MM", district, inspections, violations, revenue at risk)
+        per calendar month and district, oldest month first.
+        """
+        sql = (
+            "SELECT strftime('%Y-%m', ts, 'unixepoch', 'localtime') AS month,"
+            " COALESCE(district, 'Unassigned') AS district, COUNT(*),"
+            " SUM(status IS NOT NULL AND status != 'Compliant'),"
+            " SUM(COALESCE(revenue_recovery, 0) + COALESCE(revenue_loss, 0))"
+            " FROM inspections WHERE ts IS NOT NULL GROUP BY month, district ORDER BY month, district"
+        )
+        with closing(self._connect()) as conn:
+            return conn.execute(sql).fetchall()
+
+    def iter_batches(self, columns=None, batch_size=50_000, **filters):
+        """
+        Streams rows (as tuples ordered like `columns`) in batches straight from
+        the cursor, so callers never hold the full table. Accepts the
+        where_clause filters.
+        """
+        columns = columns or COLUMNS
+        unknown = set(columns) - set(COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown columns: {sorted(unknown)}")
+        where, params = where_clause(**filters)
+        with closing(self._connect()) as conn:
+            cursor = conn.execute(f"SELECT {', '.join(columns)} FROM inspections{where} ORDER BY id", params)
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield rows
+
+
+@lru_cache(maxsize=None)
+def get_store(path=DB_PATH):
+    return InspectionStore(path)
@@ -0,0 +1,43 @@
+"""
+Dashboard Pages
+One module per page, each exposing `render()`. Page modules are imported on
+first visit, so a session only loads the code (and libraries) of the pages it
+opens; the sidebar is built from PAGES.
+"""
+
+import importlib
+from collections import namedtuple
+
+ADMIN = "Senior Officer (Admin)"
+INSPECTOR = "Field Inspector"
+ROLES = [ADMIN, INSPECTOR]
+
+# label: sidebar entry; module: views.<module>; needs_data: hidden until plots exist
+Page = namedtuple("Page", ["label", "module", "roles", "needs_data"])
+
+# Sidebar order
+PAGES = [
+    Page("🔍 Single Plot Comparison", "comparison", (ADMIN, INSPECTOR), False),
+    Page("📊 Overview Dashboard", "overview", (ADMIN,), True),
+    Page("🗺 Multi-Plot Monitoring", "monitoring", (ADMIN,), True),
+    Page("📋 Inspection History", "history", (ADMIN, INSPECTOR), True),
+    Page("🌐 3D Risk Map & Heatmap", "risk_map", (ADMIN,), True),
+    Page("📈 Analytics & Trends", "analytics", (ADMIN,), True),
+    Page("🏘 District-Wise Analytics", "district_analytics", (ADMIN,), True),
+    Page("🔮 Predictive Analytics", "predictive", (ADMIN,), True),
+    Page("💬 Data Query", "data_query", (ADMIN,), True),
+    Page("🛰 CSIDC Live GIS Portal", "gis_portal", (ADMIN, INSPECTOR), False),
+    Page("🏗 System Architecture", "architecture", (ADMIN,), False),
+]
+PAGES_BY_LABEL = {p.label: p for p in PAGES}
+
+
+def page_options(role, has_data):
+    """
+    Sidebar labels visible to `role`; data pages appear once plots exist.
+    """
+    return [p.label for p in PAGES if role in p.roles and (has_data or not p.needs_data)]
+
+
+def render(label):
+    importlib.import_module(f"views.{PAGES_BY_LABEL[label].module}").render()
@@ -0,0 +1,113 @@
+"""
+PAGE: Analytics & Trends
+Compliance breakdown, risk distribution, revenue impact and policy what-if.
+"""
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from charts import bin_values, render_chart
+from policy import get_engine, summarize
+from premium_features import render_premium_header
+from views.common import render_alert_panel, render_executive_summary, session_frame, session_rollups
+
+
+# Changing the policy selection reruns only the comparison table
+@st.fragment
+def policy_what_if(df):
+    engine = get_engine()
+    policy_names = st.multiselect("Compare policies", engine.names(), default=engine.names())
+    if policy_names:
+        results = engine.compare(
+            policy_names,
+            df["Built %"] if "Built %" in df.columns else np.nan,
+            df["Encroached Area"],
+            df["Unused %"],
+        )
+        what_if = []
+        for name, result in results.items():
+            summary = summarize(result)
+            what_if.append({
+                "Policy": name,
+                "Avg Score": summary["mean_score"],
+                "High Risk (<50)": summary["below_50"],
+                "Score Changes vs Current": int((result["compliance_score"] != df["Risk Score"].to_numpy()).sum()),
+            })
+        st.dataframe(pd.DataFrame(what_if), use_container_width=True, hide_index=True)
+
+
+def render():
+    render_premium_header("Violation Analytics & Trends", "Compliance breakdown, risk distribution, and revenue impact analysis")
+
+    # Feature 5: Alert Panel
+    render_alert_panel()
+
+    if len(st.session_state.plots_data) == 0:
+        st.info("No analytics available yet. Run comparisons or generate demo data to populate.")
+    else:
+        df = session_frame()
+        totals = session_rollups().snapshot()["total"]
+
+        c1, c2 = st.columns(2)
+
+        with c1:
+            enc_count = totals["encroached"]
+            unused_count = totals["underutilized_only"]
+            comp_count = totals["plots"] - enc_count - unused_count
+            st.image(render_chart("bar", {
+                "labels": ["Compliant", "Encroached", "Underutilized"],
+                "values": [comp_count, enc_count, unused_count],
+                "colors": ["#22c55e", "#ef4444", "#f59e0b"],
+                "title": "Compliance Breakdown",
+            }, figsize=(6, 4.5)), use_container_width=True)
+
+        with c2:
+            if "Risk Score" in df.columns:
+                counts, edges = bin_values(df["Risk Score"])
+                st.image(render_chart("histogram", {
+                    "counts": counts,
+                    "edges": edges,
+                    "color": "#6366f1",
+                    "title": "Risk Score Distribution",
+                    "xlabel": "Risk Score",
+                    "ylabel": "# Plots",
+                }, figsize=(6, 4.5)), use_container_width=True)
+
+        st.markdown("---")
+
+        # Revenue analysis
+        st.markdown("""
+        <p style="
+            color: #94a3b8;
+            font-size: 11px;
+            font-weight: 700;
+            letter-spacing: 1.5px;
+            text-transform: uppercase;
+            margin: 24px 0 16px 0;
+        ">💰 REVENUE IMPACT ANALYSIS</p>
+        """, unsafe_allow_html=True)
+        
+        rev_c1, rev_c2, rev_c3 = st.columns(3)
+        rev_c1.metric("Total Recovery (₹)", f"{totals['revenue_recovery']:,.2f}")
+        rev_c2.metric("Total Loss (₹)", f"{totals['revenue_loss']:,.2f}")
+        rev_c3.metric("Combined Risk (₹)", f"{totals['revenue_at_risk']:,.2f}")
+
+        # Policy what-if: re-score every plot under each selected policy side by side
+        st.markdown("---")
+        st.markdown("""
+        <p style="
+            color: #94a3b8;
+            font-size: 11px;
+            font-weight: 700;
+            letter-spacing: 1.5px;
+            text-transform: uppercase;
+            margin: 24px 0 16px 0;
+        ">⚖ POLICY WHAT-IF COMPARISON</p>
+        """, unsafe_allow_html=True)
+
+        policy_what_if(df)
+
+        # Feature 6: Executive Summary
+        st.markdown("---")
+        render_executive_summary()
@@ -0,0 +1,276 @@
+"""
+PAGE: System Architecture
+Platform component diagram, API endpoint reference and backend link health.
+"""
+
+import pandas as pd
+import streamlit as st
+
+from premium_features import render_premium_header
+from views.common import BACKEND_URL, backend_client
+
+
+def render():
+    render_premium_header("System Architecture", "Platform component diagram and API endpoint reference", live=False)
+
+    st.markdown("""
+    <p style="
+        color: #e2e8f0;
+        font-size: 15px;
+        line-height: 1.7;
+        margin: 0 0 32px 0;
+    ">
+    This platform is built on a modular, scalable architecture designed for
+    real-time compliance monitoring of industrial land parcels across Chhattisgarh.
+    </p>
+    """, unsafe_allow_html=True)
+
+    # Architecture components using columns
+    arch1, arch2 = st.columns(2)
+
+    with arch1:
+        st.markdown("""
+        <div style="
+            background: linear-gradient(135deg, #1a1f35 0%, #0f1420 100%);
+            border: 1px solid rgba(255, 255, 255, 0.06);
+            border-radius: 14px;
+            padding: 24px;
+            margin: 0 0 16px 0;
+            border-left: 4px solid #3b82f6;
+        ">
+            <h4 style="
+                color: #60a5fa;
+                margin: 0 0 16px 0;
+                font-size: 16px;
+                font-weight: 700;
+                letter-spacing: -0.2px;
+            ">🖥 Frontend — Streamlit</h4>
+            <ul style="color: #cbd5e1; font-size: 13px; line-height: 1.8; margin: 0; padding-left: 20px;">
+                <li>Interactive dashboards & real-time analytics</li>
+                <li>Role-based access control (Inspector/Admin)</li>
+                <li>PDF report generation & CSV export</li>
+                <li>Folium satellite map integration</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+
+        st.markdown("""
+        <div style="
+            background: linear-gradient(135deg, #1a1f35 0%, #0f1420 100%);
+            border: 1px solid rgba(255, 255, 255, 0.06);
+            border-radius: 14px;
+            padding: 24px;
+            margin: 0;
+            border-left: 4px solid #22c55e;
+        ">
+            <h4 style="
+                color: #4ade80;
+                margin: 0 0 16px 0;
+                font-size: 16px;
+                font-weight: 700;
+                letter-spacing: -0.2px;
+            ">🌍 GIS Engine — Shapely + PyProj</h4>
+            <ul style="color: #cbd5e1; font-size: 13px; line-height: 1.8; margin: 0; padding-left: 20px;">
+                <li>Polygon intersection & difference operations</li>
+                <li>UTM projection for accurate area calculation</li>
+                <li>Boundary comparison with tolerance thresholds</li>
+                <li>Auto-detect UTM zone from GeoJSON coordinates</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with arch2:
+        st.markdown("""
+        <div style="
+            background: linear-gradient(135deg, #1a1f35 0%, #0f1420 100%);
+            border: 1px solid rgba(255, 255, 255, 0.06);
+            border-radius: 14px;
+            padding: 24px;
+            margin: 0 0 16px 0;
+            border-left: 4px solid #f59e0b;
+        ">
+            <h4 style="
+                color: #fbbf24;
+                margin: 0 0 16px 0;
+                font-size: 16px;
+                font-weight: 700;
+                letter-spacing: -0.2px;
+            ">⚙ Backend — Flask REST API</h4>
+            <ul style="color: #cbd5e1; font-size: 13px; line-height: 1.8; margin: 0; padding-left: 20px;">
+                <li>RESTful endpoints for all GIS operations</li>
+                <li>Compliance scoring engine (0–100)</li>
+                <li>Legal risk classification & recommendation</li>
+                <li>Tolerance threshold filtering (25 m²)</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+
+        st.markdown("""
+        <div style="
+            background: linear-gradient(135deg, #1a1f35 0%, #0f1420 100%);
+            border: 1px solid rgba(255, 255, 255, 0.06);
+            border-radius: 14px;
+            padding: 24px;
+            margin: 0;
+            border-left: 4px solid #8b5cf6;
+        ">
+            <h4 style="
+                color: #a78bfa;
+                margin: 0 0 16px 0;
+                font-size: 16px;
+                font-weight: 700;
+                letter-spacing: -0.2px;
+            ">🛰 Satellite Visualization — Folium</h4>
+            <ul style="color: #cbd5e1; font-size: 13px; line-height: 1.8; margin: 0; padding-left: 20px;">
+                <li>ESRI World Imagery satellite tiles</li>
+                <li>Color-coded plot markers (Red/Yellow/Green)</li>
+                <li>Interactive popups with compliance details</li>
+                <li>Multi-plot overlay for state-wide monitoring</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+
+    st.markdown("---")
+
+    # Flow diagram using Streamlit layout
+    st.markdown("""
+    <p style="
+        color: #94a3b8;
+        font-size: 11px;
+        font-weight: 700;
+        letter-spacing: 1.5px;
+        text-transform: uppercase;
+        margin: 32px 0 20px 0;
+    ">📐 DATA FLOW DIAGRAM</p>
+    """, unsafe_allow_html=True)
+
+    st.markdown("""
+    <div style="
+        background: #0f1420;
+        border: 1px solid rgba(255, 255, 255, 0.06);
+        border-radius: 14px;
+        padding: 32px;
+        text-align: center;
+        font-family: monospace;
+    ">
+        <div style="display: flex; align-items: center; justify-content: center; gap: 12px; flex-wrap: wrap;">
+            <div style="
+                background: linear-gradient(135deg, #3b82f6 0%, #2563eb 100%);
+                padding: 14px 22px;
+                border-radius: 10px;
+                color: white;
+                font-weight: bold;
+                font-size: 13px;
+                box-shadow: 0 4px 12px rgba(59, 130, 246, 0.3);
+            ">📄 GeoJSON Input</div>
+            <span style="color: #475569; font-size: 28px; font-weight: bold;">→</span>
+            <div style="
+                background: linear-gradient(135deg, #f59e0b 0%, #d97706 100%);
+                padding: 14px 22px;
+                border-radius: 10px;
+                color: white;
+                font-weight: bold;
+                font-size: 13px;
+                box-shadow: 0 4px 12px rgba(245, 158, 11, 0.3);
+            ">⚙ Flask API</div>
+            <span style="color: #475569; font-size: 28px; font-weight: bold;">→</span>
+            <div style="
+                background: linear-gradient(135deg, #22c55e 0%, #16a34a 100%);
+                padding: 14px 22px;
+                border-radius: 10px;
+                color: white;
+                font-weight: bold;
+                font-size: 13px;
+                box-shadow: 0 4px 12px rgba(34, 197, 94, 0.3);
+            ">🌍 Shapely/PyProj</div>
+            <span style="color: #475569; font-size: 28px; font-weight: bold;">→</span>
+            <div style="
+                background: linear-gradient(135deg, #8b5cf6 0%, #7c3aed 100%);
+                padding: 14px 22px;
+                border-radius: 10px;
+                color: white;
+                font-weight: bold;
+                font-size: 13px;
+                box-shadow: 0 4px 12px rgba(139, 92, 246, 0.3);
+            ">📊 Compliance Score</div>
+            <span style="color: #475569; font-size: 28px; font-weight: bold;">→</span>
+            <div style="
+                background: linear-gradient(135deg, #ef4444 0%, #dc2626 100%);
+                padding: 14px 22px;
+                border-radius: 10px;
+                color: white;
+                font-weight: bold;
+                font-size: 13px;
+                box-shadow: 0 4px 12px rgba(239, 68, 68, 0.3);
+            ">🖥 Streamlit Dashboard</div>
+        </div>
+        <div style="
+            margin-top: 24px;
+            color: #64748b;
+            font-size: 12px;
+            line-height: 1.6;
+            font-family: 'Inter', sans-serif;
+        ">
+            GeoJSON → Boundary Comparison → Area Calculation → Risk Scoring → Visualization & Reporting
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+
+    st.markdown("---")
+
+    # API endpoints table
+    st.markdown("""
+    <p style="
+        color: #94a3b8;
+        font-size: 11px;
+        font-weight: 700;
+        letter-spacing: 1.5px;
+        text-transform: uppercase;
+        margin: 32px 0 20px 0;
+    ">🔌 API ENDPOINTS</p>
+    """, unsafe_allow_html=True)
+    
+    api_df = pd.DataFrame([
+        {"Endpoint": "/compare-boundaries", "Method": "POST", "Description": "Compare reference vs current boundary with tolerance (GeoJSON, WKB or FlatGeobuf body)"},
+        {"Endpoint": "/detect-builtup", "Method": "POST", "Description": "Detect built-up area within a boundary (GeoJSON, WKB or FlatGeobuf body)"},
+        {"Endpoint": "/detect-encroachment", "Method": "POST", "Description": "Overlaps with neighbouring plots, roads and government land in the registry"},
+        {"Endpoint": "/compliance-score", "Method": "POST", "Description": "Calculate 0–100 compliance risk score"},
+        {"Endpoint": "/analyze", "Method": "POST", "Description": "Built-up, encroachment and compliance score for a boundary in one call"},
+        {"Endpoint": "/registry/overlaps", "Method": "GET", "Description": "All overlapping registry parcels, optionally within one industrial area"},
+        {"Endpoint": "/registry/overlaps", "Method": "POST", "Description": "Sweep surveyed boundaries (GeoJSON, WKB or FlatGeobuf batch) for overlaps with each other and the registry"},
+        {"Endpoint": "/policies/what-if", "Method": "POST", "Description": "Score plots under several compliance policies side by side"},
+        {"Endpoint": "/export/inspections.csv", "Method": "GET", "Description": "Stream inspection history as CSV (district/status/date filters)"},
+        {"Endpoint": "/export/inspections.parquet", "Method": "GET", "Description": "Stream inspection history as GeoParquet (WKB, zstd)"},
+        {"Endpoint": "/export/inspections.arrow", "Method": "GET", "Description": "Stream inspection history as Arrow IPC (zstd)"},
+        {"Endpoint": "/tiles/heatmap/<z>/<x>/<y>.png", "Method": "GET", "Description": "Violation heatmap raster tile, cached per dataset version"},
+        {"Endpoint": "/stats", "Method": "GET", "Description": "Coalescing and admission-control counters of the worker"},
+    ])
+    st.dataframe(api_df, use_container_width=True, hide_index=True)
+
+    # Dashboard -> backend client
+    st.markdown("""
+    <p style="
+        color: #94a3b8;
+        font-size: 11px;
+        font-weight: 700;
+        letter-spacing: 1.5px;
+        text-transform: uppercase;
+        margin: 32px 0 20px 0;
+    ">📡 BACKEND LINK</p>
+    """, unsafe_allow_html=True)
+
+    stats = backend_client().stats()
+    link_c1, link_c2, link_c3, link_c4 = st.columns(4)
+    link_c1.metric("Requests", stats["requests"])
+    link_c2.metric("Retries", stats["retries"])
+    link_c3.metric("Failed / Rejected / Shed", f"{stats['errors']} / {stats['rejected']} / {stats['shed']}")
+    link_c4.metric("Circuit", stats["breaker"].title())
+    if stats["endpoints"]:
+        st.dataframe(pd.DataFrame([
+            {"Endpoint": path, "Calls": s["calls"], "p50 (ms)": s["p50_ms"], "p95 (ms)": s["p95_ms"], "Max (ms)": s["max_ms"]}
+            for path, s in stats["endpoints"].items()
+        ]), use_container_width=True, hide_index=True)
+    else:
+        st.caption(f"No backend calls yet from this server ({BACKEND_URL}).")
+    if stats["bytes_raw"] > stats["bytes_sent"]:
+        st.caption(f"Request compression: {stats['bytes_raw'] / 1024:,.0f} KB of JSON sent as {stats['bytes_sent'] / 1024:,.0f} KB")
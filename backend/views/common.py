@@ -0,0 +1,328 @@
+"""
+Shared Page Helpers
+Session rollups, inspection recording and the alert/summary panels used by
+several dashboard pages, plus cached computations keyed on the store's
+dataset version.
+"""
+
+import os
+import random
+from datetime import datetime
+
+import streamlit as st
+
+from store import get_store
+
+BACKEND_URL = os.environ.get("BACKEND_URL", "http://127.0.0.1:5000")
+# Address the user's browser uses for backend links (exports)
+PUBLIC_BACKEND_URL = os.environ.get("PUBLIC_BACKEND_URL", BACKEND_URL)
+
+
+@st.cache_resource(show_spinner=False)
+def backend_client():
+    """
+    The process-wide pooled client for BACKEND_URL, shared by every session.
+    """
+    from backend_client import BackendClient
+    return BackendClient(BACKEND_URL)
+
+
+def session_rollups():
+    """
+    The session's InspectionRollups, built on first use.
+    """
+    if "rollups" not in st.session_state:
+        from rollups import InspectionRollups
+        st.session_state.rollups = InspectionRollups(st.session_state.plots_data)
+    return st.session_state.rollups
+
+
+def record_inspections(records, geometries=None):
+    """
+    Appends new records.PlotRecord inspections to the session, the rollups
+    and the persistent store. Geometries (GeoJSON per record, see
+    InspectionStore.append) are only kept in the store.
+    """
+    from districts import assign_districts
+
+    assign_districts(records)
+    rollups = session_rollups()
+    st.session_state.plots_data.extend(records)
+    rollups.extend(records)
+    geometries = geometries or [None] * len(records)
+    for record, row_id, geoms in zip(records, get_store().append_many(records, geometries), geometries):
+        record.row_id = row_id
+        record.has_reference = bool(geoms and geoms.get("reference"))
+
+
+def session_frame():
+    """
+    The session's plots as a DataFrame, rebuilt only when the rollups change.
+    """
+    from records import records_frame
+
+    version = session_rollups().version
+    cached = st.session_state.get("plots_frame")
+    if cached is None or cached[0] != version:
+        cached = (version, records_frame(st.session_state.plots_data))
+        st.session_state.plots_frame = cached
+    return cached[1]
+
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def store_forecast(path, version, month, horizon=3):
+    """
+    District forecasts for the store at `path`, recomputed only when rows are
+    appended (`version`) or a month closes (`month`).
+    """
+    from forecasting import district_forecast
+
+    return district_forecast(get_store(path), horizon)
+
+
+# ==============================
+# Alert Panel (Feature 5) - Control Room Style
+# ==============================
+def render_alert_panel():
+    snap = session_rollups().snapshot()
+    totals = snap["total"]
+    if totals["plots"] == 0:
+        return
+
+    critical_violations = totals["encroached"]
+    total_revenue_risk = totals["revenue_at_risk"]
+    has_encroachment = critical_violations > 0
+
+    # Find highest risk plot
+    if snap["highest_risk"] is not None:
+        highest_risk_plot, highest_risk_score = snap["highest_risk"]
+    else:
+        highest_risk_plot = "N/A"
+        highest_risk_score = "N/A"
+
+    bg_gradient = "linear-gradient(135deg, rgba(239, 68, 68, 0.15) 0%, rgba(220, 38, 38, 0.1) 100%)" if has_encroachment else "linear-gradient(135deg, rgba(34, 197, 94, 0.15) 0%, rgba(22, 163, 74, 0.1) 100%)"
+    border_color = "#ef4444" if has_encroachment else "#22c55e"
+    icon = "🚨" if has_encroachment else "✅"
+
+    st.markdown(f"""
+    <div style="
+        background: {bg_gradient};
+        border: 2px solid {border_color};
+        border-radius: 14px;
+        padding: 24px 28px;
+        margin-bottom: 28px;
+        box-shadow: 0 4px 12px rgba(0, 0, 0, 0.4);
+    ">
+        <div style="display: flex; justify-content: space-between; align-items: center; flex-wrap: wrap; gap: 20px;">
+            <div>
+                <p style="
+                    color: {border_color};
+                    font-size: 11px;
+                    margin: 0 0 8px 0;
+                    font-weight: 700;
+                    letter-spacing: 1.5px;
+                    text-transform: uppercase;
+                ">{icon} REAL-TIME COMPLIANCE ALERTS</p>
+                <p style="
+                    color: #f1f5f9;
+                    font-size: 32px;
+                    font-weight: 800;
+                    margin: 0;
+                    font-family: 'JetBrains Mono', monospace;
+                    letter-spacing: -0.5px;
+                ">{critical_violations} <span style="font-size: 18px; color: #94a3b8; font-weight: 600;">Critical Violation{'s' if critical_violations != 1 else ''}</span></p>
+            </div>
+            <div style="text-align: center; padding: 0 20px;">
+                <p style="
+                    color: #94a3b8;
+                    font-size: 11px;
+                    margin: 0 0 6px 0;
+                    font-weight: 600;
+                    letter-spacing: 1.2px;
+                    text-transform: uppercase;
+                ">REVENUE AT RISK</p>
+                <p style="
+                    color: #fbbf24;
+                    font-size: 28px;
+                    font-weight: 700;
+                    margin: 0;
+                    font-family: 'JetBrains Mono', monospace;
+                ">₹{total_revenue_risk:,.2f}</p>
+            </div>
+            <div style="text-align: center;">
+                <p style="
+                    color: #94a3b8;
+                    font-size: 11px;
+                    margin: 0 0 6px 0;
+                    font-weight: 600;
+                    letter-spacing: 1.2px;
+                    text-transform: uppercase;
+                ">HIGHEST RISK PLOT</p>
+                <p style="
+                    color: #ef4444;
+                    font-size: 28px;
+                    font-weight: 700;
+                    margin: 0;
+                    font-family: 'JetBrains Mono', monospace;
+                ">{highest_risk_plot}</p>
+                <p style="
+                    color: #f87171;
+                    font-size: 14px;
+                    margin: 4px 0 0 0;
+                    font-weight: 600;
+                ">Risk Score: {highest_risk_score}</p>
+            </div>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+
+
+# ==============================
+# Executive Summary Generator (Feature 6) - Enhanced
+# ==============================
+def render_executive_summary():
+    totals = session_rollups().snapshot()["total"]
+    if totals["plots"] == 0:
+        return
+
+    total = totals["plots"]
+    enc_count = totals["encroached"]
+    unused_count = totals["unused"]
+    compliant_count = totals["compliant"]
+    compliance_rate = round(compliant_count / total * 100, 1) if total > 0 else 0
+    total_recovery = totals["revenue_recovery"]
+    total_loss = totals["revenue_loss"]
+    total_risk = total_recovery + total_loss
+
+    if compliance_rate >= 80:
+        overall_status = "Healthy"
+        status_icon = "🟢"
+        status_color = "#22c55e"
+    elif compliance_rate >= 50:
+        overall_status = "Moderate Concern"
+        status_icon = "🟡"
+        status_color = "#f59e0b"
+    else:
+        overall_status = "Critical"
+        status_icon = "🔴"
+        status_color = "#ef4444"
+
+    summary_text = (
+        f"Across **{total} monitored industrial plots**, the overall compliance status is "
+        f"**{status_icon} {overall_status}** with a compliance rate of **{compliance_rate}%**. "
+        f"**{enc_count} plot(s)** show boundary encroachment requiring immediate revenue recovery of "
+        f"**₹{total_recovery:,.2f}**, while **{unused_count} plot(s)** are underutilized, resulting in "
+        f"lease revenue loss of **₹{total_loss:,.2f}**. Total revenue at risk stands at "
+        f"**₹{total_risk:,.2f}**. "
+    )
+
+    if enc_count > 0:
+        summary_text += (
+            f"Immediate enforcement action is recommended for encroached plots to recover "
+            f"₹{total_recovery:,.2f} in penalties. "
+        )
+    if unused_count > 0:
+        summary_text += (
+            f"Underutilized plots should be reviewed for lease renegotiation or reallocation."
+        )
+
+    st.markdown(f"""
+    <div style="
+        background: linear-gradient(135deg, #1a1f35 0%, #0f1420 100%);
+        border: 1px solid rgba(139, 92, 246, 0.3);
+        border-radius: 14px;
+        padding: 24px 28px;
+        margin: 20px 0;
+        border-left: 4px solid #8b5cf6;
+        box-shadow: 0 4px 12px rgba(139, 92, 246, 0.1);
+    ">
+        <div style="display: flex; align-items: center; gap: 12px; margin-bottom: 16px;">
+            <div style="
+                background: linear-gradient(135deg, #8b5cf6 0%, #7c3aed 100%);
+                width: 40px;
+                height: 40px;
+                border-radius: 10px;
+                display: flex;
+                align-items: center;
+                justify-content: center;
+                font-size: 20px;
+            ">🤖</div>
+            <div>
+                <p style="
+                    color: #a78bfa;
+                    font-size: 11px;
+                    font-weight: 700;
+                    letter-spacing: 1.5px;
+                    margin: 0;
+                    text-transform: uppercase;
+                ">AI-POWERED EXECUTIVE SUMMARY</p>
+                <p style="
+                    color: #64748b;
+                    font-size: 12px;
+                    margin: 2px 0 0 0;
+                    font-weight: 500;
+                ">Generated at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
+            </div>
+        </div>
+        <div style="
+            color: #e2e8f0;
+            font-size: 14px;
+            line-height: 1.8;
+            font-weight: 500;
+        ">
+            {summary_text}
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+
+
+# ==============================
+# Demo Data Generator (Feature 4)
+# ==============================
+def generate_demo_plots(n=20):
+    from policy import get_engine
+    from records import PlotRecord
+    from scoring import status_codes
+
+    enc_areas, unused_areas, penalties, losses, unused_pcts = [], [], [], [], []
+    for i in range(n):
+        plot_type = random.choice(["compliant", "encroached", "underutilized"])
+        if plot_type == "compliant":
+            enc = 0
+            unused = 0
+        elif plot_type == "encroached":
+            enc = round(random.uniform(30, 500), 2)
+            unused = round(random.uniform(0, 50), 2)
+        else:
+            enc = 0
+            unused = round(random.uniform(100, 800), 2)
+
+        land_rate = random.choice([200, 300, 350, 500])
+        lease_rate = random.choice([30, 50, 80])
+
+        total_ref_area = round(random.uniform(2000, 10000), 2)
+        enc_areas.append(enc)
+        unused_areas.append(unused)
+        penalties.append(round(enc * land_rate, 2))
+        losses.append(round(unused * lease_rate, 2))
+        unused_pcts.append(round((unused / total_ref_area) * 100, 2) if total_ref_area > 0 else 0)
+
+    # Score and classify the whole batch in one pass
+    risk_scores = get_engine().get().compliance(enc_areas, unused_pcts)
+    statuses = status_codes(enc_areas, unused_pcts)
+
+    demo_plots = []
+    for i in range(n):
+        demo_plots.append(PlotRecord(
+            number=len(st.session_state.plots_data) + i + 1,
+            encroached_area=enc_areas[i],
+            unused_area=unused_areas[i],
+            unused_pct=unused_pcts[i],
+            revenue_recovery=penalties[i],
+            revenue_loss=losses[i],
+            risk_score=int(risk_scores[i]),
+            status_code=int(statuses[i]),
+            lat=round(21.25 + random.uniform(-0.05, 0.05), 6),
+            lon=round(81.63 + random.uniform(-0.05, 0.05), 6),
+        ))
+    return demo_plots
@@ -0,0 +1,409 @@
+"""
+PAGE: Single Plot Comparison
+Reference vs current boundary comparison for one plot, with PDF report. The
+reference, current-boundary and results sections are fragments, so editing
+one input reruns only that section rather than the whole dashboard.
+"""
+
+import io
+import json
+import random
+
+from shapely.geometry import shape
+import streamlit as st
+
+from premium_features import render_premium_header
+from registry import get_registry
+from views.common import backend_client, record_inspections
+
+
+# Image-to-GeoJSON conversion helper; cached on the image bytes and placement
+@st.cache_data(max_entries=32, show_spinner=False)
+def image_to_geojson(image_bytes, center_lat, center_lng, scale_factor):
+    """Convert an uploaded PNG/JPG image to GeoJSON polygon using OpenCV contour detection."""
+    import cv2
+    import numpy as np
+    file_bytes = np.frombuffer(image_bytes, dtype=np.uint8)
+    img = cv2.imdecode(file_bytes, cv2.IMREAD_COLOR)
+    if img is None:
+        return None
+
+    # Convert to grayscale and threshold
+    gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+    blurred = cv2.GaussianBlur(gray, (5, 5), 0)
+
+    # Adaptive threshold for better edge detection
+    _, thresh = cv2.threshold(blurred, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+
+    # Find contours
+    contours, _ = cv2.findContours(thresh, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+    if not contours:
+        return None
+
+    # Get the largest contour
+    largest = max(contours, key=cv2.contourArea)
+
+    # Simplify the contour
+    epsilon = 0.01 * cv2.arcLength(largest, True)
+    approx = cv2.approxPolyDP(largest, epsilon, True)
+
+    # Get image dimensions for normalization
+    h, w = img.shape[:2]
+
+    # Convert pixel coordinates to geographic coordinates
+    # Scale: 1 pixel = scale_factor degrees
+    coords = []
+    for point in approx:
+        px, py = point[0]
+        lng = center_lng + (px - w / 2) * scale_factor
+        lat = center_lat - (py - h / 2) * scale_factor
+        coords.append([round(lng, 6), round(lat, 6)])
+
+    # Close the polygon
+    if coords[0] != coords[-1]:
+        coords.append(coords[0])
+
+    geojson = {
+        "type": "Polygon",
+        "coordinates": [coords]
+    }
+    return geojson
+
+
+@st.cache_data(show_spinner=False)
+def reference_area_m2(plot_name):
+    from areas import areas_m2
+    return float(areas_m2([shape(get_registry().geojson(plot_name))])[0])
+
+
+@st.cache_resource(show_spinner=False)
+def reference_draw_map():
+    """
+    Satellite/street map with the polygon draw control, built once per process.
+    """
+    import folium
+    from folium.plugins import Draw
+
+    # Create folium map with satellite tiles and draw control
+    draw_map = folium.Map(location=[21.2514, 81.6296], zoom_start=13, tiles=None)
+    folium.TileLayer(
+        tiles="https://server.arcgisonline.com/ArcGIS/rest/services/World_Imagery/MapServer/tile/{z}/{y}/{x}",
+        attr="Esri Satellite",
+        name="Satellite"
+    ).add_to(draw_map)
+    folium.TileLayer(
+        tiles="https://{s}.tile.openstreetmap.org/{z}/{x}/{y}.png",
+        attr="OpenStreetMap",
+        name="Street Map"
+    ).add_to(draw_map)
+    folium.LayerControl().add_to(draw_map)
+
+    Draw(
+        draw_options={
+            "polyline": False,
+            "rectangle": True,
+            "polygon": True,
+            "circle": False,
+            "marker": False,
+            "circlemarker": False,
+        },
+        edit_options={"edit": True, "remove": True},
+    ).add_to(draw_map)
+    return draw_map
+
+
+@st.fragment
+def reference_section():
+    # ─── Section 1: Reference Boundary (from CSIDC records) ───
+    st.markdown("""
+    <div style="background:#1a1f35; border:1px solid rgba(59,130,246,0.2); border-left:4px solid #3b82f6; border-radius:12px; padding:16px; margin-bottom:16px;">
+        <p style="color:#3b82f6; font-size:13px; font-weight:700; margin:0 0 6px 0;">📋 STEP 1 — Reference Boundary (Government Records)</p>
+        <p style="color:#94a3b8; font-size:12px; margin:0;">Select from CSIDC registry, draw on map, or paste custom GeoJSON.</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    ref_method = st.radio("Choose reference source:", [
+        "📌 CSIDC Registry (Pre-loaded)",
+        "📍 Draw on Map",
+        "📝 Paste GeoJSON manually"
+    ], horizontal=True, key="ref_method")
+
+    reference_geojson = None
+
+    if ref_method == "📌 CSIDC Registry (Pre-loaded)":
+        selected_plot = st.selectbox("Select Allotted Plot", get_registry().plot_names())
+        reference_geojson = get_registry().geojson(selected_plot)
+        # Show area so user knows what size to match
+        try:
+            ref_area = reference_area_m2(selected_plot)
+            st.success(f"✅ Reference boundary loaded — {selected_plot} (≈ {ref_area:,.0f} m²)")
+        except Exception:
+            st.success(f"✅ Reference boundary loaded — {selected_plot}")
+        with st.expander("View Reference GeoJSON"):
+            st.json(reference_geojson)
+
+    elif ref_method == "📍 Draw on Map":
+        st.markdown("""
+        <div style="background:rgba(34,197,94,0.08); border:1px solid rgba(34,197,94,0.15); border-radius:10px; padding:12px; margin-bottom:12px;">
+            <p style="color:#22c55e; font-size:12px; margin:0;">🖊 Draw a polygon on the map below to define the reference boundary. Use the polygon tool on the left toolbar, click points to draw, and double-click to finish.</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+        from streamlit_folium import st_folium
+
+        map_data = st_folium(reference_draw_map(), width=None, height=450, key="ref_draw_map")
+
+        # Extract drawn geometry
+        if map_data and map_data.get("all_drawings"):
+            drawings = map_data["all_drawings"]
+            if len(drawings) > 0:
+                last_drawing = drawings[-1]
+                if last_drawing.get("geometry"):
+                    reference_geojson = last_drawing["geometry"]
+                    st.success(f"✅ Boundary drawn — {len(reference_geojson.get('coordinates', [[]])[0])} points captured")
+                    with st.expander("View Drawn GeoJSON"):
+                        st.json(reference_geojson)
+            else:
+                st.info("Draw a polygon on the map to define the reference boundary.")
+        else:
+            st.info("👆 Use the polygon/rectangle tool on the map to draw the reference boundary.")
+
+    elif ref_method == "📝 Paste GeoJSON manually":
+        reference_input = st.text_area("Paste Reference Boundary GeoJSON", height=120, key="ref_geo")
+        if reference_input:
+            try:
+                reference_geojson = json.loads(reference_input)
+            except json.JSONDecodeError:
+                st.error("❌ Invalid JSON format.")
+
+    st.session_state.reference_geojson = reference_geojson
+
+
+@st.fragment
+def current_section():
+    # ─── Section 2: Current Boundary (User Upload) ───
+    st.markdown("""
+    <div style="background:#1a1f35; border:1px solid rgba(249,115,22,0.2); border-left:4px solid #f97316; border-radius:12px; padding:16px; margin-bottom:16px;">
+        <p style="color:#f97316; font-size:13px; font-weight:700; margin:0 0 6px 0;">📤 STEP 2 — Current Boundary (Site Survey / Drone Image)</p>
+        <p style="color:#94a3b8; font-size:12px; margin:0;">Upload the actual on-ground boundary from a drone survey image or paste the surveyed GeoJSON.</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    current_geojson = None
+    cur_tab1, cur_tab2 = st.tabs(["📝 Paste GeoJSON", "🖼 Upload Drone / Satellite Image"])
+
+    with cur_tab1:
+        current_input = st.text_area("Current Boundary GeoJSON", height=150, key="cur_geo")
+        if current_input:
+            try:
+                current_geojson = json.loads(current_input)
+            except json.JSONDecodeError:
+                st.error("❌ Invalid JSON format.")
+
+    with cur_tab2:
+        st.markdown("""
+        <div style="background:rgba(249,115,22,0.08); border:1px solid rgba(249,115,22,0.15); border-radius:10px; padding:12px; margin-bottom:12px;">
+            <p style="color:#fb923c; font-size:12px; margin:0;">🔄 Upload a drone/satellite image → OpenCV auto-detects the plot boundary and converts to GeoJSON</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+        geo_col1, geo_col2, geo_col3 = st.columns(3)
+        with geo_col1:
+            center_lat = st.number_input("Center Latitude", value=21.2514, format="%.4f", key="img_lat")
+        with geo_col2:
+            center_lng = st.number_input("Center Longitude", value=81.6296, format="%.4f", key="img_lng")
+        with geo_col3:
+            scale = st.number_input("Scale (°/pixel)", value=0.000005, format="%.6f", key="img_scale",
+                                     help="Smaller = zoomed in. Default works for ~18 zoom level")
+
+        cur_image = st.file_uploader("📤 Upload Current Boundary Image", type=["png", "jpg", "jpeg"], key="cur_img")
+        if cur_image:
+            st.image(cur_image, caption="Uploaded Survey Image", use_container_width=True)
+            current_geojson = image_to_geojson(cur_image.getvalue(), center_lat, center_lng, scale)
+            if current_geojson:
+                st.success(f"✅ Extracted {len(current_geojson['coordinates'][0])} boundary points from image")
+                with st.expander("View Generated GeoJSON"):
+                    st.json(current_geojson)
+            else:
+                st.error("❌ Could not detect boundary. Try a clearer image with distinct edges.")
+
+    st.session_state.current_geojson = current_geojson
+
+
+@st.fragment
+def results_section():
+    reference_geojson = st.session_state.get("reference_geojson")
+    current_geojson = st.session_state.get("current_geojson")
+
+    col_a, col_b = st.columns(2)
+    with col_a:
+        land_rate = st.number_input("Land Rate (₹ per m²)", value=350, help="CSIDC typical: ₹200-500/m²")
+    with col_b:
+        lease_rate = st.number_input("Lease Rate (₹ per m²)", value=50, help="CSIDC typical: ₹30-80/m²")
+
+    if st.button("🚀 Run Comparison"):
+        from backend_client import BackendError, BackendUnavailable
+        from policy import get_engine
+        from premium_features import render_plotly_gauge
+        from records import PlotRecord
+        from reports import generate_pdf
+        from scoring import status_codes
+
+        if not reference_geojson or not current_geojson:
+            st.error("❌ Please provide both reference and current boundaries — either paste GeoJSON or upload images.")
+            return
+
+        reference_boundary = reference_geojson
+        current_boundary = current_geojson
+
+        try:
+            compare_data = backend_client().post_json("/compare-boundaries", {
+                "reference": reference_boundary,
+                "current": current_boundary,
+                "tolerance_m2": 25
+            })
+        except BackendUnavailable as e:
+            st.error(f"❌ Cannot reach backend ({e}). Make sure Flask is running: `python app.py`")
+            return
+        except BackendError as e:
+            st.error(f"❌ Backend error ({e.status}): {e}")
+            return
+
+        enc = compare_data["encroachment_area"]
+        unused = compare_data["unused_area"]
+        unused_pct = compare_data.get("unused_percentage", 0)
+        tolerance_applied = compare_data.get("tolerance_applied", False)
+        overlap_area = compare_data.get("overlap_area", 0)
+        ref_area_m2 = compare_data.get("total_reference_area", 1)
+
+        # Check if boundaries actually overlap
+        overlap_pct = round((overlap_area / ref_area_m2) * 100, 1) if ref_area_m2 > 0 else 0
+        if overlap_pct < 10:
+            st.warning(f"""⚠️ **Low Overlap Detected ({overlap_pct}%)**
+            
+The reference and current boundaries barely overlap. This usually means:
+- The current boundary was drawn at a **different location** from the reference plot
+- Or the boundaries are **very different in size**
+
+For accurate results, make sure both boundaries cover roughly the **same area**.""")
+
+        # Show boundary areas for transparency
+        area_c1, area_c2, area_c3 = st.columns(3)
+        area_c1.metric("Reference Area (m²)", f"{round(ref_area_m2, 1):,}")
+        area_c2.metric("Overlap Area (m²)", f"{round(overlap_area, 1):,}")
+        area_c3.metric("Overlap %", f"{overlap_pct}%")
+
+        penalty = enc * land_rate
+        loss = unused * lease_rate
+
+        # Feature 1: Tolerance Threshold Display
+        if tolerance_applied:
+            st.markdown("""
+            <div style="
+                background: linear-gradient(135deg, rgba(34, 197, 94, 0.15) 0%, rgba(22, 163, 74, 0.1) 100%);
+                border: 1px solid #22c55e;
+                border-left: 4px solid #22c55e;
+                border-radius: 12px;
+                padding: 16px 20px;
+                margin: 20px 0;
+            ">
+                <p style="
+                    color: #22c55e;
+                    font-size: 11px;
+                    font-weight: 700;
+                    letter-spacing: 1.2px;
+                    text-transform: uppercase;
+                    margin: 0 0 8px 0;
+                ">⚖ TOLERANCE APPLIED</p>
+                <p style="
+                    color: #e2e8f0;
+                    font-size: 14px;
+                    margin: 0;
+                    line-height: 1.6;
+                ">Tolerance (25 m²) applied — Minor deviations below 25 m² treated as zero. Plot classified as compliant within tolerance.</p>
+            </div>
+            """, unsafe_allow_html=True)
+
+        # Metrics
+        m1, m2 = st.columns(2)
+        m1.metric("Encroached Area (m²)", round(enc, 2))
+        m2.metric("Unused Area (m²)", round(unused, 2))
+
+        m3, m4 = st.columns(2)
+        m3.metric("Revenue Recovery (₹)", f"{round(penalty, 2):,}")
+        m4.metric("Revenue Loss (₹)", f"{round(loss, 2):,}")
+
+        # Feature 2: Risk Score Gauge (Plotly)
+        risk_score = int(get_engine().get().compliance([enc], [unused_pct])[0])
+        render_plotly_gauge(risk_score)
+
+
+
+        # Store the result centrally
+        # Compute centroid from reference boundary for map positioning
+        try:
+            ref_shape = shape(reference_geojson)
+            centroid = ref_shape.centroid
+            plot_lat = round(centroid.y, 6)
+            plot_lon = round(centroid.x, 6)
+        except Exception:
+            plot_lat = round(21.25 + random.uniform(-0.05, 0.05), 6)
+            plot_lon = round(81.63 + random.uniform(-0.05, 0.05), 6)
+
+        plot_record = PlotRecord(
+            number=len(st.session_state.plots_data) + 1,
+            encroached_area=enc,
+            unused_area=unused,
+            unused_pct=unused_pct,
+            revenue_recovery=penalty,
+            revenue_loss=loss,
+            risk_score=risk_score,
+            status_code=int(status_codes([enc], [unused_pct])[0]),
+            lat=plot_lat,
+            lon=plot_lon,
+        )
+        status = plot_record.status
+
+        record_inspections([plot_record], [{
+            "reference": reference_geojson,
+            "current": current_geojson,
+            "encroachment": compare_data.get("encroachment_geojson"),
+            "unused": compare_data.get("unused_geojson"),
+        }])
+
+        # Force map regeneration
+        if "multi_map" in st.session_state:
+            del st.session_state.multi_map
+
+        # PDF Report
+        report_data = {
+            "Plot ID": plot_record.plot_id,
+            "Encroached Area (m²)": round(enc, 2),
+            "Unused Area (m²)": round(unused, 2),
+            "Unused %": unused_pct,
+            "Risk Score": risk_score,
+            "Revenue Recovery (₹)": round(penalty, 2),
+            "Revenue Loss (₹)": round(loss, 2),
+            "Status": status,
+            "Tolerance Applied": "Yes" if tolerance_applied else "No",
+        }
+
+        pdf_file = io.BytesIO()
+        generate_pdf(report_data, pdf_file, shape(reference_geojson), shape(current_geojson))
+        pdf_file.seek(0)
+
+        st.download_button(
+            "📄 Download Compliance Report",
+            pdf_file,
+            "Compliance_Report.pdf",
+            "application/pdf"
+        )
+
+
+def render():
+    render_premium_header("Single Plot Compliance Comparison", "Compare reference vs current boundary — supports GeoJSON and image upload", live=False)
+
+    reference_section()
+    st.markdown("<div style='height:8px'></div>", unsafe_allow_html=True)
+    current_section()
+    results_section()
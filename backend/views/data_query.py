@@ -0,0 +1,18 @@
+"""
+PAGE: Data Query
+Saved and ad-hoc queries over the inspection store.
+"""
+
+import streamlit as st
+
+from premium_features import render_data_query, render_premium_header
+from query_engine import get_query_engine
+
+# Query edits and paging rerun only the query panel
+query_panel = st.fragment(render_data_query)
+
+
+def render():
+    render_premium_header("Intelligent Data Query", "Saved questions and ad-hoc queries over the full inspection history")
+
+    query_panel(get_query_engine())
@@ -0,0 +1,13 @@
+"""
+PAGE: District-Wise Analytics
+Per-district violation and revenue rollups.
+"""
+
+from premium_features import render_district_analytics, render_premium_header
+from views.common import session_rollups
+
+
+def render():
+    render_premium_header("District-Wise Compliance Analysis", "Comparative violation and revenue analytics across Chhattisgarh districts")
+
+    render_district_analytics(session_rollups().snapshot())
@@ -0,0 +1,126 @@
+"""
+PAGE: Inspection History
+Inspection log, store exports and bulk compliance notices.
+"""
+
+import importlib.util
+import os
+import tempfile
+from urllib.parse import urlencode
+
+import streamlit as st
+
+from districts import DISTRICTS
+from premium_features import render_premium_header
+from reports import generate_violation_notices
+from scoring import STATUS_LABELS
+from store import get_store
+from views.common import PUBLIC_BACKEND_URL, session_frame
+
+
+# Export — streamed by the backend straight from the inspection store
+@st.fragment
+def export_panel():
+    f_c1, f_c2, f_c3 = st.columns(3)
+    export_district = f_c1.selectbox("District", ["All"] + DISTRICTS, key="export_district")
+    export_status = f_c2.selectbox("Status", ["All"] + list(STATUS_LABELS), key="export_status")
+    export_dates = f_c3.date_input("Date range", value=(), key="export_dates")
+
+    export_params = {}
+    if export_district != "All":
+        export_params["district"] = export_district
+    if export_status != "All":
+        export_params["status"] = export_status
+    if len(export_dates) == 2:
+        export_params["start"] = export_dates[0].isoformat()
+        export_params["end"] = export_dates[1].isoformat()
+    export_query = ("?" + urlencode(export_params)) if export_params else ""
+
+    exp_c1, exp_c2, exp_c3 = st.columns(3)
+    exp_c1.link_button("📥 Export History as CSV", f"{PUBLIC_BACKEND_URL}/export/inspections.csv{export_query}")
+    exp_c2.link_button("🌐 Export GeoParquet", f"{PUBLIC_BACKEND_URL}/export/inspections.parquet{export_query}")
+    exp_c3.link_button("🏹 Export Arrow IPC", f"{PUBLIC_BACKEND_URL}/export/inspections.arrow{export_query}")
+
+    # Bulk notices for every violating plot matching the district/date filters
+    st.markdown("---")
+    notice_c1, notice_c2 = st.columns([1, 2])
+    # A merged PDF needs pypdf; without it only the zip bundle is offered
+    notice_formats = ["zip", "pdf"] if importlib.util.find_spec("pypdf") else ["zip"]
+    notice_fmt = notice_c1.radio("Notice bundle", notice_formats, horizontal=True,
+                                 format_func=lambda f: "ZIP of PDFs" if f == "zip" else "Single merged PDF")
+    if notice_c2.button("📑 Generate Notices for Violating Plots"):
+        # The bundle is read into memory for the download button, so nothing is left in /tmp
+        with tempfile.TemporaryDirectory(prefix="csidc_notices_") as notice_dir:
+            notice_path = os.path.join(notice_dir, f"csidc_notices.{notice_fmt}")
+            try:
+                with st.spinner("Rendering notices..."):
+                    notice_count = generate_violation_notices(
+                        get_store(), notice_path, fmt=notice_fmt,
+                        district=export_params.get("district"),
+                        start=export_params.get("start"), end=export_params.get("end"),
+                    )
+            except RuntimeError as e:
+                st.error(f"Notice generation failed: {e}")
+                return
+            if notice_count:
+                with open(notice_path, "rb") as notice_file:
+                    notice_bytes = notice_file.read()
+        if notice_count == 0:
+            st.info("No violating plots match the selected filters.")
+        else:
+            st.download_button(
+                f"📄 Download {notice_count} Notices",
+                notice_bytes,
+                f"csidc_notices.{notice_fmt}",
+                "application/zip" if notice_fmt == "zip" else "application/pdf"
+            )
+
+
+def render():
+    render_premium_header("Inspection History", "Complete log of all plot inspections with timestamps")
+
+    if len(st.session_state.plots_data) == 0:
+        st.info("No inspections recorded yet. Run a Single Plot Comparison or generate demo data.")
+    else:
+        df = session_frame()
+
+        # Display columns
+        display_cols = ["Plot ID", "Timestamp", "Encroached Area", "Unused Area", "Risk Score", "Status"]
+        available_cols = [c for c in display_cols if c in df.columns]
+
+        st.dataframe(
+            df[available_cols],
+            use_container_width=True,
+            hide_index=True,
+        )
+
+        st.markdown("---")
+        
+        st.markdown(f"""
+        <div style="
+            background: linear-gradient(135deg, #1a1f35 0%, #0f1420 100%);
+            border: 1px solid rgba(255, 255, 255, 0.06);
+            border-radius: 12px;
+            padding: 16px 24px;
+            margin: 20px 0;
+            display: inline-block;
+        ">
+            <p style="
+                color: #94a3b8;
+                font-size: 11px;
+                font-weight: 600;
+                letter-spacing: 1.2px;
+                text-transform: uppercase;
+                margin: 0 0 6px 0;
+            ">TOTAL INSPECTIONS</p>
+            <p style="
+                color: #3b82f6;
+                font-size: 28px;
+                font-weight: 700;
+                margin: 0;
+                font-family: 'JetBrains Mono', monospace;
+            ">{len(df)}</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+        export_panel()
@@ -0,0 +1,144 @@
+"""
+PAGE: Multi-Plot Monitoring
+Satellite map of every monitored plot.
+"""
+
+import random
+
+import folium
+import streamlit as st
+from streamlit_folium import st_folium
+
+from premium_features import render_premium_header
+from store import get_store
+from views.common import session_rollups
+
+
+def build_map(plots):
+    """
+    Folium satellite map with one boundary (or marker) per plot. Reference
+    boundaries are read from the inspection store.
+    """
+    import shapely
+
+    reference_wkb = get_store().geometries([p.row_id for p in plots if p.has_reference])
+
+    multi_map = folium.Map(location=[21.25, 81.63], zoom_start=12, tiles=None)
+    folium.TileLayer(
+        tiles="https://server.arcgisonline.com/ArcGIS/rest/services/World_Imagery/MapServer/tile/{z}/{y}/{x}",
+        attr="Esri Satellite", name="Satellite"
+    ).add_to(multi_map)
+
+    all_lats = []
+    all_lngs = []
+
+    for i, plot in enumerate(plots):
+        lat = plot.lat if plot.lat is not None else 21.25 + random.uniform(-0.03, 0.03)
+        lon = plot.lon if plot.lon is not None else 81.63 + random.uniform(-0.03, 0.03)
+
+        if plot.encroached_area > 0:
+            fill_color = "#ef4444"
+            border_color = "#ef4444"
+            status = "Encroachment"
+        elif plot.unused_area > 0:
+            fill_color = "#f59e0b"
+            border_color = "#f59e0b"
+            status = "Underutilized"
+        else:
+            fill_color = "#22c55e"
+            border_color = "#22c55e"
+            status = "Compliant"
+
+        risk_label = "N/A" if plot.risk_score is None else plot.risk_score
+        popup_html = f"<b>{plot.plot_id}</b><br>Status: {status}<br>Risk: {risk_label}/100<br>Enc: {plot.encroached_area} m²<br>Recovery: ₹{plot.revenue_recovery or 0:,.0f}"
+
+        # Draw polygon boundary if a reference geometry is stored
+        wkb = reference_wkb.get(plot.row_id)
+        if wkb:
+            ref_geo = shapely.from_wkb(wkb).__geo_interface__
+            folium.GeoJson(
+                {"type": "Feature", "geometry": ref_geo, "properties": {}},
+                style_function=lambda x, fc=fill_color, bc=border_color: {
+                    "fillColor": fc, "color": bc,
+                    "weight": 2.5, "fillOpacity": 0.35
+                },
+                tooltip=f"{plot.plot_id} — {status}",
+                popup=folium.Popup(popup_html, max_width=250)
+            ).add_to(multi_map)
+            coords = ref_geo.get("coordinates", [[]])
+            if coords and coords[0]:
+                for c in coords[0]:
+                    all_lats.append(c[1]); all_lngs.append(c[0])
+        else:
+            # Fallback: circle marker
+            folium.CircleMarker(
+                location=[lat, lon],
+                radius=10,
+                color=border_color,
+                fill=True,
+                fill_color=fill_color,
+                fill_opacity=0.6,
+                tooltip=f"{plot.plot_id} — {status}",
+                popup=folium.Popup(popup_html, max_width=250)
+            ).add_to(multi_map)
+            all_lats.append(lat); all_lngs.append(lon)
+
+    # Auto-zoom to fit all plots
+    if all_lats and all_lngs:
+        multi_map.fit_bounds([[min(all_lats), min(all_lngs)], [max(all_lats), max(all_lngs)]])
+    return multi_map
+
+
+def monitoring_map():
+    # Rebuilt only when plots are added; cleared with the session
+    version = session_rollups().version
+    cached = st.session_state.get("multi_map")
+    if cached is None or cached[0] != version:
+        cached = (version, build_map(st.session_state.plots_data))
+        st.session_state.multi_map = cached
+    # Pan/zoom is not read back, so moving the map does not rerun the script
+    st_folium(cached[1], width=None, height=600, key="multi_plot_map", returned_objects=[])
+
+
+def render():
+    render_premium_header("Multi-Plot Monitoring Map", "Satellite view of all monitored industrial plots")
+
+    if len(st.session_state.plots_data) == 0:
+        st.info("No plots available on the map. Run Single Plot Comparison first to add data.")
+    else:
+        monitoring_map()
+
+    # Legend - Styled
+    st.markdown("""
+    <div style="
+        background: linear-gradient(135deg, #1a1f35 0%, #0f1420 100%);
+        border: 1px solid rgba(255, 255, 255, 0.06);
+        border-radius: 12px;
+        padding: 16px 24px;
+        margin-top: 20px;
+        display: inline-block;
+    ">
+        <p style="
+            color: #94a3b8;
+            font-size: 11px;
+            font-weight: 600;
+            letter-spacing: 1.2px;
+            text-transform: uppercase;
+            margin: 0 0 12px 0;
+        ">MAP LEGEND</p>
+        <div style="display: flex; gap: 24px; align-items: center;">
+            <div style="display: flex; align-items: center; gap: 8px;">
+                <div style="width: 16px; height: 16px; background: #ef4444; border-radius: 50%;"></div>
+                <span style="color: #e2e8f0; font-size: 13px; font-weight: 500;">Encroachment</span>
+            </div>
+            <div style="display: flex; align-items: center; gap: 8px;">
+                <div style="width: 16px; height: 16px; background: #f59e0b; border-radius: 50%;"></div>
+                <span style="color: #e2e8f0; font-size: 13px; font-weight: 500;">Underutilized</span>
+            </div>
+            <div style="display: flex; align-items: center; gap: 8px;">
+                <div style="width: 16px; height: 16px; background: #22c55e; border-radius: 50%;"></div>
+                <span style="color: #e2e8f0; font-size: 13px; font-weight: 500;">Compliant</span>
+            </div>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
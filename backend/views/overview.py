@@ -0,0 +1,62 @@
+"""
+PAGE: Overview Dashboard
+State-level compliance metrics with status and risk-band charts.
+"""
+
+import streamlit as st
+
+from charts import render_chart
+from premium_features import render_premium_header
+from views.common import render_alert_panel, render_executive_summary, session_rollups
+
+
+def render():
+    render_premium_header("State-Level Compliance Overview", "Real-time monitoring of industrial plot compliance across Chhattisgarh")
+
+    # Feature 5: Alert Panel
+    render_alert_panel()
+
+    if len(st.session_state.plots_data) == 0:
+        st.info("No plots analyzed yet. Use **Generate Demo Dataset** or run a Single Plot Comparison to add data.")
+    else:
+        totals = session_rollups().snapshot()["total"]
+
+        total_plots = totals["plots"]
+        violations = totals["violations"]
+        compliant = totals["compliant"]
+        compliance_rate = totals["compliance_rate"]
+
+        total_leakage = totals["revenue_at_risk"]
+
+        col1, col2, col3, col4 = st.columns(4)
+        col1.metric("Plots Monitored", total_plots)
+        col2.metric("Violations Detected", violations)
+        col3.metric("Compliance Rate (%)", compliance_rate)
+        col4.metric("Total Revenue Leakage (₹)", f"{round(total_leakage,2):,}")
+
+        st.markdown("---")
+
+        # Charts
+        c1, c2 = st.columns(2)
+        with c1:
+            st.image(render_chart("bar", {
+                "labels": ["Encroachments", "Underutilized", "Compliant"],
+                "values": [totals["encroached"], totals["underutilized_only"], compliant],
+                "colors": ["#ef4444", "#f59e0b", "#22c55e"],
+                "title": "Plot Distribution",
+            }), use_container_width=True)
+
+        with c2:
+            if totals["avg_risk"] is not None:
+                # rollup risk bands are ordered High, Moderate, Low
+                st.image(render_chart("pie", {
+                    "labels": ["Low Risk (80+)", "Moderate (50-79)", "High Risk (<50)"],
+                    "values": totals["risk_bands"][::-1],
+                    "colors": ["#22c55e", "#f59e0b", "#ef4444"],
+                    "title": "Risk Score Distribution",
+                }), use_container_width=True)
+
+        st.markdown("---")
+
+        # Feature 6: Executive Summary
+        render_executive_summary()
@@ -0,0 +1,22 @@
+"""
+PAGE: Predictive Analytics
+Monthly history and per-district forecasts.
+"""
+
+from datetime import datetime
+
+import streamlit as st
+
+from premium_features import render_predictive_analytics, render_premium_header
+from store import get_store
+from views.common import store_forecast
+
+# Switching districts reruns only the forecast panel
+forecast_panel = st.fragment(render_predictive_analytics)
+
+
+def render():
+    render_premium_header("Predictive Compliance Analytics", "Monthly inspection history with per-district 3-month forecasts")
+
+    store = get_store()
+    forecast_panel(*store_forecast(store.path, store.last_id(), datetime.now().strftime("%Y-%m")))
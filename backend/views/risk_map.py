@@ -0,0 +1,38 @@
+"""
+PAGE: 3D Risk Map & Heatmap
+pydeck 3D risk columns and violation heatmap.
+"""
+
+import streamlit as st
+
+from deck_data import LayerData
+from heatmap_tiles import row_ranges
+from premium_features import render_3d_map, render_premium_header
+from views.common import PUBLIC_BACKEND_URL, session_rollups
+
+# Switching map views reruns only the map panel
+map_panel = st.fragment(render_3d_map)
+
+
+def session_layer_data():
+    """
+    The session's 3D map layer data, rebuilt only when plots are added.
+    """
+    version = session_rollups().version
+    cached = st.session_state.get("layer_data")
+    if cached is None or cached[0] != version:
+        cached = (version, LayerData(st.session_state.plots_data))
+        st.session_state.layer_data = cached
+    return cached[1]
+
+
+def render():
+    render_premium_header("3D Risk Visualization & Heatmap", "Satellite-grade 3D terrain with risk-scored columns and violation heatmap overlay")
+
+    # Heatmap tiles are rendered by the backend from this session's store
+    # rows, like the other layers; the scope grows with the session, so it
+    # also busts browser caches. A session too scattered through the store
+    # for one URL gets the client-side heatmap instead.
+    rows = row_ranges(p.row_id for p in st.session_state.plots_data)
+    tiles_url = f"{PUBLIC_BACKEND_URL}/tiles/heatmap/{{z}}/{{x}}/{{y}}.png?rows={rows}" if rows else None
+    map_panel(st.session_state.plots_data, heatmap_tiles_url=tiles_url, layer_data=session_layer_data())
@@ -7,30 +7,20 @@ import "leaflet-draw/dist/leaflet.draw.css";
 
 const sendToBackend = async (boundary, setEncroachment, setScore, setIntelligence) => {
   try {
-    const builtRes = await axios.post("http://localhost:5000/detect-builtup", {
+    const { data } = await axios.post("http://localhost:5000/analyze", {
       boundary
     });
 
-    const encRes = await axios.post("http://localhost:5000/detect-encroachment", {
-      boundary
-    });
-
-    const scoreRes = await axios.post("http://localhost:5000/compliance-score", {
-      total_area_m2: builtRes.data.total_area_m2,
-      built_up_area_m2: builtRes.data.built_up_area_m2,
-      encroachment: encRes.data.encroachment_detected
-    });
-
-    setEncroachment(encRes.data.encroachment_geojson);
-    setScore(scoreRes.data.compliance_score);
+    setEncroachment(data.encroachment_geojson);
+    setScore(data.compliance_score);
     setIntelligence({
-      severity: scoreRes.data.severity,
-      risk_score: scoreRes.data.risk_score,
-      action: scoreRes.data.recommended_action,
-      urgency: scoreRes.data.urgency,
-      built_percentage: scoreRes.data.built_percentage
+      severity: data.severity,
+      risk_score: data.risk_score,
+      action: data.recommended_action,
+      urgency: data.urgency,
+      built_percentage: data.built_percentage
     });
-    console.log(scoreRes.data);
+    console.log(data);
   } catch (error) {
     console.error("Backend error:", error);
   }